@@ -1,22 +1,35 @@
 """LLM API Server - A reusable Flask server for LLM backends with tool calling."""
 
-from importlib.metadata import version
-
-from .builtin_tools import (
-    BUILTIN_TOOLS,
-    calculate,
-    create_doc_search_tool,
-    create_web_search_tool,
-    get_current_datetime,
-)
-from .config import ServerConfig
-from .server import LLMServer
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .builtin_tools import (
+        BUILTIN_TOOLS,
+        calculate,
+        create_doc_search_tool,
+        create_web_search_tool,
+        get_current_datetime,
+    )
+    from .config import ServerConfig
+    from .server import LLMServer
+
+# Public names are imported on first access (PEP 562) so `import llm_tools_server` doesn't pull in
+# Flask and langchain_core until they are needed.
+_LAZY_IMPORTS = {
+    "BUILTIN_TOOLS": ".builtin_tools",
+    "calculate": ".builtin_tools",
+    "create_doc_search_tool": ".builtin_tools",
+    "create_web_search_tool": ".builtin_tools",
+    "get_current_datetime": ".builtin_tools",
+    "ServerConfig": ".config",
+    "LLMServer": ".server",
+}
 
 # Optional modules available but not imported by default to avoid dependency bloat:
 # - Eval module: from llm_tools_server.eval import Evaluator, TestCase, etc.
 # - RAG module: from llm_tools_server.rag import DocSearchIndex, RAGConfig
 
-__version__ = version("llm-tools-server")
 __all__ = [
     "BUILTIN_TOOLS",
     "LLMServer",
@@ -26,3 +39,22 @@ __all__ = [
     "create_web_search_tool",
     "get_current_datetime",
 ]
+
+
+def __getattr__(name: str):
+    if name == "__version__":
+        from importlib.metadata import version
+
+        value = version("llm-tools-server")
+        globals()[name] = value
+        return value
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value  # Cache so later lookups bypass __getattr__
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__) | {"__version__"})
@@ -1,10 +1,25 @@
 """Backend communication for Ollama and LM Studio."""
 
+import asyncio
+import contextlib
+import json
+import random
+import threading
 import time
-from collections.abc import Callable
+import weakref
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING, Any
 
 import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
 
 if TYPE_CHECKING:
     from langchain_core.tools import BaseTool
@@ -13,30 +28,185 @@ if TYPE_CHECKING:
 
 # Module-level session for connection pooling
 _session: requests.Session | None = None
+_session_lock = threading.Lock()
+
+# Keep-alive connections kept per backend host. Flask serves requests on multiple threads,
+# so the pool must be larger than urllib3's default of 10 to avoid discarding connections.
+_POOL_MAXSIZE = 50
 
 
 def _get_session() -> requests.Session:
     """Get or create a shared requests Session for connection pooling."""
     global _session
     if _session is None:
-        _session = requests.Session()
+        with _session_lock:
+            if _session is None:
+                session = requests.Session()
+                # Retries are handled by _retry_on_connection_error, not urllib3
+                adapter = HTTPAdapter(pool_connections=10, pool_maxsize=_POOL_MAXSIZE, max_retries=0)
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                _session = session
     return _session
 
 
+# JSON schemas keyed by args_schema class; generating them is expensive and they never change
+_schema_cache: "weakref.WeakKeyDictionary[Any, dict[str, Any]]" = weakref.WeakKeyDictionary()
+
+
 def get_tool_schema(tool) -> dict[str, Any]:
-    """Extract schema from LangChain tool (handles both pydantic v1 and v2)."""
-    if hasattr(tool.args_schema, "model_json_schema"):
-        return tool.args_schema.model_json_schema()
-    elif hasattr(tool.args_schema, "schema"):
-        return tool.args_schema.schema()
-    return {}
+    """Extract schema from LangChain tool (handles both pydantic v1 and v2).
+
+    Schemas are cached per args_schema class, so the pydantic schema is only
+    generated once per tool. The returned dict is shared and must not be mutated.
+    """
+    args_schema = tool.args_schema
+    try:
+        return _schema_cache[args_schema]
+    except (KeyError, TypeError):  # TypeError: not weak-referenceable (e.g. None or a dict)
+        pass
+
+    # Pick the generator once: pydantic v2 model_json_schema, then v1 schema, else no schema
+    generate = getattr(args_schema, "model_json_schema", None) or getattr(args_schema, "schema", None)
+    schema = generate() if generate is not None else {}
+
+    with contextlib.suppress(TypeError):
+        _schema_cache[args_schema] = schema
+    return schema
+
+
+# Module-level httpx client for HTTP/2 backend calls (BACKEND_HTTP2); False once httpx is found missing
+_http2_client: Any = None
+_http2_client_lock = threading.Lock()
+
+
+def _get_http2_client():
+    """Get or create the shared HTTP/2 httpx Client, or None if httpx[http2] isn't installed."""
+    global _http2_client
+    if _http2_client is None:
+        with _http2_client_lock:
+            if _http2_client is None:
+                try:
+                    import h2  # noqa: F401  (httpx needs it for http2=True)
+                    import httpx
+                except ImportError:
+                    print("BACKEND_HTTP2 requires httpx[http2] (pip install llm-tools-server[http2]); using requests")
+                    _http2_client = False
+                else:
+                    limits = httpx.Limits(max_keepalive_connections=20, max_connections=100)
+                    _http2_client = httpx.Client(http2=True, limits=limits)
+    return _http2_client or None
+
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+def _encode_json(payload: dict[str, Any]) -> bytes:
+    """Encode a request payload with orjson when installed, otherwise the stdlib json module."""
+    if HAS_ORJSON:
+        return orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(payload).encode("utf-8")
+
+
+@contextlib.contextmanager
+def _requests_errors_from_httpx():
+    """Re-raise httpx transport errors as the requests exceptions the server handles."""
+    import httpx
+
+    try:
+        yield
+    except httpx.TimeoutException as e:
+        raise requests.Timeout(str(e)) from e
+    except httpx.TransportError as e:
+        raise requests.ConnectionError(str(e)) from e
+
+
+class _Http2StreamResponse:
+    """Streaming httpx Response whose line/byte iterators raise requests' exception types.
+
+    A read timeout or dropped connection mid-stream surfaces while iterating, after
+    _post_json_http2 has returned. Other attributes are passed through to the httpx Response.
+    """
+
+    def __init__(self, response):
+        self._response = response
+
+    def __getattr__(self, name: str):
+        return getattr(self._response, name)
+
+    def iter_lines(self) -> Iterator[str]:
+        with _requests_errors_from_httpx():
+            yield from self._response.iter_lines()
+
+    def iter_bytes(self, chunk_size: int | None = None) -> Iterator[bytes]:
+        with _requests_errors_from_httpx():
+            yield from self._response.iter_bytes(chunk_size)
+
+    def read(self) -> bytes:
+        with _requests_errors_from_httpx():
+            return self._response.read()
+
+    def json(self, **kwargs) -> Any:
+        self.read()
+        return self._response.json(**kwargs)
+
+
+def _post_json_http2(client, endpoint: str, payload: dict[str, Any], stream: bool, timeout):
+    """POST a JSON payload with the httpx client, raising requests' exception types.
+
+    The server handles requests.Timeout / requests.ConnectionError / requests.HTTPError, so
+    httpx errors are translated, including those raised while a streamed body is read. The
+    returned response offers the same json(), iter_lines(), and raise_for_status() used by callers.
+    """
+    import httpx
+
+    connect_timeout, read_timeout = timeout
+    request = client.build_request(
+        "POST",
+        endpoint,
+        content=_encode_json(payload),
+        headers=_JSON_HEADERS,
+        timeout=httpx.Timeout(read_timeout, connect=connect_timeout),
+    )
+    with _requests_errors_from_httpx():
+        response = client.send(request, stream=stream)
+        if response.is_error:
+            try:
+                response.read()
+            finally:
+                response.close()
+            raise requests.HTTPError(
+                f"{response.status_code} Error: {response.reason_phrase} for url: {endpoint}", response=response
+            )
+    return _Http2StreamResponse(response) if stream else response
+
+
+def _post_json(endpoint: str, payload: dict[str, Any], stream: bool, timeout, http2: bool = False):
+    """POST a JSON payload on the pooled session, encoding it with orjson when installed.
+
+    With http2=True the request goes through the shared httpx HTTP/2 client instead (if
+    httpx[http2] is installed).
+    """
+    if http2:
+        client = _get_http2_client()
+        if client is not None:
+            return _post_json_http2(client, endpoint, payload, stream, timeout)
+    session = _get_session()
+    if HAS_ORJSON:
+        return session.post(endpoint, data=_encode_json(payload), headers=_JSON_HEADERS, stream=stream, timeout=timeout)
+    return session.post(endpoint, json=payload, stream=stream, timeout=timeout)
+
+
+# Maximum random jitter added to each retry delay, as a fraction of the delay
+_RETRY_JITTER = 0.2
 
 
 def _retry_on_connection_error(func: Callable, config, *args, **kwargs):
     """Retry a function on connection errors with exponential backoff.
 
     Only retries on connection errors (not on HTTP errors like 4xx/5xx).
-    Uses exponential backoff with configurable attempts and initial delay.
+    Uses exponential backoff with configurable attempts and initial delay,
+    plus up to 20% random jitter per delay.
 
     Args:
         func: Function to retry
@@ -60,7 +230,9 @@ def _retry_on_connection_error(func: Callable, config, *args, **kwargs):
             last_exception = e
             if attempt < max_attempts - 1:  # Don't sleep on last attempt
                 delay = initial_delay * (2**attempt)  # Exponential backoff: 1s, 2s, 4s
-                print(f"Backend connection failed (attempt {attempt + 1}/{max_attempts}), retrying in {delay}s...")
+                # Jitter spreads out retries from concurrent requests hitting a recovering backend
+                delay += random.uniform(0, _RETRY_JITTER * delay)
+                print(f"Backend connection failed (attempt {attempt + 1}/{max_attempts}), retrying in {delay:.2f}s...")
                 time.sleep(delay)
             else:
                 print(f"Backend connection failed after {max_attempts} attempts")
@@ -72,6 +244,156 @@ def _retry_on_connection_error(func: Callable, config, *args, **kwargs):
     raise last_exception
 
 
+# Assembled OpenAI tool definitions keyed by tool identities (and the names sent with full
+# schemas). Each entry also holds the tools themselves, which keeps them alive so their ids
+# can't be reused by other objects.
+_tools_cache: dict[tuple, tuple[tuple, list[dict[str, Any]]]] = {}
+_TOOLS_CACHE_MAX_ENTRIES = 32
+
+# Maximum description length in a tool summary
+_SUMMARY_DESCRIPTION_LENGTH = 200
+
+
+def _build_tool_def(tool) -> dict[str, Any]:
+    """Build the full OpenAI function definition for a tool, including its parameter schema."""
+    return {
+        "type": "function",
+        "function": {"name": tool.name, "description": tool.description, "parameters": get_tool_schema(tool)},
+    }
+
+
+def build_tool_summary(tool) -> dict[str, Any]:
+    """Build a compact OpenAI function definition without the parameter schema.
+
+    Only the name and the first line of the description (truncated to 200 characters)
+    are included. Summaries keep the model aware of a tool at a fraction of the prompt
+    tokens, but the model doesn't see the tool's arguments, so calls to a summarized
+    tool are less reliable. Expand the tool (see select_tools) when it is likely needed.
+    """
+    description = (tool.description or "").strip().split("\n", 1)[0]
+    return {
+        "type": "function",
+        "function": {"name": tool.name, "description": description[:_SUMMARY_DESCRIPTION_LENGTH]},
+    }
+
+
+def select_tools(messages: list[dict], tools: "list[BaseTool]") -> "list[BaseTool]":
+    """Pick the tools that are worth sending with their full schema.
+
+    A tool is selected when its name, or its name with underscores read as spaces
+    (e.g. "doc_search" -> "doc search"), appears in the last user message, or when
+    the conversation already contains a call to it.
+
+    Args:
+        messages: Chat messages for the request
+        tools: All tools available to the model
+
+    Returns:
+        Subset of tools, in their original order
+    """
+    user_text = ""
+    called: set[str] = set()
+    for message in messages:
+        role = message.get("role")
+        if role == "user" and isinstance(message.get("content"), str):
+            user_text = message["content"]
+        elif role == "assistant":
+            for tool_call in message.get("tool_calls") or ():
+                called.add(tool_call.get("function", {}).get("name", ""))
+    user_text = user_text.lower()
+
+    selected = []
+    for tool in tools:
+        name = tool.name.lower()
+        if tool.name in called or name in user_text or name.replace("_", " ") in user_text:
+            selected.append(tool)
+    return selected
+
+
+def _tools_key(tools: "list[BaseTool]", full_schema_tools: "list[BaseTool] | None") -> tuple:
+    """Cache key for a tool list: the tools' identities and the names sent with full schemas."""
+    full_names = None if full_schema_tools is None else frozenset(tool.name for tool in full_schema_tools)
+    return (tuple(id(tool) for tool in tools), full_names)
+
+
+def _get_openai_tools(
+    tools: "list[BaseTool]", full_schema_tools: "list[BaseTool] | None" = None
+) -> list[dict[str, Any]]:
+    """Convert tools to OpenAI function definitions, reusing the list built for the same tools.
+
+    When full_schema_tools is given, only those tools get their full definition; the
+    others are sent as summaries (see build_tool_summary). The returned list is shared
+    between requests and must not be mutated.
+    """
+    key = _tools_key(tools, full_schema_tools)
+    cached = _tools_cache.get(key)
+    if cached is not None:
+        return cached[1]
+
+    full_names = key[1]
+    openai_tools = [
+        _build_tool_def(tool) if full_names is None or tool.name in full_names else build_tool_summary(tool)
+        for tool in tools
+    ]
+
+    if len(_tools_cache) >= _TOOLS_CACHE_MAX_ENTRIES:
+        _tools_cache.clear()
+    _tools_cache[key] = (tuple(tools), openai_tools)
+    return openai_tools
+
+
+# Payloads without messages, keyed by everything else that goes into them (tools keyed like
+# _tools_cache). Each entry also holds the tools, so their ids can't be reused while cached.
+_payload_templates: dict[tuple, tuple[tuple, dict[str, Any]]] = {}
+_PAYLOAD_TEMPLATES_MAX_ENTRIES = 64
+
+
+def _build_payload(
+    messages: list[dict],
+    tools: "list[BaseTool]",
+    config: "ServerConfig",
+    temperature: float,
+    stream: bool,
+    tool_choice: str | None,
+    full_schema_tools: "list[BaseTool] | None" = None,
+) -> dict[str, Any]:
+    """Build the OpenAI-compatible chat completion payload shared by both backends.
+
+    Everything except the messages is cached as a template, so a request only copies
+    the template and fills in its messages.
+    """
+    key = (config.BACKEND_MODEL, temperature, stream, tool_choice, _tools_key(tools, full_schema_tools))
+    cached = _payload_templates.get(key)
+    if cached is not None:
+        template = cached[1]
+    else:
+        openai_tools = _get_openai_tools(tools, full_schema_tools)
+        template = {
+            "model": config.BACKEND_MODEL,
+            "messages": None,
+            "temperature": temperature,
+            "stream": stream,
+        }
+
+        # Handle tools and tool_choice
+        if tool_choice == "none":
+            # Explicitly send tool_choice="none" to prevent tool calls (e.g., for final response generation)
+            template["tool_choice"] = "none"
+        elif openai_tools:
+            # Include tools and optionally tool_choice when tools are available
+            template["tools"] = openai_tools
+            if tool_choice:
+                template["tool_choice"] = tool_choice
+
+        if len(_payload_templates) >= _PAYLOAD_TEMPLATES_MAX_ENTRIES:
+            _payload_templates.clear()
+        _payload_templates[key] = (tuple(tools), template)
+
+    payload = template.copy()
+    payload["messages"] = messages
+    return payload
+
+
 def call_ollama(
     messages: list[dict],
     tools: "list[BaseTool]",
@@ -79,6 +401,7 @@ def call_ollama(
     temperature: float = 0.0,
     stream: bool = False,
     tool_choice: str | None = None,
+    full_schema_tools: "list[BaseTool] | None" = None,
 ):
     """Call Ollama via OpenAI-compatible endpoint with tool support.
 
@@ -89,35 +412,12 @@ def call_ollama(
         temperature: Sampling temperature
         stream: Whether to stream the response
         tool_choice: Tool calling mode - "required", "auto", or "none"
+        full_schema_tools: If given, only these tools are sent with their full schema and
+            the rest as summaries (see build_tool_summary); by default all schemas are sent
     """
     endpoint = f"{config.OLLAMA_ENDPOINT}/v1/chat/completions"
 
-    # Convert tools to OpenAI format
-    openai_tools = []
-    for tool in tools:
-        schema = get_tool_schema(tool)
-        tool_def = {
-            "type": "function",
-            "function": {"name": tool.name, "description": tool.description, "parameters": schema},
-        }
-        openai_tools.append(tool_def)
-
-    payload = {
-        "model": config.BACKEND_MODEL,
-        "messages": messages,
-        "temperature": temperature,
-        "stream": stream,
-    }
-
-    # Handle tools and tool_choice
-    if tool_choice == "none":
-        # Explicitly send tool_choice="none" to prevent tool calls (e.g., for final response generation)
-        payload["tool_choice"] = "none"
-    elif openai_tools:
-        # Include tools and optionally tool_choice when tools are available
-        payload["tools"] = openai_tools
-        if tool_choice:
-            payload["tool_choice"] = tool_choice
+    payload = _build_payload(messages, tools, config, temperature, stream, tool_choice, full_schema_tools)
 
     # Set timeout as tuple (connect_timeout, read_timeout)
     timeout = (config.BACKEND_CONNECT_TIMEOUT, config.BACKEND_READ_TIMEOUT)
@@ -128,8 +428,7 @@ def call_ollama(
 
     # Wrap the request in retry logic (uses session for connection pooling)
     def _make_request():
-        session = _get_session()
-        response = session.post(endpoint, json=payload, stream=stream, timeout=timeout)
+        response = _post_json(endpoint, payload, stream, timeout, config.BACKEND_HTTP2)
         response.raise_for_status()
         return response
 
@@ -143,6 +442,7 @@ def call_lmstudio(
     temperature: float = 0.0,
     stream: bool = False,
     tool_choice: str | None = None,
+    full_schema_tools: "list[BaseTool] | None" = None,
 ):
     """Call LM Studio with tool support.
 
@@ -153,35 +453,12 @@ def call_lmstudio(
         temperature: Sampling temperature
         stream: Whether to stream the response
         tool_choice: Tool calling mode - "required", "auto", or "none"
+        full_schema_tools: If given, only these tools are sent with their full schema and
+            the rest as summaries (see build_tool_summary); by default all schemas are sent
     """
     endpoint = f"{config.LMSTUDIO_ENDPOINT}/chat/completions"
 
-    # Convert tools to OpenAI format
-    openai_tools = []
-    for tool in tools:
-        schema = get_tool_schema(tool)
-        tool_def = {
-            "type": "function",
-            "function": {"name": tool.name, "description": tool.description, "parameters": schema},
-        }
-        openai_tools.append(tool_def)
-
-    payload = {
-        "model": config.BACKEND_MODEL,
-        "messages": messages,
-        "temperature": temperature,
-        "stream": stream,
-    }
-
-    # Handle tools and tool_choice
-    if tool_choice == "none":
-        # Explicitly send tool_choice="none" to prevent tool calls (e.g., for final response generation)
-        payload["tool_choice"] = "none"
-    elif openai_tools:
-        # Include tools and optionally tool_choice when tools are available
-        payload["tools"] = openai_tools
-        if tool_choice:
-            payload["tool_choice"] = tool_choice
+    payload = _build_payload(messages, tools, config, temperature, stream, tool_choice, full_schema_tools)
 
     # Set timeout as tuple (connect_timeout, read_timeout)
     timeout = (config.BACKEND_CONNECT_TIMEOUT, config.BACKEND_READ_TIMEOUT)
@@ -192,14 +469,86 @@ def call_lmstudio(
 
     # Wrap the request in retry logic (uses session for connection pooling)
     def _make_request():
-        session = _get_session()
-        response = session.post(endpoint, json=payload, stream=stream, timeout=timeout)
+        response = _post_json(endpoint, payload, stream, timeout, config.BACKEND_HTTP2)
         response.raise_for_status()
         return response
 
     return _retry_on_connection_error(_make_request, config)
 
 
+def iter_backend_chunks(response: requests.Response) -> Iterator[dict[str, Any]]:
+    """Parse a streaming backend response into JSON chunks as lines arrive.
+
+    Handles both OpenAI-style SSE (``data: {...}`` lines, ending with ``data: [DONE]``)
+    and newline-delimited JSON. Other SSE lines (comments, event names) are skipped.
+    Chunks are decoded with orjson when installed.
+
+    Args:
+        response: Streaming response returned by call_ollama/call_lmstudio with stream=True
+
+    Yields:
+        Parsed JSON chunk dicts
+    """
+    loads = orjson.loads if HAS_ORJSON else json.loads
+    for line in response.iter_lines():
+        if not line:
+            continue
+        if isinstance(line, str):
+            line = line.encode("utf-8")
+        if line.startswith(b"data:"):
+            data = line[5:].strip()
+            if data == b"[DONE]":
+                return
+            yield loads(data)
+        elif line.startswith(b"{"):
+            yield loads(line)
+
+
+async def acall_ollama(
+    messages: list[dict],
+    tools: "list[BaseTool]",
+    config: "ServerConfig",
+    temperature: float = 0.0,
+    stream: bool = False,
+    tool_choice: str | None = None,
+    full_schema_tools: "list[BaseTool] | None" = None,
+):
+    """Async variant of call_ollama for running several backend requests concurrently.
+
+    The blocking request runs in a worker thread and reuses the pooled session, so
+    independent calls can be overlapped with asyncio.gather().
+    """
+    return await asyncio.to_thread(
+        call_ollama, messages, tools, config, temperature, stream, tool_choice, full_schema_tools
+    )
+
+
+async def acall_lmstudio(
+    messages: list[dict],
+    tools: "list[BaseTool]",
+    config: "ServerConfig",
+    temperature: float = 0.0,
+    stream: bool = False,
+    tool_choice: str | None = None,
+    full_schema_tools: "list[BaseTool] | None" = None,
+):
+    """Async variant of call_lmstudio for running several backend requests concurrently.
+
+    The blocking request runs in a worker thread and reuses the pooled session, so
+    independent calls can be overlapped with asyncio.gather().
+    """
+    return await asyncio.to_thread(
+        call_lmstudio, messages, tools, config, temperature, stream, tool_choice, full_schema_tools
+    )
+
+
+def _response_json(response: requests.Response) -> Any:
+    """Decode a JSON response body, with orjson when installed."""
+    if HAS_ORJSON:
+        return orjson.loads(response.content)
+    return response.json()
+
+
 def check_ollama_health(config: "ServerConfig", timeout: int = 5) -> tuple[bool, str]:
     """Check if Ollama backend is healthy and reachable.
 
@@ -216,15 +565,15 @@ def check_ollama_health(config: "ServerConfig", timeout: int = 5) -> tuple[bool,
         response = session.get(endpoint, timeout=timeout)
         response.raise_for_status()
 
-        # Check if the configured model is available
-        data = response.json()
-        models = data.get("models", [])
-        model_names = [model.get("name", "") for model in models]
+        # Check if the configured model is available (stops at the first match)
+        data = _response_json(response)
+        models = data.get("models", ())
+        target = config.BACKEND_MODEL
 
-        if config.BACKEND_MODEL in model_names:
+        if any(model.get("name") == target for model in models):
             return True, f"Ollama is healthy. Model '{config.BACKEND_MODEL}' is available."
         else:
-            available = ", ".join(model_names) if model_names else "none"
+            available = ", ".join(model.get("name", "") for model in models) or "none"
             return (
                 False,
                 f"Ollama is reachable but model '{config.BACKEND_MODEL}' not found. Available models: {available}",
@@ -255,12 +604,12 @@ def check_lmstudio_health(config: "ServerConfig", timeout: int = 5) -> tuple[boo
         response.raise_for_status()
 
         # LM Studio returns model list if healthy
-        data = response.json()
-        models = data.get("data", [])
+        data = _response_json(response)
+        models = data.get("data", ())
 
         if models:
-            model_ids = [model.get("id", "") for model in models]
-            return True, f"LM Studio is healthy. {len(models)} model(s) loaded: {', '.join(model_ids)}"
+            model_ids = ", ".join(model.get("id", "") for model in models)
+            return True, f"LM Studio is healthy. {len(models)} model(s) loaded: {model_ids}"
         else:
             return False, "LM Studio is reachable but no models are loaded. Please load a model in LM Studio."
 
@@ -270,3 +619,123 @@ def check_lmstudio_health(config: "ServerConfig", timeout: int = 5) -> tuple[boo
         return False, f"Cannot connect to LM Studio at {config.LMSTUDIO_ENDPOINT}. Is it running?"
     except Exception as e:
         return False, f"LM Studio health check failed: {e!s}"
+
+
+def check_all_backends(config: "ServerConfig", timeout: int = 5) -> dict[str, tuple[bool, str]]:
+    """Check Ollama and LM Studio health concurrently.
+
+    Both probes run at the same time, so checking both backends takes at most
+    one timeout instead of two.
+
+    Args:
+        config: ServerConfig instance
+        timeout: Request timeout in seconds for each probe
+
+    Returns:
+        Dict mapping backend name ("ollama", "lmstudio") to (is_healthy, message)
+    """
+    checks = {"ollama": check_ollama_health, "lmstudio": check_lmstudio_health}
+    with ThreadPoolExecutor(max_workers=len(checks), thread_name_prefix="health-check") as executor:
+        futures = {name: executor.submit(check, config, timeout) for name, check in checks.items()}
+        return {name: future.result() for name, future in futures.items()}
+
+
+class HealthPoller:
+    """Poll backend health in a background thread with an adaptive interval.
+
+    While the backend is healthy it is probed every ``min_interval`` seconds. After
+    repeated failures the interval doubles (with up to 20% jitter) until it reaches
+    ``max_interval``, so an unreachable backend isn't hammered. The first failure
+    after a healthy probe keeps the short interval so outages are confirmed quickly.
+    Probes go through the shared pooled session.
+
+    Example:
+        poller = HealthPoller(config, min_interval=10, max_interval=300)
+        poller.start()
+        ...
+        if not poller.is_healthy:
+            print(poller.message)
+        poller.stop()
+    """
+
+    def __init__(
+        self,
+        config: "ServerConfig",
+        check: Callable[["ServerConfig", int], tuple[bool, str]] | None = None,
+        min_interval: float = 10.0,
+        max_interval: float = 300.0,
+        timeout: int | None = None,
+    ):
+        """Initialize the poller.
+
+        Args:
+            config: ServerConfig instance
+            check: Health check function; defaults to the one for config.BACKEND_TYPE
+            min_interval: Seconds between probes while healthy (and after a state change)
+            max_interval: Upper bound for the backed-off interval while unhealthy
+            timeout: Request timeout per probe; defaults to config.HEALTH_CHECK_TIMEOUT
+        """
+        if check is None:
+            check = check_ollama_health if config.BACKEND_TYPE == "ollama" else check_lmstudio_health
+        self.config = config
+        self.check = check
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.timeout = timeout if timeout is not None else config.HEALTH_CHECK_TIMEOUT
+
+        self.interval = min_interval
+        self.consecutive_failures = 0
+        self.is_healthy: bool | None = None  # None until the first probe completes
+        self.message = ""
+
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def poll_once(self) -> bool:
+        """Run one probe and update the state and next interval.
+
+        Returns:
+            True if the backend is healthy
+        """
+        try:
+            is_healthy, message = self.check(self.config, self.timeout)
+        except Exception as e:
+            # The built-in checks report errors as (False, message); this guards custom checks
+            is_healthy, message = False, f"Health check failed: {e!s}"
+        was_healthy = self.is_healthy
+        self.is_healthy = is_healthy
+        self.message = message
+
+        if is_healthy:
+            self.consecutive_failures = 0
+            self.interval = self.min_interval
+        else:
+            self.consecutive_failures += 1
+            if was_healthy or self.consecutive_failures == 1:
+                # State change: re-probe soon rather than backing off straight away
+                self.interval = self.min_interval
+            else:
+                interval = min(self.max_interval, self.interval * 2)
+                self.interval = min(self.max_interval, interval + random.uniform(0, _RETRY_JITTER * interval))
+        return is_healthy
+
+    def start(self):
+        """Start polling in a daemon thread (no-op if already running)."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="backend-health-poller", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float | None = None):
+        """Stop polling; returns as soon as the current probe (if any) finishes."""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _run(self):
+        while not self._stop_event.is_set():
+            self.poll_once()
+            # Event.wait returns early on stop(), so shutdown doesn't wait out the interval
+            self._stop_event.wait(self.interval)
@@ -5,8 +5,11 @@ Users can import individual tools or use the BUILTIN_TOOLS collection.
 """
 
 import ast
-import operator
+import re
+import time
 from datetime import datetime
+from functools import lru_cache
+from types import CodeType, MappingProxyType
 from typing import TYPE_CHECKING
 
 from langchain_core.tools import Tool, tool
@@ -16,6 +19,9 @@ if TYPE_CHECKING:
     from .config import ServerConfig
     from .rag import DocSearchIndex
 
+# (unix second, formatted string) from the last get_current_datetime call
+_datetime_cache: tuple[int, str] = (-1, "")
+
 
 @tool
 def get_current_datetime() -> str:
@@ -28,16 +34,108 @@ def get_current_datetime() -> str:
     Returns:
         Current date and time string (e.g., "Wednesday, November 26, 2025 at 2:30 PM PST")
     """
+    global _datetime_cache
+
+    # Agent loops can call this repeatedly; reuse the string formatted within the same second.
+    # The cache is a single tuple swapped atomically, so concurrent calls need no lock.
+    second = int(time.time())
+    cached_second, cached_str = _datetime_cache
+    if second == cached_second:
+        return cached_str
+
     # Get current time in local timezone
-    local_tz = datetime.now().astimezone().tzinfo
-    now = datetime.now(local_tz)
+    now = datetime.fromtimestamp(second).astimezone()
 
     # Format: "Wednesday, November 26, 2025 at 2:30 PM PST"
     date_str = now.strftime("%A, %B %d, %Y")
     time_str = now.strftime("%I:%M %p").lstrip("0")  # Remove leading zero from hour
     tz_name = now.strftime("%Z")
 
-    return f"{date_str} at {time_str} {tz_name}"
+    result = f"{date_str} at {time_str} {tz_name}"
+    _datetime_cache = (second, result)
+    return result
+
+
+# Operator node types accepted by the validator; arithmetic itself runs as compiled bytecode
+_ALLOWED_OPERATOR_TYPES = frozenset(
+    {
+        ast.Add,
+        ast.Sub,
+        ast.Mult,
+        ast.Div,
+        ast.FloorDiv,
+        ast.Mod,
+        ast.Pow,
+        ast.USub,  # Unary minus
+    }
+)
+
+
+def _validate_constant(node: ast.Constant) -> tuple[ast.AST, ...]:
+    """Numbers: only allow numeric constants; bool subclasses int so block explicitly."""
+    if not isinstance(node.value, (int, float, complex)) or isinstance(node.value, bool):
+        raise ValueError(f"Only numeric constants allowed, got {type(node.value).__name__}")
+    return ()
+
+
+def _validate_operator(op: ast.AST) -> None:
+    if type(op) not in _ALLOWED_OPERATOR_TYPES:
+        raise ValueError(f"Unsupported operator: {type(op).__name__}")
+
+
+def _validate_binop(node: ast.BinOp) -> tuple[ast.AST, ...]:
+    _validate_operator(node.op)
+    return (node.right, node.left)  # Reversed so the left operand is popped (checked) first
+
+
+def _validate_unaryop(node: ast.UnaryOp) -> tuple[ast.AST, ...]:
+    _validate_operator(node.op)
+    return (node.operand,)
+
+
+# Validators keyed by exact node type (one dict lookup per node instead of an isinstance chain).
+# Each checks its own node and returns the child nodes still to be checked.
+_NODE_VALIDATORS = MappingProxyType(
+    {
+        ast.Constant: _validate_constant,
+        ast.BinOp: _validate_binop,
+        ast.UnaryOp: _validate_unaryop,
+    }
+)
+
+
+def _validate_node(node: ast.AST) -> None:
+    """Check that an AST only uses numeric constants and allowed operators.
+
+    Walks the tree with an explicit stack, so deeply nested expressions don't add a
+    Python frame per level.
+    """
+    stack = [node]
+    while stack:
+        node = stack.pop()
+        validator = _NODE_VALIDATORS.get(type(node))
+        if validator is None:
+            raise ValueError(f"Unsupported expression type: {type(node).__name__}")
+        stack.extend(validator(node))
+
+
+@lru_cache(maxsize=512)
+def _compile_expression(expression: str) -> CodeType:
+    """Parse, validate, and compile an expression (cached, so repeats skip the AST walk).
+
+    Raises:
+        SyntaxError: If the expression can't be parsed
+        ValueError: If the expression uses anything but numeric constants and allowed operators
+    """
+    tree = ast.parse(expression, mode="eval")
+    _validate_node(tree.body)
+    return compile(tree, "<calculate>", "eval")
+
+
+# Plain decimal literals ("42", "-3.14") that calculate can format without parsing. Stricter than
+# float(): no leading "+", leading zeros, exponents, or underscores, so anything it rejects still
+# goes through (and gets the same errors from) the AST path.
+_NUMBER_LITERAL = re.compile(r"-?(?:0|[1-9][0-9]*)(?:\.[0-9]+)?")
 
 
 @tool
@@ -58,46 +156,21 @@ def calculate(expression: str) -> str:
         - calculate("10 * (5 + 3)") -> "80"
         - calculate("2 ** 8") -> "256"
     """
-    # Mapping of allowed operators
-    ALLOWED_OPERATORS = {
-        ast.Add: operator.add,
-        ast.Sub: operator.sub,
-        ast.Mult: operator.mul,
-        ast.Div: operator.truediv,
-        ast.FloorDiv: operator.floordiv,
-        ast.Mod: operator.mod,
-        ast.Pow: operator.pow,
-        ast.USub: operator.neg,  # Unary minus
-    }
-
-    def eval_node(node):
-        """Recursively evaluate AST nodes."""
-        if isinstance(node, ast.Constant):  # Numbers
-            # Only allow numeric constants; bool subclasses int so block explicitly
-            if not isinstance(node.value, (int, float, complex)) or isinstance(node.value, bool):
-                raise ValueError(f"Only numeric constants allowed, got {type(node.value).__name__}")
-            return node.value
-        elif isinstance(node, ast.BinOp):  # Binary operations
-            op = ALLOWED_OPERATORS.get(type(node.op))
-            if op is None:
-                raise ValueError(f"Unsupported operator: {type(node.op).__name__}")
-            left = eval_node(node.left)
-            right = eval_node(node.right)
-            return op(left, right)
-        elif isinstance(node, ast.UnaryOp):  # Unary operations
-            op = ALLOWED_OPERATORS.get(type(node.op))
-            if op is None:
-                raise ValueError(f"Unsupported operator: {type(node.op).__name__}")
-            operand = eval_node(node.operand)
-            return op(operand)
-        else:
-            raise ValueError(f"Unsupported expression type: {type(node).__name__}")
-
     try:
-        # Parse the expression into an AST
-        tree = ast.parse(expression, mode="eval")
-        # Evaluate the AST
-        result = eval_node(tree.body)
+        # Models often pass a bare number to "verify" it; skip parsing for plain literals
+        literal = expression.rstrip()
+        if _NUMBER_LITERAL.fullmatch(literal):
+            try:
+                if "." not in literal:
+                    return str(int(literal))
+                value = float(literal)
+                return str(int(value)) if value.is_integer() else str(value)
+            except ValueError:
+                pass  # e.g. over the int digit limit; let the parser report it as usual
+
+        code = _compile_expression(expression)
+        # Safe to eval: the tree was validated to contain only numeric constants and arithmetic
+        result = eval(code, {"__builtins__": {}}, {})
         # Format the result nicely
         if isinstance(result, float) and result.is_integer():
             return str(int(result))
@@ -3,6 +3,9 @@
 from collections.abc import Callable
 from typing import Any, Literal
 
+# Whether .env has been loaded into os.environ by ServerConfig.from_env()
+_dotenv_loaded = False
+
 
 def _parse_bool_env(value: str, default: bool) -> bool:
     """Parse boolean from environment variable string.
@@ -64,6 +67,7 @@ class ServerConfig:
     # Backend timeout settings (in seconds)
     BACKEND_CONNECT_TIMEOUT: int = 10  # Connection timeout
     BACKEND_READ_TIMEOUT: int = 300  # Read timeout (5 minutes for long completions)
+    BACKEND_HTTP2: bool = False  # Send backend calls over HTTP/2 with httpx (requires http2 extra, https endpoints)
 
     # Health check settings
     HEALTH_CHECK_ON_STARTUP: bool = True  # Check backend availability before starting server
@@ -97,19 +101,26 @@ class ServerConfig:
         """
         import os
 
-        from dotenv import load_dotenv
+        global _dotenv_loaded
+        if not _dotenv_loaded:
+            from dotenv import load_dotenv
 
-        load_dotenv()
+            # .env only fills variables missing from the environment, so reading it once is enough
+            load_dotenv()
+            _dotenv_loaded = True
 
         config = cls()
 
+        # Snapshot the environment once instead of going through os.getenv for every setting
+        environ = dict(os.environ)
+
         # Helper to get env var with prefix
         def get_env(name: str, default):
             # Try with prefix first, then without
-            prefixed = os.getenv(f"{env_prefix}{name}", None)
+            prefixed = environ.get(f"{env_prefix}{name}")
             if prefixed is not None:
                 return prefixed
-            return os.getenv(name, default)
+            return environ.get(name, default)
 
         # Load configuration from environment
         # Support both BACKEND and BACKEND_TYPE env vars (BACKEND_TYPE takes precedence)
@@ -137,6 +148,7 @@ class ServerConfig:
         )
         config.BACKEND_CONNECT_TIMEOUT = int(get_env("BACKEND_CONNECT_TIMEOUT", str(cls.BACKEND_CONNECT_TIMEOUT)))
         config.BACKEND_READ_TIMEOUT = int(get_env("BACKEND_READ_TIMEOUT", str(cls.BACKEND_READ_TIMEOUT)))
+        config.BACKEND_HTTP2 = _parse_bool_env(get_env("BACKEND_HTTP2", ""), cls.BACKEND_HTTP2)
         config.HEALTH_CHECK_ON_STARTUP = _parse_bool_env(
             get_env("HEALTH_CHECK_ON_STARTUP", ""), cls.HEALTH_CHECK_ON_STARTUP
         )
@@ -61,8 +61,10 @@ Test RAG retrieval quality with metrics like Recall@k, MRR, and nDCG:
 from .evaluator import Evaluator
 from .rag_evaluator import RAGEvaluator
 from .rag_test_builder import (
+    SearchResults,
     create_test_case_interactive,
     inspect_search_results,
+    inspect_search_results_soa,
     load_test_cases,
     print_example_usage,
     save_test_cases,
@@ -80,10 +82,12 @@ __all__ = [
     "RAGEvaluator",
     "RAGTestCase",
     "RAGTestResult",
+    "SearchResults",
     "TestCase",
     "TestResult",
     "create_test_case_interactive",
     "inspect_search_results",
+    "inspect_search_results_soa",
     "load_test_cases",
     "print_example_usage",
     "save_test_cases",
@@ -2,9 +2,11 @@
 
 import json
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 import requests
+from requests.adapters import DEFAULT_POOLSIZE, HTTPAdapter
 
 from .test_case import TestCase, TestResult
 from .validators import validate_response
@@ -27,6 +29,33 @@ class Evaluator:
         self.model = model
         self.stream = stream
         self.extra_params = extra_params or {}
+        # Reused across requests so keep-alive connections skip the TCP/TLS handshake
+        self.session = requests.Session()
+        self._pool_maxsize = DEFAULT_POOLSIZE
+
+    def close(self):
+        """Close the underlying HTTP session and its pooled connections."""
+        self.session.close()
+
+    def _ensure_pool_size(self, pool_maxsize: int):
+        """Mount adapters whose connection pools hold pool_maxsize connections per host.
+
+        The default pool keeps 10 connections; more concurrent requests than that would
+        discard and re-open connections ("Connection pool is full").
+        """
+        if pool_maxsize <= self._pool_maxsize:
+            return
+        adapter = HTTPAdapter(pool_maxsize=pool_maxsize)
+        for prefix in ("http://", "https://"):
+            self.session.get_adapter(prefix).close()
+            self.session.mount(prefix, adapter)
+        self._pool_maxsize = pool_maxsize
+
+    def __enter__(self) -> "Evaluator":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
 
     def check_health(self) -> bool:
         """Check if the LLM API is running and healthy.
@@ -35,7 +64,7 @@ class Evaluator:
             True if API is healthy, False otherwise
         """
         try:
-            response = requests.get(f"{self.api_url}/health", timeout=5)
+            response = self.session.get(f"{self.api_url}/health", timeout=5)
             return response.status_code == 200
         except requests.RequestException:
             return False
@@ -60,7 +89,7 @@ class Evaluator:
                 **self.extra_params,
             }
 
-            response = requests.post(
+            response = self.session.post(
                 f"{self.api_url}/v1/chat/completions",
                 json=payload,
                 timeout=timeout,
@@ -101,6 +130,17 @@ class Evaluator:
         # Send question
         response, response_time, error, tools_used = self.send_question(test_case.question, test_case.timeout)
 
+        return self._evaluate(test_case, response, response_time, error, tools_used)
+
+    def _evaluate(
+        self,
+        test_case: TestCase,
+        response: str | None,
+        response_time: float,
+        error: str | None,
+        tools_used: list[str],
+    ) -> TestResult:
+        """Validate a response (including any custom validator) and build its TestResult."""
         # Handle errors
         if error:
             return TestResult(
@@ -124,27 +164,73 @@ class Evaluator:
             tools_used=tools_used,
         )
 
-    def run_tests(self, test_cases: list[TestCase], stop_on_failure: bool = False) -> list[TestResult]:
+    def run_tests(
+        self,
+        test_cases: list[TestCase],
+        stop_on_failure: bool = False,
+        max_workers: int = 1,
+        validator_workers: int = 0,
+    ) -> list[TestResult]:
         """Run multiple test cases.
 
+        Requests are network-bound, so with ``max_workers > 1`` test cases are sent
+        concurrently from a thread pool. Results are always returned in input order.
+
+        When requests are sent one at a time, ``validator_workers > 0`` moves response
+        validation (including I/O-bound custom validators) to a separate thread pool so
+        it overlaps with the next request. This is ignored with ``stop_on_failure``,
+        which needs each result before sending the next question.
+
         Args:
             test_cases: List of test cases to run
             stop_on_failure: If True, stop running tests after first failure
+            max_workers: Maximum number of concurrent requests (default: 1, sequential)
+            validator_workers: Threads for background validation in sequential mode (default: 0, inline)
 
         Returns:
             List of TestResult objects
         """
         results = []
 
-        for test_case in test_cases:
-            result = self.run_test(test_case)
-            results.append(result)
+        if max_workers <= 1 or len(test_cases) <= 1:
+            if validator_workers > 0 and not stop_on_failure:
+                return self._run_tests_pipelined(test_cases, validator_workers)
 
-            if stop_on_failure and not result.passed:
-                break
+            for test_case in test_cases:
+                result = self.run_test(test_case)
+                results.append(result)
+
+                if stop_on_failure and not result.passed:
+                    break
+
+            return results
+
+        self._ensure_pool_size(max_workers)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(self.run_test, test_case) for test_case in test_cases]
+
+            for i, future in enumerate(futures):
+                result = future.result()
+                results.append(result)
+
+                if stop_on_failure and not result.passed:
+                    # Drop tests that haven't started yet; in-flight requests finish on exit
+                    for pending in futures[i + 1 :]:
+                        pending.cancel()
+                    break
 
         return results
 
+    def _run_tests_pipelined(self, test_cases: list[TestCase], validator_workers: int) -> list[TestResult]:
+        """Send questions sequentially while validating earlier responses in the background."""
+        with ThreadPoolExecutor(max_workers=validator_workers) as executor:
+            futures = []
+            for test_case in test_cases:
+                response, response_time, error, tools_used = self.send_question(test_case.question, test_case.timeout)
+                futures.append(executor.submit(self._evaluate, test_case, response, response_time, error, tools_used))
+
+            return [future.result() for future in futures]
+
     def get_summary(self, results: list[TestResult]) -> dict[str, Any]:
         """Generate summary statistics from test results.
 
@@ -52,20 +52,32 @@ class RAGEvaluator:
         """
         self.index = index
 
-    def run_test(self, test_case: RAGTestCase) -> RAGTestResult:
+    def run_test(self, test_case: RAGTestCase, query_vector: Any = None) -> RAGTestResult:
         """Run a single RAG test case.
 
         Args:
             test_case: The test case to run
+            query_vector: Optional precomputed embedding of the query (one row of
+                          index.embed_queries()); search_time then excludes encoding
 
         Returns:
             RAGTestResult with metrics and retrieved documents
         """
         # Run search
         start_time = time.time()
-        results = self.index.search(test_case.query, top_k=test_case.top_k)
+        if query_vector is None:
+            results = self.index.search(test_case.query, top_k=test_case.top_k)
+        else:
+            # A single-query batch searches exactly like search(), minus the query encoding
+            results = self.index.search_batch(
+                [test_case.query], top_k=test_case.top_k, query_vectors=query_vector[None, :]
+            )[0]
         search_time = time.time() - start_time
 
+        return self._build_result(test_case, results, search_time)
+
+    def _build_result(self, test_case: RAGTestCase, results: list[dict[str, Any]], search_time: float) -> RAGTestResult:
+        """Compute metrics for retrieved results and package them as a RAGTestResult."""
         # Extract retrieved URLs and content
         retrieved_urls = [r.get("url", "") for r in results]
         retrieved_texts = [r.get("text", "") for r in results]
@@ -89,11 +101,13 @@ class RAGEvaluator:
             config_snapshot=config_snapshot,
         )
 
-    def run_tests(self, test_cases: list[RAGTestCase]) -> list[RAGTestResult]:
+    def run_tests(self, test_cases: list[RAGTestCase], query_vectors: Any = None) -> list[RAGTestResult]:
         """Run multiple RAG test cases.
 
         Args:
             test_cases: List of test cases to run
+            query_vectors: Optional precomputed query embeddings from index.embed_queries(),
+                           one row per test case
 
         Returns:
             List of RAGTestResult objects
@@ -101,7 +115,7 @@ class RAGEvaluator:
         results = []
         for i, test_case in enumerate(test_cases, 1):
             logger.info(f"[RAG Eval] Running test {i}/{len(test_cases)}: {test_case.description}")
-            result = self.run_test(test_case)
+            result = self.run_test(test_case, None if query_vectors is None else query_vectors[i - 1])
             results.append(result)
             logger.info(
                 f"[RAG Eval] Recall: {result.recall:.2%}, MRR: {result.mrr:.2f}, "
@@ -109,13 +123,53 @@ class RAGEvaluator:
             )
         return results
 
+    def run_tests_batched(self, test_cases: list[RAGTestCase], query_vectors: Any = None) -> list[RAGTestResult]:
+        """Run multiple RAG test cases with a single batched search.
+
+        Uses DocSearchIndex.search_batch() so all query embeddings are computed in one
+        forward pass. Metrics match run_tests(); each result's search_time is the
+        batch time divided evenly across test cases.
+
+        Args:
+            test_cases: List of test cases to run
+            query_vectors: Optional precomputed query embeddings from index.embed_queries()
+
+        Returns:
+            List of RAGTestResult objects
+        """
+        if not test_cases:
+            return []
+
+        logger.info(f"[RAG Eval] Running {len(test_cases)} tests in one batch")
+        max_top_k = max(tc.top_k for tc in test_cases)
+
+        start_time = time.time()
+        batch_results = self.index.search_batch(
+            [tc.query for tc in test_cases], top_k=max_top_k, query_vectors=query_vectors
+        )
+        search_time = (time.time() - start_time) / len(test_cases)
+
+        results = []
+        for test_case, retrieved in zip(test_cases, batch_results):
+            # Candidate retrieval doesn't depend on top_k, so slicing matches a per-query search
+            result = self._build_result(test_case, retrieved[: test_case.top_k], search_time)
+            results.append(result)
+            logger.info(
+                f"[RAG Eval] {test_case.description} - Recall: {result.recall:.2%}, "
+                f"MRR: {result.mrr:.2f}, nDCG: {result.ndcg:.2f}"
+            )
+        return results
+
     def run_ab_comparison(
         self, test_cases: list[RAGTestCase], config_a: dict[str, Any], config_b: dict[str, Any]
     ) -> dict[str, Any]:
         """Run A/B comparison with different configurations.
 
         Temporarily modifies the index config to run tests under different settings,
-        then restores the original config.
+        then restores the original config. Query embeddings don't depend on these
+        settings, so they are computed once and shared by both runs. Each query is
+        still searched and timed on its own, so search_time is per-query retrieval and
+        re-ranking latency; the one-off encoding time is reported as "embed_time".
 
         Args:
             test_cases: List of test cases to run
@@ -131,6 +185,11 @@ class RAGEvaluator:
             if hasattr(self.index.config, key):
                 original_config[key] = getattr(self.index.config, key)
 
+        # Encode queries once; both runs reuse the vectors and only retrieval/reranking differs
+        start_time = time.time()
+        query_vectors = self.index.embed_queries([tc.query for tc in test_cases]) if test_cases else None
+        embed_time = time.time() - start_time
+
         try:
             # Run with config A
             logger.info(f"[RAG Eval] Running A/B test - Config A: {config_a}")
@@ -138,14 +197,14 @@ class RAGEvaluator:
             # Reinitialize cross-encoder if rerank setting changed
             if "rerank_enabled" in config_a:
                 self._reinit_reranker()
-            results_a = self.run_tests(test_cases)
+            results_a = self.run_tests(test_cases, query_vectors=query_vectors)
 
             # Run with config B
             logger.info(f"[RAG Eval] Running A/B test - Config B: {config_b}")
             self._apply_config(config_b)
             if "rerank_enabled" in config_b:
                 self._reinit_reranker()
-            results_b = self.run_tests(test_cases)
+            results_b = self.run_tests(test_cases, query_vectors=query_vectors)
 
         finally:
             # Restore original config
@@ -165,6 +224,7 @@ class RAGEvaluator:
             "results_b": results_b,
             "summary_a": summary_a,
             "summary_b": summary_b,
+            "embed_time": embed_time,
             "deltas": {
                 "recall": summary_b["mean_recall"] - summary_a["mean_recall"],
                 "mrr": summary_b["mean_mrr"] - summary_a["mean_mrr"],
@@ -206,11 +266,13 @@ class RAGEvaluator:
         """
         # Build relevance judgments (binary: 1 if relevant, 0 if not)
         relevance = []
+        relevant_url_set = frozenset(test_case.relevant_urls)
         for i, url in enumerate(retrieved_urls):
-            is_relevant = False
+            # Exact URL match is an O(1) set lookup
+            is_relevant = url in relevant_url_set
 
-            # Check URL match
-            if test_case.relevant_urls:
+            # Otherwise fall back to substring matching in either direction
+            if not is_relevant and test_case.relevant_urls:
                 # Flexible URL matching - check if any relevant URL is contained in retrieved URL
                 for relevant_url in test_case.relevant_urls:
                     if relevant_url in url or url in relevant_url:
@@ -5,16 +5,96 @@ including interactive test case builders and utilities to inspect search results
 """
 
 import json
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from .rag_test_case import RAGTestCase
 
+if TYPE_CHECKING:
+    import numpy as np
+
+# Optional orjson support for faster test case (de)serialization
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+@dataclass
+class SearchResults:
+    """Search results as parallel arrays, one entry per rank (struct-of-arrays).
+
+    Keeps batched evaluation from materializing a dict per result and lets
+    metrics be computed with vectorized numpy operations, e.g.
+    ``np.isin(results.urls[:k], relevant_urls).mean()``.
+
+    Attributes:
+        urls: Result URLs (object array)
+        scores: Result scores (float64)
+        headings: Heading paths (object array)
+        text_previews: First 200 characters of each result's text (object array)
+    """
+
+    urls: "np.ndarray"
+    scores: "np.ndarray"
+    headings: "np.ndarray"
+    text_previews: "np.ndarray"
+
+    def __len__(self) -> int:
+        return len(self.urls)
+
+    def to_dicts(self) -> list[dict[str, Any]]:
+        """Materialize the results as the per-result dicts returned by inspect_search_results()."""
+        return [
+            {"rank": i, "url": url, "score": float(score), "heading": heading, "text_preview": text}
+            for i, (url, score, heading, text) in enumerate(
+                zip(self.urls, self.scores, self.headings, self.text_previews, strict=True), 1
+            )
+        ]
+
+
+def _object_array(values: list[Any]) -> "np.ndarray":
+    """Build a 1-D object array without numpy broadcasting nested sequences."""
+    import numpy as np
+
+    array = np.empty(len(values), dtype=object)
+    for i, value in enumerate(values):
+        array[i] = value
+    return array
+
+
+def inspect_search_results_soa(index: Any, query: str, top_k: int = 10) -> SearchResults:
+    """Run a search and return the results as parallel arrays without printing.
+
+    Args:
+        index: DocSearchIndex instance
+        query: Search query to test
+        top_k: Number of results to retrieve
+
+    Returns:
+        SearchResults with urls, scores, headings, and text previews
+    """
+    import numpy as np
+
+    results = index.search(query, top_k=top_k)
+
+    texts = [r.get("text", "") for r in results]
+    return SearchResults(
+        urls=_object_array([r.get("url", "N/A") for r in results]),
+        scores=np.fromiter((r.get("score", 0) for r in results), dtype=np.float64, count=len(results)),
+        headings=_object_array([r.get("heading_path", "") for r in results]),
+        text_previews=_object_array([text[:200] + "..." if len(text) > 200 else text for text in texts]),
+    )
+
 
 def inspect_search_results(index: Any, query: str, top_k: int = 10) -> list[dict[str, Any]]:
     """Run a search and display results for manual relevance assessment.
 
     Use this to explore what the index returns for a query before creating test cases.
+    For batched or programmatic use, inspect_search_results_soa() avoids per-result dicts.
 
     Args:
         index: DocSearchIndex instance
@@ -24,28 +104,21 @@ def inspect_search_results(index: Any, query: str, top_k: int = 10) -> list[dict
     Returns:
         List of result dicts with url, score, and text preview
     """
-    results = index.search(query, top_k=top_k)
+    results = inspect_search_results_soa(index, query, top_k)
 
     print(f"\n{'=' * 70}")
     print(f" Search Results for: {query!r}")
     print(f"{'=' * 70}\n")
 
-    simplified = []
-    for i, r in enumerate(results, 1):
-        url = r.get("url", "N/A")
-        score = r.get("score", 0)
-        text = r.get("text", "")[:200] + "..." if len(r.get("text", "")) > 200 else r.get("text", "")
-        heading = r.get("heading_path", "")
-
-        print(f"[{i}] Score: {score:.3f}")
-        print(f"    URL: {url}")
-        if heading:
-            print(f"    Heading: {heading}")
-        print(f"    Text: {text}")
+    simplified = results.to_dicts()
+    for r in simplified:
+        print(f"[{r['rank']}] Score: {r['score']:.3f}")
+        print(f"    URL: {r['url']}")
+        if r["heading"]:
+            print(f"    Heading: {r['heading']}")
+        print(f"    Text: {r['text_preview']}")
         print()
 
-        simplified.append({"rank": i, "url": url, "score": score, "heading": heading, "text_preview": text})
-
     return simplified
 
 
@@ -112,7 +185,11 @@ def save_test_cases(test_cases: list[RAGTestCase], filepath: str | Path):
             }
         )
 
-    Path(filepath).write_text(json.dumps(data, indent=2))
+    if HAS_ORJSON:
+        # orjson encodes straight to UTF-8 bytes
+        Path(filepath).write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        Path(filepath).write_text(json.dumps(data, indent=2))
     print(f"Saved {len(test_cases)} test cases to {filepath}")
 
 
@@ -125,7 +202,8 @@ def load_test_cases(filepath: str | Path) -> list[RAGTestCase]:
     Returns:
         List of RAGTestCase objects
     """
-    data = json.loads(Path(filepath).read_text())
+    raw = Path(filepath).read_bytes()
+    data = orjson.loads(raw) if HAS_ORJSON else json.loads(raw)
 
     test_cases = []
     for item in data:
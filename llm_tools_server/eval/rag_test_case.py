@@ -1,5 +1,6 @@
 """RAG-specific test case definitions for retrieval evaluation."""
 
+import sys
 from dataclasses import dataclass, field
 from typing import Any
 
@@ -29,6 +30,9 @@ class RAGTestCase:
         if not self.relevant_urls and not self.relevant_keywords:
             raise ValueError("RAGTestCase must have at least one of: relevant_urls or relevant_keywords")
 
+        # Intern URLs: suites repeat the same URLs across cases, and interned strings compare by identity first
+        self.relevant_urls = [sys.intern(url) for url in self.relevant_urls]
+
 
 @dataclass
 class RAGTestResult:
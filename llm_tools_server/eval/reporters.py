@@ -1,9 +1,14 @@
 """Report generators for evaluation results."""
 
+import contextlib
 import html
 import json
+import os
+import sys
+from collections.abc import Iterator
 from datetime import datetime
 from pathlib import Path
+from typing import TextIO
 
 from .test_case import TestResult
 
@@ -15,6 +20,61 @@ try:
 except ImportError:
     HAS_MARKDOWN = False
 
+# Markdown extensions used to render responses in HTML reports
+_MARKDOWN_EXTENSIONS = ["fenced_code", "tables", "nl2br"]
+
+# Buffer size for report file writes (1 MiB)
+_WRITE_BUFFER_SIZE = 1 << 20
+
+
+@contextlib.contextmanager
+def _open_report(output_path: Path) -> Iterator[TextIO]:
+    """Open a buffered temporary file next to output_path and rename it into place on success.
+
+    If writing fails partway, the temporary file is removed and any existing report is left intact.
+    """
+    tmp_path = output_path.with_name(f"{output_path.name}.tmp")
+    try:
+        with tmp_path.open("w", encoding="utf-8", buffering=_WRITE_BUFFER_SIZE) as f:
+            yield f
+        os.replace(tmp_path, output_path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def _indent_json(encoded: str, level: int) -> str:
+    """Indent continuation lines of a JSON fragment nested ``level`` spaces deep."""
+    return encoded.replace("\n", "\n" + " " * level)
+
+
+# Closes the results table opened by HTMLReporter._render_header
+_HTML_FOOTER = """
+            </tbody>
+        </table>
+
+        <footer>
+            Generated by LLM API Server Evaluation Framework
+        </footer>
+    </div>
+
+    <script>
+        function toggleResponse(button) {
+            const responseContent = button.nextElementSibling;
+            const isCollapsed = responseContent.classList.contains('collapsed');
+
+            if (isCollapsed) {
+                responseContent.classList.remove('collapsed');
+                button.textContent = 'Collapse';
+            } else {
+                responseContent.classList.add('collapsed');
+                button.textContent = 'Expand';
+            }
+        }
+    </script>
+</body>
+</html>"""
+
 
 class HTMLReporter:
     """Generate HTML reports from evaluation results."""
@@ -37,24 +97,31 @@ class HTMLReporter:
         total_time = sum(r.response_time for r in results)
         avg_time = total_time / total if total > 0 else 0
 
-        # Generate HTML
-        html_content = self._generate_html(
-            results=results,
-            title=title,
-            total=total,
-            passed=passed,
-            failed=failed,
-            success_rate=success_rate,
-            total_time=total_time,
-            avg_time=avg_time,
-        )
-
-        # Write to file
-        output_path.write_text(html_content, encoding="utf-8")
-
-    def _generate_html(
+        # Build the markdown converter once; creating one per row reloads every extension
+        converter = markdown.Markdown(extensions=_MARKDOWN_EXTENSIONS) if HAS_MARKDOWN else None
+
+        # Stream header, rows, and footer through a large buffer rather than assembling
+        # the whole document in memory first
+        with _open_report(output_path) as f:
+            f.write(
+                self._render_header(
+                    title=title,
+                    total=total,
+                    passed=passed,
+                    failed=failed,
+                    success_rate=success_rate,
+                    total_time=total_time,
+                    avg_time=avg_time,
+                )
+            )
+            for i, result in enumerate(results, 1):
+                if i > 1:
+                    f.write("\n")
+                f.write(self._render_row(i, result, converter))
+            f.write(_HTML_FOOTER)
+
+    def _render_header(
         self,
-        results: list[TestResult],
         title: str,
         total: int,
         passed: int,
@@ -63,81 +130,9 @@ class HTMLReporter:
         total_time: float,
         avg_time: float,
     ) -> str:
-        """Generate HTML content for report."""
+        """Render the HTML document up to the opening of the results table body."""
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
-        # Generate test result rows
-        test_rows = []
-        for i, result in enumerate(results, 1):
-            status_class = "passed" if result.passed else "failed"
-            status_icon = "✓" if result.passed else "✗"
-
-            # Build issues/error display
-            issues_html = ""
-            if result.error:
-                issues_html = f'<div class="error">Error: {html.escape(result.error)}</div>'
-            elif result.issues:
-                issues_list = "".join(f"<li>{html.escape(issue)}</li>" for issue in result.issues)
-                issues_html = f'<div class="issues"><ul>{issues_list}</ul></div>'
-
-            # Build tools used display
-            if result.tools_used:
-                tools_html = "".join(
-                    f'<span class="tool-badge">{html.escape(tool)}</span>' for tool in result.tools_used
-                )
-            else:
-                tools_html = '<span class="no-tools">None</span>'
-
-            # Format response (convert markdown to HTML if available)
-            if result.response:
-                if HAS_MARKDOWN:
-                    # Convert markdown to HTML
-                    response_html = markdown.markdown(
-                        result.response,
-                        extensions=["fenced_code", "tables", "nl2br"],
-                    )
-                else:
-                    # Fallback: escape HTML and preserve line breaks
-                    response_html = html.escape(result.response).replace("\n", "<br>")
-
-                # Create collapsible response (collapsed by default if > 300 chars)
-                is_long = len(result.response) > 300
-                collapsed_class = "collapsed" if is_long else ""
-                toggle_btn = (
-                    f'<button class="toggle-btn" onclick="toggleResponse(this)">{"Expand" if is_long else "Collapse"}</button>'
-                    if is_long
-                    else ""
-                )
-
-                response_display = f"""
-                    {toggle_btn}
-                    <div class="response-content {collapsed_class}">
-                        {response_html}
-                    </div>
-                """
-            else:
-                response_display = '<div class="response-content">N/A</div>'
-
-            row = f"""
-            <tr class="{status_class}">
-                <td>{i}</td>
-                <td><span class="status-icon">{status_icon}</span></td>
-                <td><strong>{html.escape(result.test_case.description)}</strong><br>
-                    <span class="question">{html.escape(result.test_case.question)}</span>
-                </td>
-                <td>{result.response_time:.2f}s</td>
-                <td><div class="tools-container">{tools_html}</div></td>
-                <td>
-                    <div class="response-container">{response_display}</div>
-                    {issues_html}
-                </td>
-            </tr>
-            """
-            test_rows.append(row)
-
-        test_rows_html = "\n".join(test_rows)
-
-        # Complete HTML document
         return f"""<!DOCTYPE html>
 <html lang="en">
 <head>
@@ -462,31 +457,77 @@ class HTMLReporter:
                 </tr>
             </thead>
             <tbody>
-                {test_rows_html}
-            </tbody>
-        </table>
+                """
 
-        <footer>
-            Generated by LLM API Server Evaluation Framework
-        </footer>
-    </div>
+    def _render_row(self, i: int, result: TestResult, converter: "markdown.Markdown | None" = None) -> str:
+        """Render a single result as a table row.
 
-    <script>
-        function toggleResponse(button) {{
-            const responseContent = button.nextElementSibling;
-            const isCollapsed = responseContent.classList.contains('collapsed');
+        Args:
+            i: 1-based row number
+            result: Test result to render
+            converter: Reusable markdown converter (a new one is created if omitted)
+        """
+        status_class = "passed" if result.passed else "failed"
+        status_icon = "✓" if result.passed else "✗"
+
+        # Build issues/error display
+        issues_html = ""
+        if result.error:
+            issues_html = f'<div class="error">Error: {html.escape(result.error)}</div>'
+        elif result.issues:
+            issues_list = "".join(f"<li>{html.escape(issue)}</li>" for issue in result.issues)
+            issues_html = f'<div class="issues"><ul>{issues_list}</ul></div>'
+
+        # Build tools used display
+        if result.tools_used:
+            tools_html = "".join(f'<span class="tool-badge">{html.escape(tool)}</span>' for tool in result.tools_used)
+        else:
+            tools_html = '<span class="no-tools">None</span>'
+
+        # Format response (convert markdown to HTML if available)
+        if result.response:
+            if HAS_MARKDOWN:
+                # Convert markdown to HTML
+                if converter is None:
+                    converter = markdown.Markdown(extensions=_MARKDOWN_EXTENSIONS)
+                response_html = converter.reset().convert(result.response)
+            else:
+                # Fallback: escape HTML and preserve line breaks
+                response_html = html.escape(result.response).replace("\n", "<br>")
+
+            # Create collapsible response (collapsed by default if > 300 chars)
+            is_long = len(result.response) > 300
+            collapsed_class = "collapsed" if is_long else ""
+            toggle_btn = (
+                f'<button class="toggle-btn" onclick="toggleResponse(this)">{"Expand" if is_long else "Collapse"}</button>'
+                if is_long
+                else ""
+            )
+
+            response_display = f"""
+                    {toggle_btn}
+                    <div class="response-content {collapsed_class}">
+                        {response_html}
+                    </div>
+                """
+        else:
+            response_display = '<div class="response-content">N/A</div>'
 
-            if (isCollapsed) {{
-                responseContent.classList.remove('collapsed');
-                button.textContent = 'Collapse';
-            }} else {{
-                responseContent.classList.add('collapsed');
-                button.textContent = 'Expand';
-            }}
-        }}
-    </script>
-</body>
-</html>"""
+        return f"""
+            <tr class="{status_class}">
+                <td>{i}</td>
+                <td><span class="status-icon">{status_icon}</span></td>
+                <td><strong>{html.escape(result.test_case.description)}</strong><br>
+                    <span class="question">{html.escape(result.test_case.question)}</span>
+                </td>
+                <td>{result.response_time:.2f}s</td>
+                <td><div class="tools-container">{tools_html}</div></td>
+                <td>
+                    <div class="response-container">{response_display}</div>
+                    {issues_html}
+                </td>
+            </tr>
+            """
 
 
 class JSONReporter:
@@ -509,19 +550,24 @@ class JSONReporter:
         total_time = sum(r.response_time for r in results)
         avg_time = total_time / total if total > 0 else 0
 
-        # Build JSON structure
-        report = {
-            "generated_at": datetime.now().isoformat(),
-            "summary": {
-                "total": total,
-                "passed": passed,
-                "failed": failed,
-                "success_rate": success_rate,
-                "total_time": total_time,
-                "avg_time": avg_time,
-            },
-            "results": [
-                {
+        summary = {
+            "total": total,
+            "passed": passed,
+            "failed": failed,
+            "success_rate": success_rate,
+            "total_time": total_time,
+            "avg_time": avg_time,
+        }
+
+        # Stream one record at a time through a large buffer instead of materializing the
+        # whole report as a single string. Output matches json.dumps(report, indent=2).
+        with _open_report(output_path) as f:
+            f.write("{\n")
+            f.write(f'  "generated_at": {json.dumps(datetime.now().isoformat())},\n')
+            f.write(f'  "summary": {_indent_json(json.dumps(summary, indent=2), 2)},\n')
+            f.write('  "results": [')
+            for i, r in enumerate(results, 1):
+                record = {
                     "test_number": i,
                     "description": r.test_case.description,
                     "question": r.test_case.question,
@@ -533,12 +579,9 @@ class JSONReporter:
                     "tools_used": r.tools_used,
                     "metadata": r.test_case.metadata,
                 }
-                for i, r in enumerate(results, 1)
-            ],
-        }
-
-        # Write to file
-        output_path.write_text(json.dumps(report, indent=2), encoding="utf-8")
+                f.write("\n    " if i == 1 else ",\n    ")
+                f.write(_indent_json(json.dumps(record, indent=2), 4))
+            f.write("\n  ]\n}" if results else "]\n}")
 
 
 class ConsoleReporter:
@@ -558,9 +601,11 @@ class ConsoleReporter:
         success_rate = (passed / total * 100) if total > 0 else 0
         total_time = sum(r.response_time for r in results)
 
-        print("\n" + "=" * 80)
-        print("LLM Evaluation Results")
-        print("=" * 80 + "\n")
+        # Collect lines and write once, instead of a print (and possible flush) per line
+        lines = []
+        lines.append("\n" + "=" * 80)
+        lines.append("LLM Evaluation Results")
+        lines.append("=" * 80 + "\n")
 
         # Print individual results
         for i, result in enumerate(results, 1):
@@ -568,32 +613,35 @@ class ConsoleReporter:
             status_color = "\033[92m" if result.passed else "\033[91m"
             reset = "\033[0m"
 
-            print(f"Test {i}/{total}: {result.test_case.description}")
-            print(f'Question: "{result.test_case.question}"')
-            print(f"{status_color}{status}{reset} ({result.response_time:.2f}s)")
+            lines.append(f"Test {i}/{total}: {result.test_case.description}")
+            lines.append(f'Question: "{result.test_case.question}"')
+            lines.append(f"{status_color}{status}{reset} ({result.response_time:.2f}s)")
 
             if result.tools_used:
                 tools_str = ", ".join(result.tools_used)
-                print(f"  Tools: {tools_str}")
+                lines.append(f"  Tools: {tools_str}")
 
             if result.error:
-                print(f"  Error: {result.error}")
+                lines.append(f"  Error: {result.error}")
             elif result.issues:
                 for issue in result.issues:
-                    print(f"  - {issue}")
+                    lines.append(f"  - {issue}")
 
             if verbose or not result.passed:
-                print(f"\nResponse:\n{result.response}\n")
+                lines.append(f"\nResponse:\n{result.response}\n")
 
-            print()
+            lines.append("")
 
         # Print summary
-        print("=" * 80)
-        print("Summary")
-        print("=" * 80)
-        print(f"Total Tests:  {total}")
-        print(f"Passed:       {passed}")
-        print(f"Failed:       {failed}")
-        print(f"Success Rate: {success_rate:.1f}%")
-        print(f"Total Time:   {total_time:.1f}s")
-        print()
+        lines.append("=" * 80)
+        lines.append("Summary")
+        lines.append("=" * 80)
+        lines.append(f"Total Tests:  {total}")
+        lines.append(f"Passed:       {passed}")
+        lines.append(f"Failed:       {failed}")
+        lines.append(f"Success Rate: {success_rate:.1f}%")
+        lines.append(f"Total Time:   {total_time:.1f}s")
+        lines.append("")
+
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
@@ -46,6 +46,9 @@ BOILERPLATE_SELECTORS = [
     'a[class*="edit"]',
 ]
 
+# One selector list, so boilerplate is found in a single pass over the tree instead of one per selector
+_BOILERPLATE_SELECTOR = ", ".join(BOILERPLATE_SELECTORS)
+
 # Minimum content length in characters to create a chunk.
 # Content blocks shorter than this are skipped to avoid tiny, low-quality fragments
 # like navigation text, button labels, or isolated punctuation. The threshold of 20
@@ -117,8 +120,8 @@ def semantic_chunk_html(
 
     # Remove boilerplate elements that may remain after trafilatura extraction
     # (especially when fallback to <main>/<article> tags or original HTML is used)
-    for selector in BOILERPLATE_SELECTORS:
-        for element in soup.select(selector):
+    for element in soup.select(_BOILERPLATE_SELECTOR):
+        if not element.decomposed:  # Already removed with a matching ancestor
             element.decompose()
 
     # Use the body or the full soup as the content container
@@ -6,22 +6,35 @@ Supports three crawling modes:
 3. Manual URL list (explicit list of URLs to index)
 """
 
+import asyncio
+import gzip
+import heapq
+import io
 import json
 import logging
 import re
 import sys
+import threading
 import time
-import xml.etree.ElementTree as ET
+from collections import deque
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
-from typing import Any
-from urllib.parse import urljoin, urlparse
+from typing import IO, Any
+from urllib.parse import quote, unquote, urljoin, urlparse, urlsplit, urlunparse
 from urllib.robotparser import RobotFileParser
 
+import lxml.html
 import requests
-from bs4 import BeautifulSoup
+from lxml import etree
+from requests.adapters import DEFAULT_POOLSIZE, HTTPAdapter
 from tqdm import tqdm
+from urllib3.util.request import ACCEPT_ENCODING
 
 logger = logging.getLogger(__name__)
 
@@ -75,6 +88,293 @@ class SitemapChanges:
         }
 
 
+def _conditional_headers(validators: dict[str, str] | None) -> dict[str, str] | None:
+    """Build If-None-Match / If-Modified-Since headers from a previous response's validators."""
+    if not validators:
+        return None
+    headers = {}
+    if validators.get("etag"):
+        headers["If-None-Match"] = validators["etag"]
+    if validators.get("last_modified"):
+        headers["If-Modified-Since"] = validators["last_modified"]
+    return headers or None
+
+
+def _response_validators(response: requests.Response) -> dict[str, str]:
+    """Return the response's ETag / Last-Modified as 'etag' / 'last_modified' (when present)."""
+    validators = {}
+    for header, key in (("ETag", "etag"), ("Last-Modified", "last_modified")):
+        value = response.headers.get(header)
+        if value:
+            validators[key] = value
+    return validators
+
+
+# Pages declaring a larger Content-Length are skipped before their body is downloaded
+MAX_PAGE_BYTES = 20 * 1024 * 1024
+
+
+def _exceeds_page_size_limit(response: requests.Response) -> bool:
+    """Check whether a streamed response declares a body larger than MAX_PAGE_BYTES."""
+    try:
+        return int(response.headers.get("content-length", 0)) > MAX_PAGE_BYTES
+    except ValueError:
+        return False
+
+
+# First two bytes of a gzip stream (sitemap.xml.gz)
+_GZIP_MAGIC = b"\x1f\x8b"
+
+# <url> and <sitemap> entries, with or without the sitemaps.org namespace
+_SITEMAP_ENTRY_TAGS = ("{*}url", "{*}sitemap")
+
+
+def _iter_sitemap_entries(source: IO[bytes], url_filter: Callable[[str], str | None] | None = None):
+    """Stream (kind, loc, lastmod) tuples from sitemap XML without building the whole tree.
+
+    kind is "url" for page entries and "sitemap" for sitemap index entries. Each element
+    is cleared (along with already-processed siblings) once read, so memory stays flat
+    for large sitemaps.
+
+    Args:
+        source: File-like object with the raw XML bytes
+        url_filter: Optional callable mapping a page loc to the URL to keep, or None to
+            drop the entry. Dropped entries are skipped before their lastmod is read.
+
+    Yields:
+        (kind, loc, lastmod) with lastmod None when missing or empty
+    """
+    context = etree.iterparse(source, events=("end",), tag=_SITEMAP_ENTRY_TAGS, resolve_entities=False, no_network=True)
+    for _, elem in context:
+        loc = elem.findtext("{*}loc")
+        if loc:
+            kind = etree.QName(elem).localname
+            if kind == "url" and url_filter is not None:
+                loc = url_filter(loc)
+            if loc:
+                yield kind, loc, elem.findtext("{*}lastmod") or None
+        elem.clear()
+        while elem.getprevious() is not None:
+            del elem.getparent()[0]
+
+
+_LASTMOD = itemgetter("lastmod")
+
+
+def _sort_by_lastmod(entries: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Return entries newest lastmod first, entries without lastmod last in their original order.
+
+    Same order as ``sorted(entries, key=lambda x: x.get("lastmod") or "", reverse=True)``,
+    but undated entries are split off first so the dated ones sort on a C-level itemgetter.
+    lastmod stays None (not "") when missing, since change detection tells the two apart.
+    """
+    dated = [entry for entry in entries if entry.get("lastmod")]
+    if len(dated) == len(entries):
+        return sorted(entries, key=_LASTMOD, reverse=True)
+    undated = [entry for entry in entries if not entry.get("lastmod")]
+    dated.sort(key=_LASTMOD, reverse=True)
+    dated.extend(undated)
+    return dated
+
+
+# Numbered or named backreferences, which change meaning once patterns are joined
+_BACKREFERENCE = re.compile(r"\\[1-9]|\(\?P=")
+
+
+class _PatternList:
+    """Fallback for pattern lists that can't be merged into one regex; searches each in turn."""
+
+    def __init__(self, patterns: list[re.Pattern]):
+        self.patterns = patterns
+
+    def search(self, url: str) -> bool:
+        return any(pattern.search(url) for pattern in self.patterns)
+
+
+def _combine_patterns(patterns: list[re.Pattern]) -> "re.Pattern | _PatternList | None":
+    """Merge compiled patterns into one alternation that matches wherever any of them does.
+
+    Each pattern becomes a non-capturing group, e.g. (?:a)|(?:b). Lists with patterns
+    that can't be embedded (inline global flags such as "(?i)", backreferences that
+    would be renumbered, or duplicate group names) keep the per-pattern loop.
+
+    Returns:
+        Object with a search(url) method, or None if there are no patterns
+    """
+    if not patterns:
+        return None
+    if len(patterns) == 1:
+        return patterns[0]
+    if any(_BACKREFERENCE.search(pattern.pattern) for pattern in patterns):
+        return _PatternList(patterns)
+    try:
+        return re.compile("|".join(f"(?:{pattern.pattern})" for pattern in patterns))
+    except re.error:
+        return _PatternList(patterns)
+
+
+# Patterns that are plain text once escapes are removed, optionally anchored with a leading "^"
+_LITERAL_PATTERN = re.compile(r"(\^?)((?:[\w:/%~=&@,-]|\\[.?+*()\[\]{}|^$/\\-])+)")
+_ESCAPE = re.compile(r"\\(.)")
+
+
+class _UrlPatternSet:
+    r"""Matches a URL against a pattern list, testing literal patterns with string methods first.
+
+    "^https://docs\.example\.com/api/" becomes a str.startswith() prefix and "/private/" a
+    substring check; only the remaining patterns go through the combined regex.
+    """
+
+    def __init__(self, patterns: list[re.Pattern]):
+        prefixes: list[str] = []
+        substrings: list[str] = []
+        regex_patterns: list[re.Pattern] = []
+        for pattern in patterns:
+            literal = _LITERAL_PATTERN.fullmatch(pattern.pattern)
+            if literal is None:
+                regex_patterns.append(pattern)
+                continue
+            text = _ESCAPE.sub(r"\1", literal.group(2))
+            (prefixes if literal.group(1) else substrings).append(text)
+        self.prefixes = tuple(prefixes)
+        self.substrings = tuple(substrings)
+        self.regex = _combine_patterns(regex_patterns)
+
+    def search(self, url: str) -> bool:
+        if url.startswith(self.prefixes):
+            return True
+        if any(substring in url for substring in self.substrings):
+            return True
+        return self.regex is not None and bool(self.regex.search(url))
+
+
+# Responses that mean the server wants clients to slow down
+_BACKOFF_STATUS_CODES = frozenset({429, 503})
+
+
+def _retry_after_seconds(value: str | None) -> float | None:
+    """Parse a Retry-After header (delta-seconds or HTTP-date) into seconds from now."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=UTC)
+    return max(0.0, (retry_at - datetime.now(UTC)).total_seconds())
+
+
+class _RobotsRules:
+    """RobotFileParser.can_fetch() for one user agent, with its robots.txt entry resolved once.
+
+    The stdlib re-scans every entry for the user agent on each call. Here the matching entry's
+    rules are flattened up front; when they are all Disallow lines (the common case) a single
+    str.startswith(tuple) decides, otherwise rules are checked in file order (first match wins).
+    """
+
+    def __init__(self, parser: RobotFileParser, user_agent: str):
+        entry = next((e for e in parser.entries if e.applies_to(user_agent)), parser.default_entry)
+        rules = [(line.path, line.allowance) for line in entry.rulelines] if entry else []
+        self.rules = tuple(rules)
+        self.disallow_prefixes: tuple[str, ...] | None = None
+        if not any(allowance for _, allowance in rules):
+            # "*" matches every path, as does the empty prefix
+            self.disallow_prefixes = tuple("" if path == "*" else path for path, _ in rules)
+
+    def can_fetch(self, url: str) -> bool:
+        # Same path normalization as RobotFileParser.can_fetch()
+        parsed = urlparse(unquote(url))
+        path = quote(urlunparse(("", "", parsed.path, parsed.params, parsed.query, parsed.fragment))) or "/"
+        if self.disallow_prefixes is not None:
+            return not path.startswith(self.disallow_prefixes)
+        for rule_path, allowance in self.rules:
+            if rule_path == "*" or path.startswith(rule_path):
+                return allowance
+        return True
+
+
+class _RateLimiter:
+    """Space requests across all threads sharing the limiter, adapting the spacing to the server.
+
+    The delay starts at the configured rate_limit_delay and never drops below it. A 429/503 or
+    timeout doubles it (to at least 1s, at most max_delay) and honors Retry-After; each successful
+    response shrinks it by 10% back toward the configured delay.
+    """
+
+    def __init__(self, delay: float, max_delay: float = 60.0):
+        self.min_delay = delay
+        self.delay = delay
+        self.max_delay = max(max_delay, delay)
+        self._lock = threading.Lock()
+        self._next_allowed = 0.0
+        self._retry_at = 0.0  # Monotonic time before which Retry-After asked us not to send
+
+    def wait(self, backoff_only: bool = False):
+        """Block until this caller's request slot is reached.
+
+        Args:
+            backoff_only: Only wait while the server is pushing back (for requests that are
+                otherwise not rate limited, like the indexer's parallel page fetches)
+        """
+        with self._lock:
+            now = time.monotonic()
+            if backoff_only and self.delay <= self.min_delay and self._retry_at <= now:
+                return
+            if self.delay <= 0 and self._next_allowed <= now:
+                return
+            slot = max(self._next_allowed, now)
+            self._next_allowed = slot + self.delay
+        if slot > now:
+            time.sleep(slot - now)
+
+    def backoff(self, retry_after: str | None = None):
+        """Slow down after the server signalled overload."""
+        with self._lock:
+            self.delay = min(self.max_delay, max(self.delay * 2, 1.0))
+            seconds = _retry_after_seconds(retry_after)
+            if seconds:
+                resume_at = time.monotonic() + min(seconds, self.max_delay)
+                self._retry_at = max(self._retry_at, resume_at)
+                self._next_allowed = max(self._next_allowed, resume_at)
+
+    def success(self):
+        """Speed back up toward the configured delay after a successful response."""
+        if self.delay <= self.min_delay:
+            return
+        with self._lock:
+            self.delay = max(self.min_delay, self.delay * 0.9)
+            if self.delay - self.min_delay < 0.01:
+                self.delay = self.min_delay
+
+    def record(self, response: requests.Response):
+        """Adjust the delay from a response's status code and Retry-After header."""
+        if response.status_code in _BACKOFF_STATUS_CODES:
+            self.backoff(response.headers.get("Retry-After"))
+        elif response.status_code < 400:
+            self.success()
+
+
+@lru_cache(maxsize=200_000)
+def _normalize_url(url: str) -> str:
+    """Strip query params, anchors, and trailing slashes (cached; nav/footer links repeat on every page)."""
+    # Remove query params and anchors
+    url = url.split("?")[0].split("#")[0]
+    # Remove trailing slash
+    return url.rstrip("/")
+
+
+# hrefs that urljoin() would rewrite: dot segments, ;params, and the tab/CR/LF it strips
+_NEEDS_URLJOIN = re.compile(r"/\.|[;\t\r\n]")
+
+
+# "Sitemap: <url>" lines in robots.txt (the directive is case-insensitive)
+_ROBOTS_SITEMAP = re.compile(r"^[ \t]*sitemap:[ \t]*(\S+)", re.IGNORECASE | re.MULTILINE)
+
 # Default user agent for crawling
 DEFAULT_USER_AGENT = "RAG-DocBot/1.0 (Respectful crawler; +https://github.com/assareh/llm-tools-server)"
 
@@ -116,6 +416,9 @@ class DocumentCrawler:
             show_progress: Show progress bars during crawling (default: True)
         """
         self.base_url = base_url.rstrip("/")
+        self._site_domain = urlsplit(self.base_url).netloc.lower().removeprefix("www.")
+        # Lowercase apex and www. netlocs, matched exactly before normalizing case
+        self._site_netlocs = frozenset({self._site_domain, f"www.{self._site_domain}"})
         self.cache_dir = cache_dir
         self.sitemap_cache_file = cache_dir / "sitemap_cache.json"
         self.manual_urls = manual_urls or []
@@ -128,12 +431,28 @@ class DocumentCrawler:
         self.user_agent = user_agent
         self.show_progress = show_progress
 
-        # Compile URL patterns
+        # Shared by all fetch threads so parallel requests keep the delay and back off together
+        self._rate_limiter = _RateLimiter(rate_limit_delay)
+
+        # Compile URL patterns, plus one matcher per list (literal prefixes/substrings, then one combined regex)
         self.url_include_patterns = [re.compile(p) for p in (url_include_patterns or [])]
         self.url_exclude_patterns = [re.compile(p) for p in (url_exclude_patterns or [])]
+        self._include_matcher = _UrlPatternSet(self.url_include_patterns) if self.url_include_patterns else None
+        self._exclude_matcher = _UrlPatternSet(self.url_exclude_patterns) if self.url_exclude_patterns else None
+
+        # Shared HTTP session so robots, sitemap, and page fetches reuse pooled connections.
+        # The pool is sized for the indexer's max_workers fetch threads hitting the same host.
+        self.session = requests.Session()
+        # Only advertise encodings urllib3 can decode here: gzip/deflate always, plus br and zstd when
+        # brotli/zstandard are installed (advertising br without a decoder made some pages undecodable)
+        self.session.headers.update({"User-Agent": user_agent, "Accept-Encoding": ACCEPT_ENCODING})
+        adapter = HTTPAdapter(pool_maxsize=max(DEFAULT_POOLSIZE, max_workers))
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
 
         # Robots.txt parser and sitemap discovery
         self.robot_parser = RobotFileParser()
+        self._robots_rules: _RobotsRules | None = None  # robot_parser's rules for user_agent, resolved once
         self.robots_loaded = False  # Track if robots.txt loaded successfully
         self.sitemap_urls_from_robots = []  # Sitemap URLs found in robots.txt
 
@@ -152,21 +471,20 @@ class DocumentCrawler:
         for robots_url in robots_urls_to_try:
             try:
                 # Fetch robots.txt to parse both rules and sitemap URLs
-                headers = {"User-Agent": user_agent, "Accept-Encoding": "gzip, deflate"}
-                response = requests.get(robots_url, headers=headers, timeout=request_timeout)
+                response = self.session.get(robots_url, timeout=request_timeout)
                 response.raise_for_status()
 
+                # response.text decodes the body on every access, so read it once
+                robots_txt = response.text
+
                 # Parse sitemap URLs from robots.txt
-                for line in response.text.splitlines():
-                    line = line.strip()
-                    if line.lower().startswith("sitemap:"):
-                        sitemap_url = line.split(":", 1)[1].strip()
-                        self.sitemap_urls_from_robots.append(sitemap_url)
+                self.sitemap_urls_from_robots.extend(_ROBOTS_SITEMAP.findall(robots_txt))
 
                 # Also load into robot parser for can_fetch checks
                 # Note: We can't use read() after fetching manually, so we parse the content
                 self.robot_parser.set_url(robots_url)
-                self.robot_parser.parse(response.text.splitlines())
+                self.robot_parser.parse(robots_txt.splitlines())
+                self._robots_rules = _RobotsRules(self.robot_parser, user_agent)
                 self.robots_loaded = True
                 robots_loaded_from = robots_url
                 break  # Successfully loaded, stop trying
@@ -190,49 +508,57 @@ class DocumentCrawler:
         else:
             logger.info("[CRAWLER] No robots.txt found, proceeding without restrictions")
 
+    def close(self):
+        """Close the crawler's HTTP session and release pooled connections."""
+        self.session.close()
+
     def discover_and_crawl(self) -> list[dict[str, Any]]:
         """Discover URLs using sitemap or recursive crawl, plus manual URLs.
 
         Returns:
             List of URL info dicts with 'url' and optional metadata
         """
-        urls = []
+        # Deduplicate as URLs are discovered (later entries, e.g. sitemap URLs with lastmod, win)
+        unique_urls: dict[str, dict[str, Any]] = {}
 
         # Add manual URLs if provided
         if self.manual_urls:
             logger.info(f"[CRAWLER] Adding {len(self.manual_urls)} manual URLs")
-            urls.extend([{"url": self._normalize_url(url)} for url in self.manual_urls])
+            for url in self.manual_urls:
+                url = self._normalize_url(url)
+                unique_urls[url] = {"url": url}
 
         # If manual_urls_only, skip crawling
         if self.manual_urls_only:
             logger.info("[CRAWLER] Manual URLs only mode, skipping automated crawling")
-            return urls
+            return list(unique_urls.values())
 
         # Try sitemap first
         sitemap_urls = self._discover_sitemap()
         if sitemap_urls:
             logger.info(f"[CRAWLER] Found {len(sitemap_urls)} URLs from sitemap")
-            urls.extend(sitemap_urls)
+            discovered = sitemap_urls
         else:
             # Fallback to recursive crawl
             logger.info("[CRAWLER] No sitemap found, falling back to recursive crawl")
-            crawled_urls = self._recursive_crawl()
-            logger.info(f"[CRAWLER] Recursive crawl found {len(crawled_urls)} URLs")
-            urls.extend(crawled_urls)
-
-        # Deduplicate
-        unique_urls = {url_info["url"]: url_info for url_info in urls}
-        result = list(unique_urls.values())
+            discovered = self._recursive_crawl()
+            logger.info(f"[CRAWLER] Recursive crawl found {len(discovered)} URLs")
+        for url_info in discovered:
+            unique_urls[url_info["url"]] = url_info
 
         # Sort globally by lastmod (newest first) before applying max_pages limit
         # This ensures we get the most recent content regardless of sitemap structure
         # URLs without lastmod dates sort to the end
-        result.sort(key=lambda x: x.get("lastmod") or "", reverse=True)
-
-        # Apply max_pages limit
-        if self.max_pages and len(result) > self.max_pages:
-            logger.info(f"[CRAWLER] Limiting to {self.max_pages} pages (found {len(result)})")
-            result = result[: self.max_pages]
+        def sort_key(url_info: dict[str, Any]) -> str:
+            return url_info.get("lastmod") or ""
+
+        # Apply max_pages limit; nlargest keeps only the newest max_pages entries instead of
+        # sorting every discovered URL (same order as a stable reverse sort, ties included)
+        if self.max_pages and len(unique_urls) > self.max_pages:
+            logger.info(f"[CRAWLER] Limiting to {self.max_pages} pages (found {len(unique_urls)})")
+            result = heapq.nlargest(self.max_pages, unique_urls.values(), key=sort_key)
+        else:
+            result = _sort_by_lastmod(list(unique_urls.values()))
 
         logger.info(f"[CRAWLER] Total unique URLs: {len(result)}")
         return result
@@ -254,6 +580,7 @@ class DocumentCrawler:
                 f"{self.base_url}/sitemap.xml",
                 f"{self.base_url}/sitemap_index.xml",
                 f"{self.base_url}/server-sitemap.xml",
+                f"{self.base_url}/sitemap.xml.gz",  # Inflated while parsing
             ]
         )
 
@@ -262,12 +589,8 @@ class DocumentCrawler:
         for idx, sitemap_url in enumerate(sitemap_urls, 1):
             try:
                 logger.info(f"[CRAWLER] [{idx}/{len(sitemap_urls)}] Trying sitemap: {sitemap_url}")
-                headers = {"User-Agent": self.user_agent, "Accept-Encoding": "gzip, deflate"}
-                response = requests.get(sitemap_url, headers=headers, timeout=self.request_timeout)
-                response.raise_for_status()
-
-                # Parse the sitemap
-                urls = self._parse_sitemap_xml(response.content)
+                # Parse the sitemap as it downloads
+                urls = self._fetch_and_parse_sitemap(sitemap_url)
                 if urls:
                     logger.info(f"[CRAWLER] ✓ Successfully parsed sitemap from {sitemap_url}")
                     return urls
@@ -281,157 +604,182 @@ class DocumentCrawler:
         logger.info("[CRAWLER] No sitemap found at common locations")
         return []
 
-    def _parse_sitemap_xml(self, xml_content: bytes) -> list[dict[str, Any]]:
+    def _fetch_and_parse_sitemap(
+        self, sitemap_url: str, validators: dict[str, str] | None = None
+    ) -> list[dict[str, Any]] | None:
+        """Fetch a sitemap and parse it while the body streams in.
+
+        Args:
+            sitemap_url: URL of the sitemap (or sitemap index)
+            validators: Optional 'etag' / 'last_modified' from the previous fetch. They are sent
+                as If-None-Match / If-Modified-Since and replaced with the response's validators.
+
+        Returns:
+            List of URL info dicts, or None if the server answered 304 Not Modified
+        """
+        headers = _conditional_headers(validators)
+        with self.session.get(sitemap_url, headers=headers, timeout=self.request_timeout, stream=True) as response:
+            self._rate_limiter.record(response)
+            if response.status_code == 304:
+                if validators is not None:
+                    validators.update(_response_validators(response))
+                return None
+            response.raise_for_status()
+            if validators is not None:
+                validators.clear()
+                validators.update(_response_validators(response))
+            response.raw.decode_content = True  # Let urllib3 undo gzip/deflate transfer encoding
+            response.raw.auto_close = False  # io.BufferedReader reads past the end; the with block closes it
+            body = io.BufferedReader(response.raw)
+            # sitemap.xml.gz files are gzip bodies served without Content-Encoding; inflate while parsing
+            if body.peek(2)[:2] == _GZIP_MAGIC:
+                body = gzip.GzipFile(fileobj=body)
+            return self._parse_sitemap_xml(body)
+
+    def _parse_sitemap_xml(self, xml_content: bytes | IO[bytes]) -> list[dict[str, Any]]:
         """Parse sitemap XML content.
 
         Args:
-            xml_content: Raw XML bytes
+            xml_content: Raw XML bytes, or a file-like object to stream them from
 
         Returns:
             List of URL info dicts
         """
         try:
-            tree = ET.fromstring(xml_content)
-
-            # Handle XML namespace
-            namespace = {"ns": "http://www.sitemaps.org/schemas/sitemap/0.9"}
+            if isinstance(xml_content, bytes):
+                xml_content = io.BytesIO(xml_content)
 
             urls = []
+            sub_sitemaps = []
+            # Page URLs are normalized and filtered as they are parsed
+            for kind, loc, lastmod in _iter_sitemap_entries(xml_content, self._filter_sitemap_url):
+                if kind == "sitemap":
+                    sub_sitemaps.append({"url": loc, "lastmod": lastmod})
+                else:
+                    urls.append({"url": loc, "lastmod": lastmod})
 
             # Check if this is a sitemap index (contains <sitemap> elements)
-            # Note: Use explicit 'is not None' checks because empty XML elements are falsy
-            sitemap_elements = tree.findall("ns:sitemap", namespace)
-            if not sitemap_elements:
-                sitemap_elements = tree.findall("sitemap")
-            if sitemap_elements:
-                logger.info(f"[CRAWLER] Found sitemap index with {len(sitemap_elements)} sub-sitemaps")
-
-                # Load sitemap cache for lastmod-based invalidation
-                sitemap_cache = self._load_sitemap_cache()
-                cached_sitemaps = sitemap_cache.get("sub_sitemaps", {})
-
-                # Collect sub-sitemaps with their lastmod dates
-                sub_sitemaps = []
-                for sitemap_elem in sitemap_elements:
-                    loc = sitemap_elem.find("ns:loc", namespace)
-                    if loc is None:
-                        loc = sitemap_elem.find("loc")
-                    lastmod = sitemap_elem.find("ns:lastmod", namespace)
-                    if lastmod is None:
-                        lastmod = sitemap_elem.find("lastmod")
-                    if loc is not None and loc.text:
-                        sub_sitemaps.append({"url": loc.text, "lastmod": lastmod.text if lastmod is not None else None})
-
-                # Sort sub-sitemaps by lastmod (newest first) to prioritize recent content
-                sub_sitemaps.sort(key=lambda x: x.get("lastmod") or "", reverse=True)
-
-                # Check cache hits vs misses
-                cache_hits = 0
-                cache_misses = 0
-                for sm in sub_sitemaps:
-                    cached = cached_sitemaps.get(sm["url"])
-                    if cached and cached.get("lastmod") == sm.get("lastmod") and sm.get("lastmod"):
-                        cache_hits += 1
-                    else:
-                        cache_misses += 1
-
-                logger.info(f"[CRAWLER] Processing sub-sitemaps: {cache_hits} cached, {cache_misses} to fetch...")
-
-                # Track updates for saving cache
-                updated_cache = {"sub_sitemaps": {}}
-
-                # Parse each sub-sitemap in order with progress bar
-                pbar = tqdm(
-                    sub_sitemaps,
-                    desc="Parsing sitemaps",
-                    unit="sitemap",
-                    disable=not self.show_progress,
-                    file=sys.stderr,
-                )
-                for sitemap_info in pbar:
-                    sitemap_url = sitemap_info["url"]
-                    sitemap_lastmod = sitemap_info.get("lastmod")
-                    sitemap_name = sitemap_url.split("/")[-1]
-
-                    try:
-                        # Check if we have a valid cache hit
-                        cached = cached_sitemaps.get(sitemap_url)
-                        if cached and cached.get("lastmod") == sitemap_lastmod and sitemap_lastmod:
-                            # Cache hit - use cached URLs
-                            pbar.set_postfix_str(f"{sitemap_name[:20]} (cached)", refresh=True)
-                            sub_urls = cached.get("urls", [])
-                            urls.extend(sub_urls)
-                            # Preserve in updated cache
-                            updated_cache["sub_sitemaps"][sitemap_url] = cached
-                        else:
-                            # Cache miss - fetch fresh
-                            pbar.set_postfix_str(f"{sitemap_name[:20]} (fetching)", refresh=True)
-
-                            headers = {"User-Agent": self.user_agent, "Accept-Encoding": "gzip, deflate"}
-                            response = requests.get(sitemap_url, headers=headers, timeout=self.request_timeout)
-                            response.raise_for_status()
-                            sub_urls = self._parse_sitemap_xml(response.content)
-                            urls.extend(sub_urls)
-
-                            # Update cache with new data
-                            updated_cache["sub_sitemaps"][sitemap_url] = {
-                                "lastmod": sitemap_lastmod,
-                                "urls": sub_urls,
-                            }
-
-                            time.sleep(self.rate_limit_delay)
-
-                        # Update progress bar with URL count
-                        pbar.set_postfix_str(f"{len(urls)} URLs found", refresh=True)
-
-                    except Exception as e:
-                        logger.warning(f"[CRAWLER] Failed to parse sub-sitemap {sitemap_url}: {e}")
-
-                # Save updated cache
-                self._save_sitemap_cache(updated_cache)
-
-                logger.info(f"[CRAWLER] Finished parsing {len(sub_sitemaps)} sub-sitemaps, total URLs: {len(urls)}")
-                return urls
-
-            # Regular sitemap with <url> elements
-            url_elements = tree.findall("ns:url", namespace)
-            if not url_elements:
-                url_elements = tree.findall("url")
-            for url_elem in url_elements:
-                loc = url_elem.find("ns:loc", namespace)
-                if loc is None:
-                    loc = url_elem.find("loc")
-                lastmod = url_elem.find("ns:lastmod", namespace)
-                if lastmod is None:
-                    lastmod = url_elem.find("lastmod")
-
-                if loc is not None and loc.text:
-                    url = self._normalize_url(loc.text)
-
-                    # Filter by patterns
-                    if not self._should_crawl_url(url):
-                        continue
-
-                    urls.append({"url": url, "lastmod": lastmod.text if lastmod is not None else None})
+            if sub_sitemaps:
+                logger.info(f"[CRAWLER] Found sitemap index with {len(sub_sitemaps)} sub-sitemaps")
+                return self._parse_sub_sitemaps(sub_sitemaps)
 
             # Sort by lastmod (newest first) - URLs without lastmod go to the end
-            urls.sort(key=lambda x: x.get("lastmod") or "", reverse=True)
-
-            return urls
+            return _sort_by_lastmod(urls)
 
         except Exception as e:
             logger.error(f"[CRAWLER] Failed to parse sitemap XML: {e}")
             return []
 
+    def _filter_sitemap_url(self, loc: str) -> str | None:
+        """Normalize a sitemap page URL, returning None if the URL patterns exclude it."""
+        url = self._normalize_url(loc)
+        return url if self._should_crawl_url(url) else None
+
+    def _parse_sub_sitemaps(self, sub_sitemaps: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Fetch and parse the sub-sitemaps listed in a sitemap index.
+
+        Args:
+            sub_sitemaps: Dicts with the sub-sitemap 'url' and 'lastmod'
+
+        Returns:
+            List of URL info dicts from all sub-sitemaps
+        """
+        urls = []
+
+        # Load sitemap cache for lastmod-based invalidation
+        sitemap_cache = self._load_sitemap_cache()
+        cached_sitemaps = sitemap_cache.get("sub_sitemaps", {})
+
+        # Sort sub-sitemaps by lastmod (newest first) to prioritize recent content
+        sub_sitemaps = _sort_by_lastmod(sub_sitemaps)
+
+        # Check cache hits vs misses
+        cache_hits = 0
+        cache_misses = 0
+        for sm in sub_sitemaps:
+            cached = cached_sitemaps.get(sm["url"])
+            if cached and cached.get("lastmod") == sm.get("lastmod") and sm.get("lastmod"):
+                cache_hits += 1
+            else:
+                cache_misses += 1
+
+        logger.info(f"[CRAWLER] Processing sub-sitemaps: {cache_hits} cached, {cache_misses} to fetch...")
+
+        # Track updates for saving cache
+        updated_cache = {"sub_sitemaps": {}}
+
+        # Fetch cache misses in parallel; results are collected in sorted order with progress bar
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="sitemap-fetch") as executor:
+            futures = [executor.submit(self._load_sub_sitemap, sm, cached_sitemaps) for sm in sub_sitemaps]
+            pbar = tqdm(
+                zip(sub_sitemaps, futures, strict=True),
+                total=len(sub_sitemaps),
+                desc="Parsing sitemaps",
+                unit="sitemap",
+                disable=not self.show_progress,
+                file=sys.stderr,
+            )
+            for sitemap_info, future in pbar:
+                sitemap_url = sitemap_info["url"]
+                try:
+                    entry = future.result()
+                except Exception as e:
+                    logger.warning(f"[CRAWLER] Failed to parse sub-sitemap {sitemap_url}: {e}")
+                    continue
+
+                urls.extend(entry.get("urls", []))
+                updated_cache["sub_sitemaps"][sitemap_url] = entry
+
+                # Update progress bar with URL count
+                pbar.set_postfix_str(f"{len(urls)} URLs found", refresh=True)
+
+        # Save updated cache
+        self._save_sitemap_cache(updated_cache)
+
+        logger.info(f"[CRAWLER] Finished parsing {len(sub_sitemaps)} sub-sitemaps, total URLs: {len(urls)}")
+        return urls
+
+    def _load_sub_sitemap(self, sitemap_info: dict[str, Any], cached_sitemaps: dict[str, Any]) -> dict[str, Any]:
+        """Return the cache entry for a sub-sitemap, fetching it if its lastmod changed.
+
+        Args:
+            sitemap_info: Dict with the sub-sitemap 'url' and 'lastmod'
+            cached_sitemaps: Cached entries from the previous run, keyed by sub-sitemap URL
+
+        Returns:
+            Dict with 'lastmod', 'urls', and any 'etag' / 'last_modified' to store in the sitemap cache
+        """
+        sitemap_url = sitemap_info["url"]
+        sitemap_lastmod = sitemap_info.get("lastmod")
+
+        # Cache hit - reuse the URLs parsed last time
+        cached = cached_sitemaps.get(sitemap_url)
+        if cached and cached.get("lastmod") == sitemap_lastmod and sitemap_lastmod:
+            return cached
+
+        # Cache miss - fetch fresh, revalidating the cached copy if the server gave validators
+        validators = {key: cached[key] for key in ("etag", "last_modified") if cached and cached.get(key)}
+        self._rate_limiter.wait()
+        urls = self._fetch_and_parse_sitemap(sitemap_url, validators)
+        if urls is None:  # 304 - unchanged since it was cached
+            logger.debug(f"[CRAWLER] Sub-sitemap not modified: {sitemap_url}")
+            urls = cached.get("urls", []) if cached else []
+        return {"lastmod": sitemap_lastmod, "urls": urls, **validators}
+
     def _recursive_crawl(self) -> list[dict[str, Any]]:
         """Recursively crawl from base_url following links.
 
+        Pages are fetched in batches of up to max_workers; links found in a batch are queued
+        in the batch's order, so pages are discovered in the same breadth-first order as a
+        one-at-a-time crawl.
+
         Returns:
             List of URL info dicts
         """
-        visited: set[str] = set()
-        queued: set[str] = {self.base_url}  # Track URLs in queue for O(1) lookup
-        to_visit: list[tuple[str, int]] = [(self.base_url, 0)]  # (url, depth)
+        # Every URL ever queued, so each page is queued (and therefore visited) at most once.
+        # The strings are shared with to_visit and urls, so the set only costs its hash slots.
+        queued: set[str] = {self.base_url}
+        to_visit: deque[tuple[str, int]] = deque([(self.base_url, 0)])  # (url, depth)
         urls: list[dict[str, Any]] = []
 
         logger.info(f"[CRAWLER] Starting recursive crawl from {self.base_url} (max depth: {self.max_crawl_depth})...")
@@ -445,34 +793,58 @@ class DocumentCrawler:
             total=self.max_pages,  # If max_pages is set, use it as total
         )
 
-        while to_visit and (not self.max_pages or len(urls) < self.max_pages):
-            current_url, depth = to_visit.pop(0)
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="crawl-fetch") as executor:
+            while to_visit and (not self.max_pages or len(urls) < self.max_pages):
+                # Pop the next batch of crawlable pages, never exceeding max_pages
+                batch: list[tuple[str, int]] = []
+                batch_size = self.max_workers
+                if self.max_pages:
+                    batch_size = min(batch_size, self.max_pages - len(urls))
+                while to_visit and len(batch) < batch_size:
+                    current_url, depth = to_visit.popleft()
+
+                    # Skip if filtered out
+                    if not self._should_crawl_url(current_url):
+                        continue
 
-            # Skip if already visited
-            if current_url in visited:
-                continue
+                    urls.append({"url": current_url})
+                    batch.append((current_url, depth))
 
-            # Skip if max depth exceeded
-            if depth > self.max_crawl_depth:
-                continue
+                    # Update progress bar
+                    pbar.update(1)
+                    pbar.set_postfix_str(f"depth={depth}, queue={len(to_visit)}", refresh=True)
 
-            # Skip if filtered out
-            if not self._should_crawl_url(current_url):
-                continue
+                # Links from pages at max depth would be skipped, so those pages aren't fetched
+                batch = [(page_url, depth) for page_url, depth in batch if depth < self.max_crawl_depth]
 
-            visited.add(current_url)
-            urls.append({"url": current_url})
+                # Fetch the batch in parallel, then queue new links (use queued set for O(1) lookup)
+                page_links = executor.map(self._extract_links, [page_url for page_url, _ in batch])
+                for (_, depth), links in zip(batch, page_links, strict=True):
+                    for href in links:
+                        if href not in queued:
+                            queued.add(href)
+                            to_visit.append((href, depth + 1))
 
-            # Update progress bar
-            pbar.update(1)
-            pbar.set_postfix_str(f"depth={depth}, queue={len(to_visit)}", refresh=True)
+        pbar.close()
+        return urls
 
-            # Fetch page and extract links
-            try:
-                time.sleep(self.rate_limit_delay)
+    def _extract_links(self, current_url: str) -> list[str]:
+        """Fetch a page during recursive crawl and return its same-site links.
+
+        Args:
+            current_url: URL of the page to fetch
 
-                headers = {"User-Agent": self.user_agent, "Accept-Encoding": "gzip, deflate"}
-                response = requests.get(current_url, headers=headers, timeout=self.request_timeout)
+        Returns:
+            Normalized absolute URLs linked from the page (empty on errors or non-HTML content)
+        """
+        links = []
+        try:
+            self._rate_limiter.wait()
+
+            # Stream so the body is only downloaded once the response is known to be HTML
+            response = self.session.get(current_url, timeout=self.request_timeout, stream=True)
+            try:
+                self._rate_limiter.record(response)
                 response.raise_for_status()
 
                 # Only parse HTML content, skip XML/RSS/etc
@@ -481,40 +853,63 @@ class DocumentCrawler:
                     logger.debug(
                         f"[CRAWLER] Skipping non-HTML content during recursive crawl: {current_url} ({content_type})"
                     )
+                    return links
+                if _exceeds_page_size_limit(response):
+                    logger.warning(f"[CRAWLER] Skipping oversized page during recursive crawl: {current_url}")
+                    return links
+
+                content = response.content
+            finally:
+                response.close()
+
+            # Parse the raw bytes with lxml's C parser; it detects <meta charset> itself,
+            # so only pass an encoding when the server declared one
+            encoding = response.encoding if "charset=" in content_type.lower() else None
+            root = etree.fromstring(content, lxml.html.HTMLParser(encoding=encoding))
+            if root is None:  # Empty document
+                return links
+
+            # Root-relative links ("/docs/x") resolve to the page's own origin, which is already on the site
+            page = urlsplit(current_url)
+            page_origin = f"{page.scheme}://{page.netloc}" if self._same_site_netloc(page.netloc) else None
+
+            # Extract all links
+            for link in root.iter("a"):
+                href = link.get("href")
+                if href is None:
                     continue
 
-                soup = BeautifulSoup(response.text, "html.parser")
+                # Skip same-page anchors
+                if href.startswith("#"):
+                    continue
 
-                # Extract all links
-                for link in soup.find_all("a", href=True):
-                    href = link["href"]
+                # Fast path: plain root-relative links need no urljoin/urlsplit
+                if page_origin and href[:1] == "/" and href[1:2] != "/" and not _NEEDS_URLJOIN.search(href):
+                    links.append(self._normalize_url(page_origin + href))
+                    continue
 
-                    # Skip non-http links
-                    if href.startswith(("mailto:", "tel:", "#", "javascript:")):
-                        continue
+                # Make absolute URL, then split it once to drop non-http links (mailto:, tel:,
+                # javascript:, ...) and external or protocol-relative links to other hosts
+                # (_same_site_netloc handles www/non-www). Plain absolute http(s) links with a host
+                # are already what urljoin() would return, so they are only split.
+                parts = None
+                if href.startswith(("http://", "https://")) and not _NEEDS_URLJOIN.search(href):
+                    parts = urlsplit(href)
+                if parts is None or not parts.netloc:
+                    href = urljoin(current_url, href)
+                    parts = urlsplit(href)
+                if parts.scheme not in ("http", "https") or not self._same_site_netloc(parts.netloc):
+                    continue
 
-                    # Make absolute URL
-                    if href.startswith("/"):
-                        href = urljoin(self.base_url, href)
-                    elif not href.startswith("http"):
-                        href = urljoin(current_url, href)
-                    else:
-                        # Skip external links (use _is_same_site to handle www/non-www)
-                        if not self._is_same_site(href):
-                            continue
-
-                    # Normalize and add to queue (use queued set for O(1) lookup)
-                    href = self._normalize_url(href)
-                    if href not in visited and href not in queued:
-                        queued.add(href)
-                        to_visit.append((href, depth + 1))
+                links.append(self._normalize_url(href))
 
-            except Exception as e:
-                logger.warning(f"[CRAWLER] Failed to crawl {current_url}: {e}")
-                continue
+        except requests.exceptions.Timeout as e:
+            self._rate_limiter.backoff()
+            logger.warning(f"[CRAWLER] Failed to crawl {current_url}: {e}")
+        except Exception as e:
+            logger.warning(f"[CRAWLER] Failed to crawl {current_url}: {e}")
 
-        pbar.close()
-        return urls
+        return links
 
     def fetch_page(self, url: str) -> tuple[str, str, int] | None:
         """Fetch a single page and return (url, html_content, status_code).
@@ -526,52 +921,115 @@ class DocumentCrawler:
             Tuple of (url, html_content, status_code) or None if blocked by robots.txt
             On HTTP errors, returns (url, "", status_code) to allow status tracking
         """
+        result = self.fetch_page_conditional(url)
+        return result[:3] if result else None
+
+    def fetch_page_conditional(
+        self, url: str, etag: str | None = None, last_modified: str | None = None
+    ) -> tuple[str, str, int, dict[str, str]] | None:
+        """Fetch a page, revalidating a previously fetched copy when validators are given.
+
+        Sends If-None-Match / If-Modified-Since; a 304 response carries no body, so the
+        caller reuses its cached content.
+
+        Args:
+            url: URL to fetch
+            etag: ETag from the previous response, if any
+            last_modified: Last-Modified from the previous response, if any
+
+        Returns:
+            Tuple of (url, html_content, status_code, validators) or None if blocked by robots.txt
+            validators holds the response's 'etag' / 'last_modified' for the next revalidation.
+            On 304 and HTTP errors, html_content is "" (status_code tells them apart).
+        """
+        validators: dict[str, str] = {}
         try:
             # Check robots.txt only if it loaded successfully
             if self.robots_loaded:
-                if not self.robot_parser.can_fetch(self.user_agent, url):
+                if not self._robots_rules.can_fetch(url):
                     logger.warning(f"[CRAWLER] robots.txt disallows: {url}")
                     return None  # No status code - blocked before request
             else:
                 logger.debug(f"[CRAWLER] Skipping robots.txt check (not loaded) for: {url}")
 
+            # Page fetches are only throttled while the server is asking for backoff
+            self._rate_limiter.wait(backoff_only=True)
+
             logger.debug(f"[CRAWLER] Fetching: {url}")
-            # Explicitly set Accept-Encoding to avoid Brotli issues (some servers send br but decompression can fail)
-            headers = {
-                "User-Agent": self.user_agent,
-                "Accept-Encoding": "gzip, deflate",  # Exclude 'br' (Brotli) to avoid decompression errors
-            }
-            response = requests.get(url, headers=headers, timeout=self.request_timeout)
-            status_code = response.status_code
-
-            # Verify final URL is still within base domain (blocks redirects to external sites)
-            # Use _is_same_site() to handle www/non-www redirects (e.g., example.com -> www.example.com)
-            final_url = response.url
-            if not self._is_same_site(final_url):
-                logger.warning(f"[CRAWLER] Redirect to external domain blocked: {url} -> {final_url}")
-                return (url, "", status_code)  # Return status but no content
-
-            # Check for HTTP errors
-            if not response.ok:
-                logger.warning(f"[CRAWLER] HTTP {status_code} for {url}")
-                return (url, "", status_code)
-
-            # Only process HTML content
-            content_type = response.headers.get("content-type", "")
-            if "text/html" not in content_type:
-                logger.warning(f"[CRAWLER] Skipping non-HTML content: {url} ({content_type})")
-                return (url, "", status_code)
-
-            return (url, response.text, status_code)
+            headers = _conditional_headers({"etag": etag, "last_modified": last_modified})
+            # Stream so only headers are read until the response is known to be HTML; closing an
+            # unread response drops the connection instead of downloading PDFs, archives, etc.
+            response = self.session.get(url, headers=headers, timeout=self.request_timeout, stream=True)
+            try:
+                return self._read_page_response(url, response, validators)
+            finally:
+                response.close()
 
         except requests.exceptions.HTTPError as e:
             status_code = e.response.status_code if e.response is not None else 0
             logger.error(f"[CRAWLER] HTTP {status_code} for {url}: {e}")
-            return (url, "", status_code)
+            return (url, "", status_code, validators)
+
+        except requests.exceptions.Timeout as e:
+            self._rate_limiter.backoff()
+            logger.error(f"[CRAWLER] Failed to fetch {url}: {e}")
+            return (url, "", 0, validators)  # 0 indicates network/connection error
 
         except Exception as e:
             logger.error(f"[CRAWLER] Failed to fetch {url}: {e}")
-            return (url, "", 0)  # 0 indicates network/connection error
+            return (url, "", 0, validators)  # 0 indicates network/connection error
+
+    async def afetch_page(self, url: str) -> tuple[str, str, int] | None:
+        """Async variant of fetch_page for fetching many pages with asyncio.gather().
+
+        The blocking fetch runs in a worker thread and shares the pooled session and
+        rate limiter with the synchronous API.
+        """
+        return await asyncio.to_thread(self.fetch_page, url)
+
+    async def afetch_page_conditional(
+        self, url: str, etag: str | None = None, last_modified: str | None = None
+    ) -> tuple[str, str, int, dict[str, str]] | None:
+        """Async variant of fetch_page_conditional (see afetch_page)."""
+        return await asyncio.to_thread(self.fetch_page_conditional, url, etag, last_modified)
+
+    def _read_page_response(
+        self, url: str, response: requests.Response, validators: dict[str, str]
+    ) -> tuple[str, str, int, dict[str, str]]:
+        """Check a streamed page response's status and headers, reading the body only for HTML."""
+        status_code = response.status_code
+        self._rate_limiter.record(response)
+
+        # Verify final URL is still within base domain (blocks redirects to external sites)
+        # Use _is_same_site() to handle www/non-www redirects (e.g., example.com -> www.example.com)
+        final_url = response.url
+        if not self._is_same_site(final_url):
+            logger.warning(f"[CRAWLER] Redirect to external domain blocked: {url} -> {final_url}")
+            return (url, "", status_code, validators)  # Return status but no content
+
+        validators.update(_response_validators(response))
+
+        # Not modified since the cached copy - nothing to download
+        if status_code == 304:
+            logger.debug(f"[CRAWLER] Not modified: {url}")
+            return (url, "", status_code, validators)
+
+        # Check for HTTP errors
+        if not response.ok:
+            logger.warning(f"[CRAWLER] HTTP {status_code} for {url}")
+            return (url, "", status_code, validators)
+
+        # Only process HTML content
+        content_type = response.headers.get("content-type", "")
+        if "text/html" not in content_type:
+            logger.warning(f"[CRAWLER] Skipping non-HTML content: {url} ({content_type})")
+            return (url, "", status_code, validators)
+
+        if _exceeds_page_size_limit(response):
+            logger.warning(f"[CRAWLER] Skipping oversized page: {url} ({response.headers['content-length']} bytes)")
+            return (url, "", status_code, validators)
+
+        return (url, response.text, status_code, validators)
 
     def _normalize_url(self, url: str) -> str:
         """Normalize URL by removing query params, anchors, trailing slashes.
@@ -582,11 +1040,7 @@ class DocumentCrawler:
         Returns:
             Normalized URL
         """
-        # Remove query params and anchors
-        url = url.split("?")[0].split("#")[0]
-        # Remove trailing slash
-        url = url.rstrip("/")
-        return url
+        return _normalize_url(url)
 
     def _is_same_site(self, url: str) -> bool:
         """Check if URL is on the same site as base_url (treating www. as equivalent to apex).
@@ -599,14 +1053,11 @@ class DocumentCrawler:
         Returns:
             True if URL is on the same site as base_url
         """
+        return self._same_site_netloc(urlsplit(url).netloc)
 
-        def normalize_domain(domain: str) -> str:
-            return domain.lower().removeprefix("www.")
-
-        parsed_base = urlparse(self.base_url)
-        parsed_url = urlparse(url)
-
-        return normalize_domain(parsed_base.netloc) == normalize_domain(parsed_url.netloc)
+    def _same_site_netloc(self, netloc: str) -> bool:
+        """Check if a URL's netloc belongs to base_url's site (treating www. as equivalent to apex)."""
+        return netloc in self._site_netlocs or netloc.lower().removeprefix("www.") == self._site_domain
 
     def _should_crawl_url(self, url: str) -> bool:
         """Check if URL should be crawled based on include/exclude patterns.
@@ -618,16 +1069,12 @@ class DocumentCrawler:
             True if URL should be crawled
         """
         # Check exclude patterns first
-        for pattern in self.url_exclude_patterns:
-            if pattern.search(url):
-                logger.debug(f"[CRAWLER] Excluded by pattern: {url}")
-                return False
+        if self._exclude_matcher is not None and self._exclude_matcher.search(url):
+            logger.debug(f"[CRAWLER] Excluded by pattern: {url}")
+            return False
 
         # If include patterns specified, URL must match at least one
-        if self.url_include_patterns:
-            for pattern in self.url_include_patterns:
-                if pattern.search(url):
-                    return True
+        if self._include_matcher is not None and not self._include_matcher.search(url):
             logger.debug(f"[CRAWLER] Not included by any pattern: {url}")
             return False
 
@@ -9,24 +9,34 @@ Main class for building and searching document indexes using:
 """
 
 import hashlib
+import heapq
 import json
 import logging
+import math
 import os
+import pickle
 import sys
+import threading
 import time
+from collections import Counter
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
+from operator import itemgetter
 from pathlib import Path
 from typing import Any
 
+import faiss
+import numpy as np
 import torch
 import trafilatura
 from bs4 import BeautifulSoup
 from langchain.retrievers import EnsembleRetriever
 from langchain_community.retrievers import BM25Retriever
+from langchain_community.retrievers.bm25 import default_preprocessing_func
 from langchain_community.vectorstores import FAISS
 from langchain_core.documents import Document
 from langchain_huggingface import HuggingFaceEmbeddings
+from rank_bm25 import BM25Okapi
 from sentence_transformers import CrossEncoder
 from tqdm import tqdm
 
@@ -35,8 +45,60 @@ from .config import RAGConfig
 from .contextualizer import ChunkContextualizer
 from .crawler import DocumentCrawler
 
+# Optional: faster JSON encode/decode for the chunk and parent chunk caches
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 logger = logging.getLogger(__name__)
 
+# HNSW graph parameters for faiss_index_type="hnsw": neighbors per node, build-time and
+# search-time candidate list sizes (efSearch is persisted with the index)
+_HNSW_M = 32
+_HNSW_EF_CONSTRUCTION = 200
+_HNSW_EF_SEARCH = 64
+
+# Bump when semantic_chunk_html() output changes so chunk_cache.json entries are discarded
+_CHUNK_CACHE_VERSION = 1
+
+# Incremental updates smaller than this skip chunk_cache.json entirely; re-reading and rewriting
+# the whole cache costs more than re-chunking a handful of pages
+_CHUNK_CACHE_MIN_PAGES = 20
+
+
+def _bm25_idf(vectorizer: BM25Okapi, nd: Counter[str]) -> dict[str, float]:
+    """Compute BM25Okapi IDF values from document frequencies.
+
+    Same formula as rank_bm25: log((N - n + 0.5) / (n + 0.5)), with negative values
+    floored to epsilon * average IDF.
+    """
+    idf = {word: math.log(vectorizer.corpus_size - freq + 0.5) - math.log(freq + 0.5) for word, freq in nd.items()}
+    vectorizer.average_idf = sum(idf.values()) / len(idf)
+    eps = vectorizer.epsilon * vectorizer.average_idf
+    return {word: value if value >= 0 else eps for word, value in idf.items()}
+
+
+def _extend_bm25(vectorizer: BM25Okapi, nd: Counter[str], corpus: list[list[str]]):
+    """Append tokenized documents to a BM25Okapi model in place.
+
+    Term counts, lengths and document frequencies (nd, word -> number of documents containing
+    it) are updated for the new documents only; IDF is then recomputed per vocabulary term.
+    """
+    added_tokens = 0
+    for document in corpus:
+        frequencies = Counter(document)
+        vectorizer.doc_freqs.append(frequencies)
+        vectorizer.doc_len.append(len(document))
+        nd.update(frequencies.keys())
+        added_tokens += len(document)
+    total_tokens = vectorizer.avgdl * vectorizer.corpus_size + added_tokens
+    vectorizer.corpus_size += len(corpus)
+    vectorizer.avgdl = total_tokens / vectorizer.corpus_size
+    vectorizer.idf = _bm25_idf(vectorizer, nd)
+
 
 class DocSearchIndex:
     """Main document search index with crawling, chunking, embedding, and hybrid search."""
@@ -81,13 +143,16 @@ class DocSearchIndex:
         self.chunks_file = self.cache_dir / "chunks.json"
         self.parent_chunks_file = self.cache_dir / "parent_chunks.json"
         self.crawl_state_file = self.cache_dir / "crawl_state.json"
+        self.chunk_cache_file = self.cache_dir / "chunk_cache.json"
 
         # Components (lazy-loaded)
         self.embeddings: HuggingFaceEmbeddings | None = None
         self.vectorstore: FAISS | None = None
+        self._faiss_mmapped = False  # vectorstore.index maps index.faiss (faiss_mmap) and must not be modified
         self.bm25_retriever: BM25Retriever | None = None
         self.ensemble_retriever: EnsembleRetriever | None = None
         self.cross_encoder: CrossEncoder | None = None
+        self._components_lock = threading.Lock()  # Serializes model loading (load_index loads in background)
 
         # Storage
         self.chunks: list[Document] = []
@@ -350,7 +415,8 @@ class DocSearchIndex:
         refreshed_urls = {page["url"] for page in new_pages if not page.get("from_cache")}
 
         # If resuming/expanding/refreshing, load existing chunks first
-        if is_resuming or is_expanding or is_refreshing:
+        full_rebuild = not (is_resuming or is_expanding or is_refreshing)
+        if not full_rebuild:
             logger.info("[RAG] Loading existing chunks for incremental update...")
             existing_chunks = self._load_chunks() or []
             existing_parent_chunks = self._load_parent_chunks() or {}
@@ -402,7 +468,7 @@ class DocSearchIndex:
 
         # Create chunks from pages
         new_chunk_count_before = len(self.chunks)
-        page_contents = self._create_chunks(pages_to_chunk)
+        page_contents = self._create_chunks(pages_to_chunk, full_rebuild=full_rebuild)
         new_chunk_count = len(self.chunks) - new_chunk_count_before
 
         logger.info(
@@ -500,33 +566,56 @@ class DocSearchIndex:
 
         Attempts to load the persisted FAISS index first for fast startup.
         Falls back to rebuilding from chunks if the saved index is missing or corrupted.
-        BM25 retriever is always rebuilt (not persisted) but this is fast.
+        The BM25 statistics are loaded from index/bm25.pkl when they match the cached chunks.
         Also starts the periodic updater if enabled.
         """
         logger.info("[RAG] Loading index from cache...")
 
-        # Load chunks
-        self.chunks = self._load_chunks() or []
-        self.parent_chunks = self._load_parent_chunks() or {}
+        # Model loading is independent of reading the cache files, so start it first and
+        # join before the FAISS index (the first thing that needs embeddings) is loaded
+        model_future = None
+        if self.config.background_model_load and self.chunks_file.exists():
+            logger.info("[RAG] Initializing ML models (embeddings, re-rankers) in background...")
+            model_loader = ThreadPoolExecutor(max_workers=1, thread_name_prefix="rag-model-load")
+            model_future = model_loader.submit(self._initialize_components)
+            model_loader.shutdown(wait=False)
 
-        # Load tombstones for incremental updates
-        self._tombstoned_urls, self._tombstoned_chunk_ids = self._load_tombstones()
+        try:
+            # Load chunks
+            self.chunks = self._load_chunks() or []
+            self.parent_chunks = self._load_parent_chunks() or {}
 
-        # Rebuild child_to_parent mapping from chunk metadata
-        self.child_to_parent = {}
-        for chunk in self.chunks:
-            chunk_id = chunk.metadata.get("chunk_id")
-            parent_id = chunk.metadata.get("parent_id")
-            if chunk_id and parent_id:
-                self.child_to_parent[chunk_id] = parent_id
+            # Load tombstones for incremental updates
+            self._tombstoned_urls, self._tombstoned_chunk_ids = self._load_tombstones()
+
+            # Rebuild child_to_parent mapping from chunk metadata
+            self.child_to_parent = {}
+            for chunk in self.chunks:
+                chunk_id = chunk.metadata.get("chunk_id")
+                parent_id = chunk.metadata.get("parent_id")
+                if chunk_id and parent_id:
+                    self.child_to_parent[chunk_id] = parent_id
+
+            if self.chunks:
+                # Load BM25 retriever (persisted statistics are reused when the chunks are unchanged)
+                logger.info(f"[RAG] Loading BM25 keyword retriever for {len(self.chunks)} chunks...")
+                start = time.time()
+                self.bm25_retriever = self._build_bm25_retriever(self.chunks)
+                logger.info(f"[RAG] ✓ BM25 retriever ready in {time.time() - start:.1f}s")
+        finally:
+            # Join the background load on every path so its errors surface here and it
+            # never overlaps a later _initialize_components() call
+            if model_future is not None:
+                model_future.result()
 
         if not self.chunks:
             logger.warning("[RAG] No cached chunks found")
             return
 
-        # Initialize components
-        logger.info("[RAG] Initializing ML models (embeddings, re-rankers)...")
-        self._initialize_components()
+        # Initialize components (already done if loaded in the background)
+        if model_future is None:
+            logger.info("[RAG] Initializing ML models (embeddings, re-rankers)...")
+            self._initialize_components()
 
         # Try to load persisted FAISS index first (fast path)
         faiss_path = str(self.index_dir / "faiss_index")
@@ -539,9 +628,12 @@ class DocSearchIndex:
 
                 logger.info(f"[RAG] Loading persisted FAISS index from {faiss_path}...")
                 start = time.time()
-                self.vectorstore = FAISS.load_local(
-                    faiss_path, self.embeddings, allow_dangerous_deserialization=True  # Checksum verified above
-                )
+                self.vectorstore = self._load_faiss_vectorstore(faiss_path)
+                if not self._index_matches_config(self.vectorstore.index):
+                    raise ValueError(
+                        f"persisted index does not match faiss_index_type={self.config.faiss_index_type!r}, "
+                        f"embedding_dtype={self.config.embedding_dtype!r}"
+                    )
                 logger.info(f"[RAG] ✓ Loaded FAISS index in {time.time() - start:.1f}s")
                 faiss_loaded = True
             except Exception as e:
@@ -557,19 +649,9 @@ class DocSearchIndex:
 
             # Save the rebuilt index for next time
             logger.info(f"[RAG] Saving FAISS index to {faiss_path}...")
-            self.vectorstore.save_local(faiss_path)
-            self._save_faiss_checksum(faiss_path)
+            self._save_vectorstore(faiss_path)
             logger.info("[RAG] ✓ FAISS index saved")
 
-        # Build BM25 retriever (always rebuilt, fast)
-        logger.info(f"[RAG] Building BM25 keyword retriever from {len(self.chunks)} chunks...")
-        start = time.time()
-        self.bm25_retriever = BM25Retriever.from_documents(self.chunks)
-        self.bm25_retriever.k = (
-            self.config.search_top_k * self.config.retriever_candidate_multiplier
-        )  # Get more candidates for ensemble
-        logger.info(f"[RAG] ✓ BM25 retriever built in {time.time() - start:.1f}s")
-
         # Build ensemble retriever (hybrid search)
         logger.info(
             f"[RAG] Building hybrid ensemble retriever "
@@ -749,7 +831,6 @@ class DocSearchIndex:
         Returns:
             threading.Thread: The background thread (already started)
         """
-        import threading
 
         def _background_task():
             try:
@@ -911,6 +992,96 @@ class DocSearchIndex:
             f"(expected ~{expected_candidates} per retriever before RRF deduplication)"
         )
 
+        return self._finalize_results(query, candidates, top_k, return_parent)
+
+    def embed_queries(self, queries: list[str]) -> np.ndarray:
+        """Embed search queries in a single forward pass.
+
+        Args:
+            queries: Search queries
+
+        Returns:
+            float32 array of shape (len(queries), embedding_dim)
+        """
+        # embed_documents() matches embed_query() here since no query_encode_kwargs are set
+        return np.asarray(self.embeddings.embed_documents(queries), dtype=np.float32)
+
+    def search_batch(
+        self,
+        queries: list[str],
+        top_k: int | None = None,
+        return_parent: bool = True,
+        query_vectors: np.ndarray | None = None,
+    ) -> list[list[dict[str, Any]]]:
+        """Search the document index for several queries at once.
+
+        Produces the same results as calling search() per query, but all query
+        embeddings are computed in a single forward pass and the FAISS index is
+        searched with one batched call instead of one call per query.
+
+        Args:
+            queries: Search queries
+            top_k: Number of results to return per query (default from config)
+            return_parent: If True, return parent chunks for context
+            query_vectors: Optional precomputed embeddings from embed_queries(), reused
+                           to skip re-encoding when the same queries are searched again
+
+        Returns:
+            List of result lists, one per query in input order
+        """
+        if top_k is None:
+            top_k = self.config.search_top_k
+
+        if not self.ensemble_retriever:
+            logger.error("[RAG] Index not loaded, call load_index() or crawl_and_index() first")
+            return [[] for _ in queries]
+
+        if not queries:
+            return []
+
+        logger.debug(f"[RAG] Batch searching {len(queries)} queries")
+
+        # Embed all queries in one pass, then search FAISS with the whole (N, D) matrix
+        if query_vectors is None:
+            query_vectors = self.embed_queries(queries)
+        # Use the candidate counts the ensemble's retrievers were built with, as search() does,
+        # rather than the live config
+        bm25_retriever, semantic_retriever = self.ensemble_retriever.retrievers
+        _, indices = self.vectorstore.index.search(query_vectors, semantic_retriever.search_kwargs["k"])
+
+        all_results = []
+        for query, row in zip(queries, indices):
+            semantic_docs = []
+            for i in row:
+                if i == -1:
+                    continue
+                docstore_id = self.vectorstore.index_to_docstore_id[i]
+                doc = self.vectorstore.docstore.search(docstore_id)
+                if not isinstance(doc, Document):
+                    # Same error LangChain's FAISS similarity search raises
+                    raise ValueError(f"Could not find document for id {docstore_id}, got {doc}")
+                semantic_docs.append(doc)
+            bm25_docs = bm25_retriever.invoke(query)
+            # Same Reciprocal Rank Fusion the ensemble retriever applies in search()
+            candidates = self.ensemble_retriever.weighted_reciprocal_rank([bm25_docs, semantic_docs])
+            all_results.append(self._finalize_results(query, candidates, top_k, return_parent))
+
+        return all_results
+
+    def _finalize_results(
+        self, query: str, candidates: list[Document], top_k: int, return_parent: bool
+    ) -> list[dict[str, Any]]:
+        """Convert fused candidates to result dicts, filter tombstones, re-rank and truncate.
+
+        Args:
+            query: Search query (used by the cross-encoder)
+            candidates: Documents from hybrid retrieval, best first
+            top_k: Number of results to return
+            return_parent: If True, attach parent chunk content
+
+        Returns:
+            List of search results with content, metadata, and scores
+        """
         # Convert to result format
         results = []
         for doc in candidates:
@@ -938,7 +1109,7 @@ class DocSearchIndex:
 
         # Re-rank if enabled
         if self.config.rerank_enabled and results:
-            results = self._rerank_results(query, results)
+            results = self._rerank_results(query, results, top_k=top_k)
 
         # Return top-k
         return results[:top_k]
@@ -1122,10 +1293,23 @@ class DocSearchIndex:
         if cached:
             return cached
 
+        # An expired or outdated cache entry can still be revalidated with a conditional GET;
+        # on 304 Not Modified its content is reused without downloading the page again
+        stale = None if force_refresh else self._read_cached_page(url)
+        validators = (stale or {}).get("validators") or {}
+
         # Fetch fresh content
-        result = self.crawler.fetch_page(url)
+        result = self.crawler.fetch_page_conditional(
+            url, etag=validators.get("etag"), last_modified=validators.get("last_modified")
+        )
         if result:
-            url, html, status_code = result
+            url, html, status_code, validators = result
+
+            if status_code == 304 and stale and stale.get("html"):
+                logger.debug(f"[RAG] Not modified, reusing cached content: {url}")
+                revalidated = {**stale, "lastmod": lastmod, "validators": validators or stale.get("validators", {})}
+                self._save_cached_page(revalidated)  # Restart the TTL
+                return {**revalidated, "from_cache": True, "status_code": status_code}
 
             # If we got content, extract main content using readability
             clean_html = ""
@@ -1138,6 +1322,7 @@ class DocSearchIndex:
                 "lastmod": lastmod,
                 "from_cache": False,
                 "status_code": status_code,
+                "validators": validators,
             }
 
             # Only save to cache if we got content
@@ -1243,6 +1428,13 @@ class DocSearchIndex:
         url_hash = hashlib.sha256(url.encode()).hexdigest()[:32]
         return self.content_dir / f"{url_hash}.json"
 
+    def _read_cached_page(self, url: str) -> dict[str, Any] | None:
+        """Read a page's cache entry without validity checks (None if missing or unreadable)."""
+        try:
+            return json.loads(self._get_page_cache_path(url).read_text())
+        except Exception:
+            return None
+
     def _load_cached_page(self, url: str, lastmod: str | None, force_refresh: bool = False) -> dict[str, Any] | None:
         """Load cached page content if still valid.
 
@@ -1330,17 +1522,21 @@ class DocSearchIndex:
             logger.warning(f"[RAG] Failed to extract text from HTML: {e}")
             return ""
 
-    def _create_chunks(self, pages: list[dict[str, Any]]) -> dict[str, str]:
+    def _create_chunks(self, pages: list[dict[str, Any]], full_rebuild: bool = False) -> dict[str, str]:
         """Create parent-child chunks from pages using semantic HTML chunking.
 
         Appends new chunks to existing ones (for incremental updates).
         Deduplicates pages with identical content (keeping the first URL encountered).
+        Pages whose HTML is unchanged since they were last chunked reuse the chunker
+        output stored in chunk_cache.json instead of being parsed again.
 
         Args:
             pages: List of page data dicts with HTML
+            full_rebuild: Whether pages is the whole site; the chunk cache is then pruned
+                to these URLs. Small incremental batches bypass the chunk cache.
 
         Returns:
-            Dict mapping URL -> plain text content (for contextual retrieval)
+            Dict mapping URL -> plain text content (for contextual retrieval; empty when disabled)
         """
         # Don't reset - append to existing chunks for incremental updates
         # (caller sets self.chunks to [] for full rebuild or existing chunks for incremental)
@@ -1348,14 +1544,14 @@ class DocSearchIndex:
         # Deduplicate pages by content hash to avoid indexing identical content
         # (e.g., same content at different URLs, versioned pages with identical text)
         seen_content_hashes: set[str] = set()
-        deduplicated_pages: list[dict[str, Any]] = []
+        deduplicated_pages: list[tuple[dict[str, Any], str]] = []
         duplicates_skipped = 0
 
         for page in pages:
             content_hash = hashlib.sha256(page["html"].encode()).hexdigest()
             if content_hash not in seen_content_hashes:
                 seen_content_hashes.add(content_hash)
-                deduplicated_pages.append(page)
+                deduplicated_pages.append((page, content_hash))
             else:
                 duplicates_skipped += 1
                 logger.debug(f"[RAG] Skipping duplicate content: {page['url']}")
@@ -1370,6 +1566,12 @@ class DocSearchIndex:
         chunks_before = len(self.chunks)
         parents_before = len(self.parent_chunks)
 
+        use_chunk_cache = full_rebuild or len(deduplicated_pages) >= _CHUNK_CACHE_MIN_PAGES
+        chunk_cache = self._load_chunk_cache() if use_chunk_cache else {}
+        chunked_urls: set[str] = set()
+        cache_hits = 0
+        cache_changed = False
+
         # Create progress bar for chunking
         pbar = tqdm(
             deduplicated_pages,
@@ -1379,21 +1581,34 @@ class DocSearchIndex:
             file=sys.stderr,
         )
 
-        for page in pbar:
+        for page, content_hash in pbar:
             # Extract plain text for contextual retrieval
-            page_contents[page["url"]] = self._extract_page_text(page["html"])
+            if self.config.contextual_retrieval_enabled:
+                page_contents[page["url"]] = self._extract_page_text(page["html"])
 
             try:
-                # Use semantic chunking
-                result = semantic_chunk_html(
-                    html=page["html"],
-                    url=page["url"],
-                    child_min_tokens=self.config.child_chunk_min_tokens,
-                    child_max_tokens=self.config.child_chunk_size,
-                    parent_min_tokens=self.config.parent_chunk_min_tokens,
-                    parent_max_tokens=self.config.parent_chunk_size,
-                    absolute_max_tokens=self.config.absolute_max_chunk_tokens,
-                )
+                cached = chunk_cache.get(page["url"])
+                if cached is not None and cached["content_hash"] == content_hash:
+                    result = cached
+                    cache_hits += 1
+                else:
+                    # Use semantic chunking
+                    result = semantic_chunk_html(
+                        html=page["html"],
+                        url=page["url"],
+                        child_min_tokens=self.config.child_chunk_min_tokens,
+                        child_max_tokens=self.config.child_chunk_size,
+                        parent_min_tokens=self.config.parent_chunk_min_tokens,
+                        parent_max_tokens=self.config.parent_chunk_size,
+                        absolute_max_tokens=self.config.absolute_max_chunk_tokens,
+                    )
+                    # Convert metadata dataclasses to dicts for JSON serialization
+                    for chunk in (*result.get("parents", []), *result.get("children", [])):
+                        if hasattr(chunk.get("metadata"), "__dict__"):
+                            chunk["metadata"] = vars(chunk["metadata"])
+                    chunk_cache[page["url"]] = {"content_hash": content_hash, **result}
+                    cache_changed = True
+                chunked_urls.add(page["url"])
 
                 parents = result.get("parents", [])
                 children = result.get("children", [])
@@ -1404,10 +1619,7 @@ class DocSearchIndex:
                 # Store parent chunks
                 for parent in parents:
                     chunk_id = parent["chunk_id"]
-                    # Convert metadata dataclass to dict for JSON serialization
                     metadata = parent.get("metadata")
-                    if hasattr(metadata, "__dict__"):
-                        metadata = vars(metadata)
 
                     self.parent_chunks[chunk_id] = {
                         "content": parent["content"],
@@ -1444,9 +1656,6 @@ class DocSearchIndex:
 
                     # Create document
                     metadata = child.get("metadata", {})
-                    # Convert dataclass to dict if needed
-                    if hasattr(metadata, "__dict__"):
-                        metadata = vars(metadata)
 
                     doc = Document(
                         page_content=child["content"],
@@ -1469,8 +1678,61 @@ class DocSearchIndex:
                 logger.error(f"[RAG] Failed to chunk {page['url']}: {e}")
                 continue
 
+        if cache_hits:
+            logger.info(f"[RAG] Reused cached chunks for {cache_hits}/{len(deduplicated_pages)} unchanged pages")
+        if full_rebuild:
+            # Drop entries for URLs that are gone from the site (deleted or renamed pages)
+            stale_urls = chunk_cache.keys() - chunked_urls
+            for url in stale_urls:
+                del chunk_cache[url]
+            cache_changed = cache_changed or bool(stale_urls)
+        if use_chunk_cache and cache_changed:
+            self._save_chunk_cache(chunk_cache)
+
         return page_contents
 
+    def _chunk_cache_settings(self) -> dict[str, int]:
+        """Settings that chunk_cache.json entries were produced with."""
+        return {
+            "version": _CHUNK_CACHE_VERSION,
+            "child_chunk_min_tokens": self.config.child_chunk_min_tokens,
+            "child_chunk_size": self.config.child_chunk_size,
+            "parent_chunk_min_tokens": self.config.parent_chunk_min_tokens,
+            "parent_chunk_size": self.config.parent_chunk_size,
+            "absolute_max_chunk_tokens": self.config.absolute_max_chunk_tokens,
+        }
+
+    def _load_chunk_cache(self) -> dict[str, dict[str, Any]]:
+        """Load the per-URL chunker output cache.
+
+        Returns:
+            Dict mapping URL -> {"content_hash", "parents", "children"}; empty if missing,
+            unreadable, or produced with different chunk settings
+        """
+        try:
+            raw = self.chunk_cache_file.read_bytes()
+            data = orjson.loads(raw) if HAS_ORJSON else json.loads(raw)
+            if data.get("settings") != self._chunk_cache_settings():
+                logger.info("[RAG] Chunk settings changed, ignoring chunk cache")
+                return {}
+            return data["pages"]
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            logger.warning(f"[RAG] Failed to load chunk cache: {e}")
+            return {}
+
+    def _save_chunk_cache(self, chunk_cache: dict[str, dict[str, Any]]):
+        """Save the per-URL chunker output cache."""
+        data = {"settings": self._chunk_cache_settings(), "pages": chunk_cache}
+        try:
+            if HAS_ORJSON:
+                self.chunk_cache_file.write_bytes(orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS))
+            else:
+                self.chunk_cache_file.write_text(json.dumps(data))
+        except Exception as e:
+            logger.error(f"[RAG] Failed to save chunk cache: {e}")
+
     def _build_index(self):
         """Build FAISS vector index and retrievers."""
         if not self.chunks:
@@ -1484,11 +1746,12 @@ class DocSearchIndex:
         self._build_retrievers()
 
     def _initialize_components(self):
-        """Initialize embeddings and cross-encoders."""
-        if self.embeddings is None:
-            logger.info(f"[RAG] Loading embedding model: {self.config.embedding_model}...")
-            logger.info("[RAG] (First-time model download may take a minute)")
-            start = time.time()
+        """Initialize embeddings and cross-encoders.
+
+        Both models run on the best available device. On CUDA they are loaded in float16
+        (unless embedding_fp16 is off), falling back to float32 if that fails.
+        """
+        with self._components_lock:  # A concurrent caller waits for an in-progress load
             # Auto-detect best device (MPS for Apple Silicon, CUDA for NVIDIA, else CPU)
             if torch.backends.mps.is_available():
                 device = "mps"
@@ -1496,26 +1759,53 @@ class DocSearchIndex:
                 device = "cuda"
             else:
                 device = "cpu"
-            logger.info(f"[RAG] Using device: {device}")
-            self.embeddings = HuggingFaceEmbeddings(
-                model_name=self.config.embedding_model,
-                model_kwargs={"device": device},
-                encode_kwargs={"normalize_embeddings": True},
-            )
-            logger.info(f"[RAG] ✓ Embedding model loaded in {time.time() - start:.1f}s")
+            fp16 = device == "cuda" and self.config.embedding_fp16
 
-        if self.config.rerank_enabled and self.cross_encoder is None:
-            logger.info(f"[RAG] Loading cross-encoder: {self.config.rerank_model}...")
-            start = time.time()
-            self.cross_encoder = CrossEncoder(self.config.rerank_model)
-            logger.info(f"[RAG] ✓ Cross-encoder loaded in {time.time() - start:.1f}s")
+            if self.embeddings is None:
+                logger.info(f"[RAG] Loading embedding model: {self.config.embedding_model}...")
+                logger.info("[RAG] (First-time model download may take a minute)")
+                start = time.time()
+                logger.info(f"[RAG] Using device: {device}{' (float16)' if fp16 else ''}")
+                model_kwargs: dict[str, Any] = {"device": device}
+                if fp16:
+                    model_kwargs["model_kwargs"] = {"torch_dtype": torch.float16}
+                try:
+                    self.embeddings = HuggingFaceEmbeddings(
+                        model_name=self.config.embedding_model,
+                        model_kwargs=model_kwargs,
+                        encode_kwargs={"normalize_embeddings": True},
+                    )
+                except Exception as e:
+                    if not fp16:
+                        raise
+                    logger.warning(f"[RAG] Failed to load embedding model in float16 ({e}), using float32")
+                    self.embeddings = HuggingFaceEmbeddings(
+                        model_name=self.config.embedding_model,
+                        model_kwargs={"device": device},
+                        encode_kwargs={"normalize_embeddings": True},
+                    )
+                logger.info(f"[RAG] ✓ Embedding model loaded in {time.time() - start:.1f}s")
 
-    def _build_faiss_with_progress(self, chunks: list[Document], batch_size: int = 100) -> FAISS:
+            if self.config.rerank_enabled and self.cross_encoder is None:
+                logger.info(f"[RAG] Loading cross-encoder: {self.config.rerank_model}...")
+                start = time.time()
+                self.cross_encoder = CrossEncoder(self.config.rerank_model, device=device)
+                if fp16:
+                    try:
+                        self.cross_encoder.model.half()
+                    except Exception as e:
+                        logger.warning(f"[RAG] Failed to convert cross-encoder to float16 ({e}), using float32")
+                logger.info(f"[RAG] ✓ Cross-encoder loaded in {time.time() - start:.1f}s")
+
+    def _build_faiss_with_progress(self, chunks: list[Document], batch_size: int | None = None) -> FAISS:
         """Build FAISS index with progress bar for embedding generation.
 
+        Chunks are embedded in batches into one float32 array, and the index is built from
+        it in a single FAISS.from_embeddings() call.
+
         Args:
             chunks: List of Document objects to embed
-            batch_size: Number of chunks to embed at once
+            batch_size: Number of chunks to embed at once (default: config.embedding_batch_size)
 
         Returns:
             FAISS vectorstore
@@ -1523,24 +1813,136 @@ class DocSearchIndex:
         if not chunks:
             raise ValueError("No chunks to embed")
 
+        batch_size = batch_size or self.config.embedding_batch_size
         total_chunks = len(chunks)
         logger.info(f"[RAG] Generating embeddings for {total_chunks} chunks...")
 
-        # Process first batch to initialize FAISS
-        first_batch = chunks[:batch_size]
-        vectorstore = FAISS.from_documents(first_batch, self.embeddings)
+        texts = [chunk.page_content for chunk in chunks]
+        batches = []
+        with tqdm(
+            total=total_chunks,
+            desc="Embedding chunks",
+            unit="chunks",
+            disable=not self.config.show_progress or total_chunks <= batch_size,
+            file=sys.stderr,
+        ) as pbar:
+            for start in range(0, total_chunks, batch_size):
+                batch = self.embeddings.embed_documents(texts[start : start + batch_size])
+                batches.append(np.asarray(batch, dtype=np.float32))
+                pbar.update(len(batch))
+        vectors = np.concatenate(batches)
+
+        ids = [chunk.id for chunk in chunks] if any(chunk.id for chunk in chunks) else None
+        vectorstore = FAISS.from_embeddings(
+            zip(texts, vectors, strict=True), self.embeddings, metadatas=[chunk.metadata for chunk in chunks], ids=ids
+        )
+        return self._apply_index_settings(vectorstore)
+
+    def _apply_index_settings(self, vectorstore: FAISS) -> FAISS:
+        """Convert the vector index to the configured index type and embedding storage type.
 
-        # Process remaining batches with progress bar
-        if total_chunks > batch_size:
-            remaining_chunks = chunks[batch_size:]
-            with tqdm(total=total_chunks, initial=batch_size, desc="Embedding chunks", unit="chunks") as pbar:
-                for i in range(0, len(remaining_chunks), batch_size):
-                    batch = remaining_chunks[i : i + batch_size]
-                    vectorstore.add_documents(batch)
-                    pbar.update(len(batch))
+        With ``faiss_index_type="hnsw"`` the exact flat index is replaced by an HNSW graph
+        index (approximate search in roughly log(N) time). With ``embedding_dtype="int8"``
+        vectors are stored 8-bit scalar-quantized with ranges trained on the indexed vectors
+        (one byte per dimension); vectors added later are encoded with the same ranges.
 
+        Args:
+            vectorstore: FAISS vectorstore with a populated flat index
+
+        Returns:
+            The same vectorstore, with its index converted if needed
+        """
+        index = vectorstore.index
+        if self._index_matches_config(index):
+            return vectorstore
+
+        int8 = self.config.embedding_dtype == "int8"
+        if self.config.faiss_index_type == "hnsw":
+            if int8:
+                converted = faiss.IndexHNSWSQ(index.d, faiss.ScalarQuantizer.QT_8bit, _HNSW_M, index.metric_type)
+            else:
+                converted = faiss.IndexHNSWFlat(index.d, _HNSW_M, index.metric_type)
+            converted.hnsw.efConstruction = _HNSW_EF_CONSTRUCTION
+            converted.hnsw.efSearch = _HNSW_EF_SEARCH
+        else:
+            converted = faiss.IndexScalarQuantizer(index.d, faiss.ScalarQuantizer.QT_8bit, index.metric_type)
+
+        vectors = index.reconstruct_n(0, index.ntotal)
+        converted.train(vectors)
+        converted.add(vectors)
+        vectorstore.index = converted
+        logger.info(
+            f"[RAG] Converted {index.ntotal} embeddings to a {self.config.faiss_index_type} "
+            f"{self.config.embedding_dtype} index"
+        )
         return vectorstore
 
+    def _index_matches_config(self, index: faiss.Index) -> bool:
+        """Check whether a FAISS index has the configured index type and embedding storage type."""
+        int8 = self.config.embedding_dtype == "int8"
+        if self.config.faiss_index_type == "hnsw":
+            return isinstance(index, faiss.IndexHNSWSQ if int8 else faiss.IndexHNSWFlat)
+        return isinstance(index, faiss.IndexScalarQuantizer if int8 else faiss.IndexFlat)
+
+    def _load_faiss_vectorstore(self, faiss_path: str) -> FAISS:
+        """Load the persisted FAISS vectorstore (checksum must be verified by the caller).
+
+        With ``faiss_mmap`` the vectors in index.faiss are memory-mapped instead of read into
+        RAM: the OS pages them in on demand and shares them between processes serving the
+        same index. The docstore sidecar (index.pkl) is read the same way FAISS.load_local() does.
+
+        Args:
+            faiss_path: Path to FAISS index directory
+
+        Returns:
+            FAISS vectorstore
+        """
+        self._faiss_mmapped = False
+        mmap = self.config.faiss_mmap
+        if mmap and not hasattr(faiss, "IO_FLAG_MMAP_IFC"):
+            logger.warning(
+                f"[RAG] faiss {faiss.__version__} cannot memory-map index vectors (no IO_FLAG_MMAP_IFC); "
+                "loading the FAISS index into memory instead"
+            )
+            mmap = False
+        if not mmap:
+            return FAISS.load_local(
+                faiss_path, self.embeddings, allow_dangerous_deserialization=True  # Checksum verified by caller
+            )
+
+        index = faiss.read_index(str(Path(faiss_path) / "index.faiss"), faiss.IO_FLAG_MMAP_IFC)
+        with open(Path(faiss_path) / "index.pkl", "rb") as f:
+            docstore, index_to_docstore_id = pickle.load(f)  # Checksum verified by caller
+        self._faiss_mmapped = True
+        return FAISS(self.embeddings, index, docstore, index_to_docstore_id)
+
+    def _materialize_faiss_index(self):
+        """Copy a memory-mapped FAISS index into RAM so it can be modified.
+
+        FAISS aborts the process (not a Python exception) when vectors are added to a
+        memory-mapped index, so every write path calls this first.
+        """
+        if self._faiss_mmapped and self.vectorstore is not None:
+            self.vectorstore.index = faiss.deserialize_index(faiss.serialize_index(self.vectorstore.index))
+            self._faiss_mmapped = False
+
+    def _save_vectorstore(self, faiss_path: str):
+        """Save the FAISS vectorstore and its checksum.
+
+        Files are written to a sibling directory and renamed into place, so a memory-mapped
+        index still in use keeps reading its own (now unlinked) file instead of a truncated one.
+
+        Args:
+            faiss_path: Path to FAISS index directory
+        """
+        tmp_path = Path(f"{faiss_path}.tmp")
+        self.vectorstore.save_local(str(tmp_path))
+        Path(faiss_path).mkdir(parents=True, exist_ok=True)
+        for name in ("index.faiss", "index.pkl"):
+            os.replace(tmp_path / name, Path(faiss_path) / name)
+        tmp_path.rmdir()
+        self._save_faiss_checksum(faiss_path)
+
     def _compute_faiss_checksum(self, faiss_path: str) -> str:
         """Compute SHA256 checksum of FAISS index files.
 
@@ -1615,17 +2017,13 @@ class DocSearchIndex:
         # Save FAISS index with checksum
         faiss_path = str(self.index_dir / "faiss_index")
         logger.info(f"[RAG] Saving FAISS index to {faiss_path}...")
-        self.vectorstore.save_local(faiss_path)
-        self._save_faiss_checksum(faiss_path)
+        self._save_vectorstore(faiss_path)
         logger.info("[RAG] ✓ FAISS index saved")
 
         # Build BM25 retriever
         logger.info(f"[RAG] Building BM25 keyword retriever from {len(self.chunks)} chunks...")
         start = time.time()
-        self.bm25_retriever = BM25Retriever.from_documents(self.chunks)
-        self.bm25_retriever.k = (
-            self.config.search_top_k * self.config.retriever_candidate_multiplier
-        )  # Get more candidates for ensemble
+        self.bm25_retriever = self._build_bm25_retriever(self.chunks)
         logger.info(f"[RAG] ✓ BM25 retriever built in {time.time() - start:.1f}s")
 
         # Build ensemble retriever (hybrid search)
@@ -1684,9 +2082,13 @@ class DocSearchIndex:
 
             logger.info(f"[RAG] Loading existing FAISS index from {faiss_path}...")
             start = time.time()
-            self.vectorstore = FAISS.load_local(
-                faiss_path, self.embeddings, allow_dangerous_deserialization=True  # Checksum verified above
-            )
+            self.vectorstore = self._load_faiss_vectorstore(faiss_path)
+            if not self._index_matches_config(self.vectorstore.index):
+                # Adding to it would persist the old index type; rebuild with the current settings
+                raise ValueError(
+                    f"persisted index does not match faiss_index_type={self.config.faiss_index_type!r}, "
+                    f"embedding_dtype={self.config.embedding_dtype!r}"
+                )
             logger.info(
                 f"[RAG] ✓ Loaded existing index with {existing_chunk_count} chunks in {time.time() - start:.1f}s"
             )
@@ -1697,13 +2099,13 @@ class DocSearchIndex:
             start = time.time()
 
             # Add new documents to existing index
+            self._materialize_faiss_index()
             self.vectorstore.add_documents(new_chunks)
             logger.info(f"[RAG] ✓ Added {len(new_chunks)} new chunks in {time.time() - start:.1f}s")
 
             # Save updated index with new checksum
             logger.info(f"[RAG] Saving updated FAISS index to {faiss_path}...")
-            self.vectorstore.save_local(faiss_path)
-            self._save_faiss_checksum(faiss_path)
+            self._save_vectorstore(faiss_path)
             logger.info("[RAG] ✓ Updated FAISS index saved")
 
         except Exception as e:
@@ -1712,12 +2114,11 @@ class DocSearchIndex:
             self._build_index()
             return
 
-        # Rebuild BM25 retriever (fast, must use all chunks)
-        logger.info(f"[RAG] Rebuilding BM25 retriever with all {len(self.chunks)} chunks...")
+        # Update BM25 retriever (only the new chunks are tokenized)
+        logger.info(f"[RAG] Updating BM25 retriever to all {len(self.chunks)} chunks...")
         start = time.time()
-        self.bm25_retriever = BM25Retriever.from_documents(self.chunks)
-        self.bm25_retriever.k = self.config.search_top_k * self.config.retriever_candidate_multiplier
-        logger.info(f"[RAG] ✓ BM25 retriever rebuilt in {time.time() - start:.1f}s")
+        self.bm25_retriever = self._build_bm25_retriever(self.chunks)
+        logger.info(f"[RAG] ✓ BM25 retriever updated in {time.time() - start:.1f}s")
 
         # Rebuild ensemble retriever
         logger.info("[RAG] Rebuilding ensemble retriever...")
@@ -1732,7 +2133,9 @@ class DocSearchIndex:
         )
         logger.info("[RAG] ✓ Ensemble retriever ready")
 
-    def _rerank_results(self, query: str, results: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    def _rerank_results(
+        self, query: str, results: list[dict[str, Any]], top_k: int | None = None
+    ) -> list[dict[str, Any]]:
         """Re-rank results using cross-encoder.
 
         This is the second stage of the retrieval pipeline:
@@ -1742,6 +2145,7 @@ class DocSearchIndex:
         Args:
             query: Search query
             results: List of results to re-rank
+            top_k: If set, only the best top_k results are selected and returned
 
         Returns:
             Re-ranked results sorted by cross-encoder score
@@ -1770,18 +2174,23 @@ class DocSearchIndex:
                     # All scores identical, assign uniform score
                     result["score"] = 1.0
 
-            # Sort by final score
-            results = sorted(results, key=lambda x: x["score"], reverse=True)
+            # Sort by final score. When only top_k are needed, select them in O(n log k);
+            # nlargest keeps the same tie order as the stable sort
+            if top_k is not None and top_k < len(results):
+                results = heapq.nlargest(top_k, results, key=itemgetter("score"))
+            else:
+                results = sorted(results, key=itemgetter("score"), reverse=True)
 
         return results
 
     def _load_metadata(self) -> dict[str, Any]:
         """Load metadata from cache."""
-        if self.metadata_file.exists():
-            try:
-                return json.loads(self.metadata_file.read_text())
-            except Exception as e:
-                logger.warning(f"[RAG] Failed to load metadata: {e}")
+        try:
+            return json.loads(self.metadata_file.read_text())
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.warning(f"[RAG] Failed to load metadata: {e}")
         return {}
 
     def _save_metadata(self, metadata: dict[str, Any]):
@@ -1795,20 +2204,24 @@ class DocSearchIndex:
         """Save chunks to disk."""
         try:
             chunk_dicts = [{"page_content": chunk.page_content, "metadata": chunk.metadata} for chunk in self.chunks]
-            self.chunks_file.write_text(json.dumps(chunk_dicts))
+            if HAS_ORJSON:
+                self.chunks_file.write_bytes(orjson.dumps(chunk_dicts, option=orjson.OPT_NON_STR_KEYS))
+            else:
+                self.chunks_file.write_text(json.dumps(chunk_dicts))
             logger.info(f"[RAG] Saved {len(self.chunks)} chunks")
         except Exception as e:
             logger.error(f"[RAG] Failed to save chunks: {e}")
 
     def _load_chunks(self) -> list[Document] | None:
         """Load chunks from disk."""
-        if not self.chunks_file.exists():
-            return None
         try:
-            chunk_dicts = json.loads(self.chunks_file.read_text())
+            raw = self.chunks_file.read_bytes()
+            chunk_dicts = orjson.loads(raw) if HAS_ORJSON else json.loads(raw)
             chunks = [Document(page_content=cd["page_content"], metadata=cd["metadata"]) for cd in chunk_dicts]
             logger.info(f"[RAG] Loaded {len(chunks)} chunks from cache")
             return chunks
+        except FileNotFoundError:
+            return None
         except Exception as e:
             logger.warning(f"[RAG] Failed to load chunks: {e}")
             return None
@@ -1816,19 +2229,23 @@ class DocSearchIndex:
     def _save_parent_chunks(self):
         """Save parent chunks to disk."""
         try:
-            self.parent_chunks_file.write_text(json.dumps(self.parent_chunks, indent=2))
+            if HAS_ORJSON:
+                self.parent_chunks_file.write_bytes(orjson.dumps(self.parent_chunks, option=orjson.OPT_NON_STR_KEYS))
+            else:
+                self.parent_chunks_file.write_text(json.dumps(self.parent_chunks))
             logger.info(f"[RAG] Saved {len(self.parent_chunks)} parent chunks")
         except Exception as e:
             logger.error(f"[RAG] Failed to save parent chunks: {e}")
 
     def _load_parent_chunks(self) -> dict[str, dict[str, Any]] | None:
         """Load parent chunks from disk."""
-        if not self.parent_chunks_file.exists():
-            return None
         try:
-            parent_chunks = json.loads(self.parent_chunks_file.read_text())
+            raw = self.parent_chunks_file.read_bytes()
+            parent_chunks = orjson.loads(raw) if HAS_ORJSON else json.loads(raw)
             logger.info(f"[RAG] Loaded {len(parent_chunks)} parent chunks from cache")
             return parent_chunks
+        except FileNotFoundError:
+            return None
         except Exception as e:
             logger.warning(f"[RAG] Failed to load parent chunks: {e}")
             return None
@@ -1839,8 +2256,6 @@ class DocSearchIndex:
         Returns:
             Crawl state dict with discovered_urls, indexed_urls, failed_urls, etc.
         """
-        if not self.crawl_state_file.exists():
-            return {}
         try:
             state = json.loads(self.crawl_state_file.read_text())
             failed_urls = state.get("failed_urls", {})
@@ -1849,6 +2264,8 @@ class DocSearchIndex:
                 f"{len(state.get('indexed_urls', []))} indexed, {len(failed_urls)} failed"
             )
             return state
+        except FileNotFoundError:
+            return {}
         except Exception as e:
             logger.warning(f"[RAG] Failed to load crawl state: {e}")
             return {}
@@ -1899,15 +2316,14 @@ class DocSearchIndex:
         Returns:
             Tuple of (tombstoned_urls, tombstoned_chunk_ids)
         """
-        if not self.tombstones_file.exists():
-            return set(), set()
-
         try:
             data = json.loads(self.tombstones_file.read_text())
             urls = set(data.get("tombstoned_urls", []))
             chunk_ids = set(data.get("tombstoned_chunk_ids", []))
             logger.info(f"[RAG] Loaded tombstones: {len(urls)} URLs, {len(chunk_ids)} chunks")
             return urls, chunk_ids
+        except FileNotFoundError:
+            return set(), set()
         except Exception as e:
             logger.warning(f"[RAG] Failed to load tombstones: {e}")
             return set(), set()
@@ -2263,7 +2679,8 @@ class DocSearchIndex:
             return
 
         try:
-            # Add to FAISS vectorstore
+            # Add to FAISS vectorstore (a memory-mapped index is copied into RAM first)
+            self._materialize_faiss_index()
             self.vectorstore.add_documents(new_chunks)
             logger.debug(f"[RAG] Added {len(new_chunks)} chunks to FAISS")
 
@@ -2275,8 +2692,7 @@ class DocSearchIndex:
 
             # Save updated FAISS index
             faiss_path = str(self.index_dir / "faiss_index")
-            self.vectorstore.save_local(faiss_path)
-            self._save_faiss_checksum(faiss_path)
+            self._save_vectorstore(faiss_path)
 
         except Exception as e:
             logger.error(f"[RAG] Failed to add chunks to index: {e}")
@@ -2290,10 +2706,85 @@ class DocSearchIndex:
             logger.warning("[RAG] No active chunks for BM25")
             return
 
-        k = self.config.search_top_k * self.config.retriever_candidate_multiplier
-        self.bm25_retriever = BM25Retriever.from_documents(active_chunks, k=k)
+        # Only the full chunk list (what load_index() indexes) is persisted; a tombstone-filtered
+        # subset would overwrite it and make the next load rebuild from scratch
+        persist = len(active_chunks) == len(self.chunks)
+        self.bm25_retriever = self._build_bm25_retriever(active_chunks, persist=persist)
         logger.debug(f"[RAG] Rebuilt BM25 with {len(active_chunks)} active chunks")
 
+    def _build_bm25_retriever(self, chunks: list[Document], persist: bool = True) -> BM25Retriever:
+        """Build the BM25 retriever for chunks, reusing the persisted BM25 statistics.
+
+        The statistics saved in index/bm25.pkl are keyed by a digest of each chunk's text.
+        If they cover exactly these chunks they are used as-is; if they cover a prefix (chunks
+        appended by an incremental update) only the new chunks are tokenized and counted.
+        Otherwise the model is built from scratch.
+
+        Args:
+            chunks: Chunks to index, in retrieval order
+            persist: Save changed statistics back to index/bm25.pkl for the next load
+
+        Returns:
+            BM25 retriever over chunks
+        """
+        digests = [hashlib.sha256(chunk.page_content.encode()).digest() for chunk in chunks]
+        state = self._load_bm25_state()
+        known = state["digests"] if state else []
+
+        if state and known == digests:
+            vectorizer = state["vectorizer"]
+        else:
+            if state and len(known) < len(digests) and digests[: len(known)] == known:
+                vectorizer, nd = state["vectorizer"], state["nd"]
+                new_chunks = chunks[len(known) :]
+                _extend_bm25(vectorizer, nd, [default_preprocessing_func(c.page_content) for c in new_chunks])
+                logger.debug(f"[RAG] Extended persisted BM25 statistics with {len(new_chunks)} chunks")
+            else:
+                vectorizer = BM25Okapi([default_preprocessing_func(c.page_content) for c in chunks])
+                nd = Counter()
+                for frequencies in vectorizer.doc_freqs:
+                    nd.update(frequencies.keys())
+            if persist:
+                self._save_bm25_state({"digests": digests, "nd": nd, "vectorizer": vectorizer})
+
+        k = self.config.search_top_k * self.config.retriever_candidate_multiplier  # More candidates for ensemble
+        return BM25Retriever(vectorizer=vectorizer, docs=chunks, k=k)
+
+    def _load_bm25_state(self) -> dict[str, Any] | None:
+        """Load persisted BM25 statistics, verifying their checksum first.
+
+        Returns:
+            Dict with "digests" (per-chunk text digests), "nd" (document frequencies) and
+            "vectorizer" (BM25Okapi), or None
+        """
+        bm25_file = self.index_dir / "bm25.pkl"
+        checksum_file = self.index_dir / "bm25.sha256"
+        try:
+            raw = bm25_file.read_bytes()
+            if hashlib.sha256(raw).hexdigest() != checksum_file.read_text().strip():
+                logger.warning("[RAG] BM25 checksum mismatch, rebuilding BM25 statistics")
+                return None
+            state = pickle.loads(raw)  # Checksum verified above
+            return state if "nd" in state else None  # Saved before document frequencies were stored
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"[RAG] Failed to load BM25 statistics: {e}")
+            return None
+
+    def _save_bm25_state(self, state: dict[str, Any]):
+        """Save BM25 statistics and their checksum.
+
+        Args:
+            state: Dict with "digests", "nd" and "vectorizer"
+        """
+        try:
+            raw = pickle.dumps(state, protocol=pickle.HIGHEST_PROTOCOL)
+            (self.index_dir / "bm25.pkl").write_bytes(raw)
+            (self.index_dir / "bm25.sha256").write_text(hashlib.sha256(raw).hexdigest())
+        except Exception as e:
+            logger.error(f"[RAG] Failed to save BM25 statistics: {e}")
+
     def _rebuild_ensemble(self):
         """Rebuild ensemble retriever with current retrievers."""
         if not self.bm25_retriever or not self.vectorstore:
@@ -2341,11 +2832,10 @@ class DocSearchIndex:
         # Rebuild FAISS from scratch
         if self.embeddings and self.chunks:
             logger.info(f"[RAG] Rebuilding FAISS with {len(self.chunks)} chunks")
-            self.vectorstore = FAISS.from_documents(self.chunks, self.embeddings)
+            self.vectorstore = self._apply_index_settings(FAISS.from_documents(self.chunks, self.embeddings))
 
             faiss_path = str(self.index_dir / "faiss_index")
-            self.vectorstore.save_local(faiss_path)
-            self._save_faiss_checksum(faiss_path)
+            self._save_vectorstore(faiss_path)
 
         # Rebuild retrievers
         self._rebuild_bm25()
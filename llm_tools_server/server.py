@@ -17,9 +17,18 @@ from flask import Flask, Response, jsonify, request, stream_with_context
 from flask_cors import CORS
 from langchain_core.tools import BaseTool
 
-from .backends import call_lmstudio, call_ollama, check_lmstudio_health, check_ollama_health
+from .backends import call_lmstudio, call_ollama, check_lmstudio_health, check_ollama_health, iter_backend_chunks
 from .config import ServerConfig
 
+# Malformed tool call tokens that should have been parsed as tool calls, e.g.
+# <|start|>assistant<|channel|>commentary to=functions.web_search <|constrain|>json<|message|>{...}
+_MALFORMED_TOOL_TOKENS_RE = re.compile(
+    r"<\|start\|>assistant<\|channel\|>"  # Hermes-style: <|start|>assistant<|channel|>...
+    r"|<\|start\|>.*?<\|message\|>"  # Generic special token patterns that indicate malformed output
+    r"|to=functions\.\w+",  # Functions marker
+    re.DOTALL,
+)
+
 
 class LLMServer:
     """Flask server providing OpenAI-compatible API for LLM backends with tool calling."""
@@ -300,12 +309,13 @@ class LLMServer:
         """
         prompt_path = Path(self.config.SYSTEM_PROMPT_PATH)
 
-        if not prompt_path.exists():
-            return self.default_system_prompt
-
         try:
             with self._prompt_lock:
-                current_mtime = prompt_path.stat().st_mtime
+                # Single stat per request: a missing file means use the default prompt
+                try:
+                    current_mtime = prompt_path.stat().st_mtime
+                except FileNotFoundError:
+                    return self.default_system_prompt
 
                 # Check if cache is valid
                 if self._system_prompt_cache is not None and self._system_prompt_mtime == current_mtime:
@@ -457,17 +467,11 @@ class LLMServer:
         if not content:
             return False
 
-        # Pattern for Hermes/ChatML-style malformed tool call tokens
-        patterns = [
-            # Hermes-style: <|start|>assistant<|channel|>...
-            r"<\|start\|>assistant<\|channel\|>",
-            # Generic special token patterns that indicate malformed output
-            r"<\|start\|>.*?<\|message\|>",
-            # Functions marker
-            r"to=functions\.\w+",
-        ]
+        # Every pattern requires one of these literals, so most responses skip the regex entirely
+        if "<|start|>" not in content and "to=functions." not in content:
+            return False
 
-        return any(re.search(pattern, content, re.DOTALL) for pattern in patterns)
+        return _MALFORMED_TOOL_TOKENS_RE.search(content) is not None
 
     def _parse_thinker_response(self, content: str) -> tuple[str, list]:
         """Parse response from thinker models that include reasoning.
@@ -1008,38 +1012,29 @@ class LLMServer:
 
             if self.config.BACKEND_TYPE == "ollama":
                 # Ollama streams newline-delimited JSON
-                for line in response.iter_lines():
-                    if line:
-                        chunk_data = json.loads(line)
-                        message = chunk_data.get("message", {})
-                        content = message.get("content", "")
-                        done = chunk_data.get("done", False)
-
-                        if content:
-                            full_content += content  # Always track full content
-                            content_buffer += content
-                            yield from process_buffered_content()
-
-                        if done:
-                            break
+                for chunk_data in iter_backend_chunks(response):
+                    message = chunk_data.get("message", {})
+                    content = message.get("content", "")
+                    done = chunk_data.get("done", False)
+
+                    if content:
+                        full_content += content  # Always track full content
+                        content_buffer += content
+                        yield from process_buffered_content()
+
+                    if done:
+                        break
             else:
                 # LM Studio uses OpenAI SSE format (data: {...}\n\n)
-                for line in response.iter_lines():
-                    if line:
-                        line_str = line.decode("utf-8") if isinstance(line, bytes) else line
-                        if line_str.startswith("data: "):
-                            data_str = line_str[6:]  # Remove "data: " prefix
-                            if data_str == "[DONE]":
-                                break
-                            chunk_data = json.loads(data_str)
-                            choice = chunk_data.get("choices", [{}])[0]
-                            delta = choice.get("delta", {})
-                            content = delta.get("content", "")
-
-                            if content:
-                                full_content += content  # Always track full content
-                                content_buffer += content
-                                yield from process_buffered_content()
+                for chunk_data in iter_backend_chunks(response):
+                    choice = chunk_data.get("choices", [{}])[0]
+                    delta = choice.get("delta", {})
+                    content = delta.get("content", "")
+
+                    if content:
+                        full_content += content  # Always track full content
+                        content_buffer += content
+                        yield from process_buffered_content()
 
             # Flush any remaining buffered content
             if found_markers:
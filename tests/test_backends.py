@@ -1,5 +1,6 @@
 """Tests for backend communication functions."""
 
+import json
 from unittest.mock import Mock, patch
 
 import pytest
@@ -8,6 +9,15 @@ import requests
 from llm_tools_server.backends import check_lmstudio_health, check_ollama_health
 
 
+def _json_response(data):
+    """Build a mock response whose body is the JSON-encoded data."""
+    mock_response = Mock()
+    mock_response.content = json.dumps(data).encode("utf-8")
+    mock_response.json.return_value = data
+    mock_response.raise_for_status = Mock()
+    return mock_response
+
+
 @pytest.fixture(autouse=True)
 def reset_backend_session():
     """Reset the module-level session between tests to ensure mocking works."""
@@ -25,14 +35,14 @@ class TestBackendHealthChecks:
 
     def test_ollama_health_model_not_found(self, default_config):
         """Test Ollama health check when configured model is not available."""
-        mock_response = Mock()
-        mock_response.json.return_value = {
-            "models": [
-                {"name": "llama2"},
-                {"name": "mistral"},
-            ]
-        }
-        mock_response.raise_for_status = Mock()
+        mock_response = _json_response(
+            {
+                "models": [
+                    {"name": "llama2"},
+                    {"name": "mistral"},
+                ]
+            }
+        )
 
         mock_session = Mock()
         mock_session.get.return_value = mock_response
@@ -45,14 +55,14 @@ class TestBackendHealthChecks:
 
     def test_ollama_health_model_available(self, custom_config):
         """Test Ollama health check with correct model."""
-        mock_response = Mock()
-        mock_response.json.return_value = {
-            "models": [
-                {"name": "llama2"},
-                {"name": "mistral"},
-            ]
-        }
-        mock_response.raise_for_status = Mock()
+        mock_response = _json_response(
+            {
+                "models": [
+                    {"name": "llama2"},
+                    {"name": "mistral"},
+                ]
+            }
+        )
 
         mock_session = Mock()
         mock_session.get.return_value = mock_response
@@ -64,6 +74,25 @@ class TestBackendHealthChecks:
         assert "llama2" in message
         assert "available" in message
 
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_ollama_health_decodes_body(self, custom_config, monkeypatch, use_orjson):
+        """The tags response is decoded with orjson when installed, else response.json()."""
+        from llm_tools_server import backends
+
+        if use_orjson and not backends.HAS_ORJSON:
+            pytest.skip("orjson not installed")
+        monkeypatch.setattr(backends, "HAS_ORJSON", use_orjson)
+
+        mock_response = _json_response({"models": [{"name": "llama2"}, {"name": "mistral"}]})
+        mock_session = Mock()
+        mock_session.get.return_value = mock_response
+
+        with patch("llm_tools_server.backends._get_session", return_value=mock_session):
+            is_healthy, _ = check_ollama_health(custom_config)
+
+        assert is_healthy is True
+        assert mock_response.json.called is not use_orjson
+
     def test_ollama_health_connection_error(self, default_config):
         """Test Ollama health check with connection error."""
         mock_session = Mock()
@@ -89,14 +118,14 @@ class TestBackendHealthChecks:
 
     def test_lmstudio_health_success(self, default_config):
         """Test successful LM Studio health check."""
-        mock_response = Mock()
-        mock_response.json.return_value = {
-            "data": [
-                {"id": "model1"},
-                {"id": "model2"},
-            ]
-        }
-        mock_response.raise_for_status = Mock()
+        mock_response = _json_response(
+            {
+                "data": [
+                    {"id": "model1"},
+                    {"id": "model2"},
+                ]
+            }
+        )
 
         mock_session = Mock()
         mock_session.get.return_value = mock_response
@@ -109,9 +138,7 @@ class TestBackendHealthChecks:
 
     def test_lmstudio_health_no_models(self, default_config):
         """Test LM Studio health check with no models loaded."""
-        mock_response = Mock()
-        mock_response.json.return_value = {"data": []}
-        mock_response.raise_for_status = Mock()
+        mock_response = _json_response({"data": []})
 
         mock_session = Mock()
         mock_session.get.return_value = mock_response
@@ -189,3 +216,408 @@ class TestRetryLogic:
 
         # Should try 3 times (default BACKEND_RETRY_ATTEMPTS)
         assert mock_func.call_count == 3
+
+    def test_retry_delays_use_exponential_backoff_with_jitter(self, default_config):
+        """Each retry waits the doubled base delay plus at most 20% jitter."""
+        from llm_tools_server.backends import _retry_on_connection_error
+
+        mock_func = Mock(side_effect=requests.ConnectionError("Always fails"))
+
+        with patch("time.sleep") as sleep, pytest.raises(requests.ConnectionError):
+            _retry_on_connection_error(mock_func, default_config)
+
+        delays = [c.args[0] for c in sleep.call_args_list]
+        base = default_config.BACKEND_RETRY_INITIAL_DELAY
+        assert len(delays) == 2
+        for attempt, delay in enumerate(delays):
+            assert base * 2**attempt <= delay <= base * 2**attempt * 1.2
+
+
+@pytest.mark.unit
+def test_shared_session_is_pooled_and_reused():
+    """The backend session is created once, with a pool sized for concurrent requests."""
+    from llm_tools_server import backends
+
+    session = backends._get_session()
+
+    assert backends._get_session() is session
+    adapter = session.get_adapter("http://localhost:11434")
+    assert adapter._pool_maxsize == backends._POOL_MAXSIZE
+    assert adapter.max_retries.total == 0
+
+
+@pytest.mark.unit
+def test_async_backend_calls_overlap(default_config):
+    """acall_ollama/acall_lmstudio should let independent requests run concurrently."""
+    import asyncio
+    import threading
+    import time
+
+    from llm_tools_server.backends import acall_lmstudio, acall_ollama
+
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def slow_post(endpoint, stream=False, timeout=None, **kwargs):
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        time.sleep(0.05)
+        with lock:
+            active -= 1
+        response = Mock()
+        response.endpoint = endpoint
+        return response
+
+    mock_session = Mock()
+    mock_session.post.side_effect = slow_post
+    messages = [{"role": "user", "content": "hi"}]
+
+    async def fan_out():
+        return await asyncio.gather(
+            acall_ollama(messages, [], default_config),
+            acall_lmstudio(messages, [], default_config),
+            acall_ollama(messages, [], default_config),
+        )
+
+    with patch("llm_tools_server.backends._get_session", return_value=mock_session):
+        responses = asyncio.run(fan_out())
+
+    assert peak > 1
+    assert responses[0].endpoint.endswith("/v1/chat/completions")
+    assert responses[1].endpoint == f"{default_config.LMSTUDIO_ENDPOINT}/chat/completions"
+
+
+@pytest.mark.unit
+def test_get_tool_schema_is_cached_per_args_schema(sample_tools):
+    """Schema generation should run once per tool args_schema and be reused afterwards."""
+    from llm_tools_server import backends
+    from llm_tools_server.backends import get_tool_schema
+
+    tool = sample_tools[0]
+    backends._schema_cache.pop(tool.args_schema, None)
+    with patch.object(
+        tool.args_schema, "model_json_schema", wraps=tool.args_schema.model_json_schema
+    ) as model_json_schema:
+        first = get_tool_schema(tool)
+        second = get_tool_schema(tool)
+
+    assert first is second
+    assert "query" in first["properties"]
+    assert model_json_schema.call_count == 1
+
+
+@pytest.mark.unit
+def test_get_tool_schema_handles_pydantic_v1_and_missing_schema():
+    """v1-style schema() is used when model_json_schema is absent; no schema yields {}."""
+    from llm_tools_server.backends import get_tool_schema
+
+    class V1Schema:
+        @classmethod
+        def schema(cls):
+            return {"properties": {"x": {"type": "integer"}}}
+
+    assert get_tool_schema(Mock(args_schema=V1Schema)) == {"properties": {"x": {"type": "integer"}}}
+    assert get_tool_schema(Mock(args_schema=None)) == {}
+
+
+@pytest.mark.unit
+def test_openai_tool_definitions_are_cached(sample_tools, default_config):
+    """The assembled tool list should be built once and reused by both backends."""
+    from llm_tools_server import backends
+
+    backends._tools_cache.clear()
+    messages = [{"role": "user", "content": "hi"}]
+    first = backends._build_payload(messages, sample_tools, default_config, 0.0, False, None)
+    second = backends._build_payload(messages, list(sample_tools), default_config, 0.5, True, "required")
+
+    assert first["tools"] is second["tools"]
+    assert first["tools"][0]["function"]["name"] == sample_tools[0].name
+    assert "tools" not in backends._build_payload(messages, [], default_config, 0.0, False, None)
+
+
+@pytest.mark.unit
+def test_tool_summaries_for_unselected_tools(default_config):
+    """Only tools in full_schema_tools carry a parameter schema; the rest are summaries."""
+    from langchain_core.tools import tool
+
+    from llm_tools_server import backends
+
+    @tool
+    def doc_search(query: str) -> str:
+        """Search the documentation.
+
+        Returns matching passages."""
+        return query
+
+    @tool
+    def get_weather(city: str) -> str:
+        """Get the weather for a city."""
+        return city
+
+    tools = [doc_search, get_weather]
+    messages = [{"role": "user", "content": "Please doc search for Vault"}]
+    selected = backends.select_tools(messages, tools)
+    assert selected == [doc_search]
+
+    payload = backends._build_payload(messages, tools, default_config, 0.0, False, None, selected)
+    full, summary = payload["tools"]
+    assert "query" in full["function"]["parameters"]["properties"]
+    assert summary == {
+        "type": "function",
+        "function": {"name": "get_weather", "description": "Get the weather for a city."},
+    }
+    assert backends.build_tool_summary(doc_search)["function"]["description"] == "Search the documentation."
+
+    # Tools the model already called stay expanded; default sends every schema
+    messages.append({"role": "assistant", "tool_calls": [{"function": {"name": "get_weather"}}]})
+    assert backends.select_tools(messages, tools) == tools
+    assert all("parameters" in t["function"] for t in backends._get_openai_tools(tools))
+
+
+@pytest.mark.unit
+def test_payload_template_is_reused_with_fresh_messages(sample_tools, default_config):
+    """Payloads for the same settings come from one template; only messages differ."""
+    from llm_tools_server import backends
+
+    backends._payload_templates.clear()
+    first_messages = [{"role": "user", "content": "one"}]
+    second_messages = [{"role": "user", "content": "two"}]
+    first = backends._build_payload(first_messages, sample_tools, default_config, 0.2, False, "auto")
+    first["extra"] = True  # Mutating a payload (e.g. in REQUEST_HOOK) must not leak into later ones
+    second = backends._build_payload(second_messages, sample_tools, default_config, 0.2, False, "auto")
+
+    assert len(backends._payload_templates) == 1
+    assert second["messages"] is second_messages
+    assert first["messages"] is first_messages
+    assert "extra" not in second
+    assert list(second) == ["model", "messages", "temperature", "stream", "tools", "tool_choice"]
+
+    none_choice = backends._build_payload(second_messages, sample_tools, default_config, 0.2, False, "none")
+    assert none_choice["tool_choice"] == "none"
+    assert "tools" not in none_choice
+
+
+@pytest.mark.unit
+def test_payload_template_keyed_by_tools_not_tool_list(sample_tools, default_config):
+    """Templates without tools must not match a later tools list that reuses a freed list's id."""
+    from llm_tools_server import backends
+
+    backends._payload_templates.clear()
+    messages = [{"role": "user", "content": "hi"}]
+    for _ in range(backends._TOOLS_CACHE_MAX_ENTRIES + 1):
+        assert "tools" not in backends._build_payload(messages, [], default_config, 0.0, False, None)
+        backends._tools_cache.clear()  # Frees the empty tool list, so its id can be handed out again
+        payload = backends._build_payload(messages, sample_tools, default_config, 0.0, False, None)
+        assert [t["function"]["name"] for t in payload["tools"]] == [t.name for t in sample_tools]
+
+    # Every template keeps its tools alive, so the ids in its key stay unique
+    assert [held for held, _ in backends._payload_templates.values()] == [(), tuple(sample_tools)]
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_backend_payload_encoding(default_config, monkeypatch, use_orjson):
+    """Payloads sent with orjson must decode to the same JSON as the stdlib path."""
+    import json
+
+    from llm_tools_server import backends
+
+    if use_orjson and not backends.HAS_ORJSON:
+        pytest.skip("orjson not installed")
+    monkeypatch.setattr(backends, "HAS_ORJSON", use_orjson)
+
+    mock_session = Mock()
+    messages = [{"role": "user", "content": "héllo ✓"}]
+    with patch("llm_tools_server.backends._get_session", return_value=mock_session):
+        backends.call_ollama(messages, [], default_config, temperature=0.25)
+
+    kwargs = mock_session.post.call_args.kwargs
+    sent = json.loads(kwargs["data"]) if use_orjson else kwargs["json"]
+    assert sent == {"model": default_config.BACKEND_MODEL, "messages": messages, "temperature": 0.25, "stream": False}
+    if use_orjson:
+        assert kwargs["headers"]["Content-Type"] == "application/json"
+
+
+@pytest.mark.unit
+def test_check_all_backends_probes_concurrently(default_config):
+    """Both health checks should run at the same time and report per backend."""
+    import threading
+
+    from llm_tools_server import backends
+
+    barrier = threading.Barrier(2, timeout=2)
+
+    def fake_check(name):
+        def check(config, timeout):
+            barrier.wait()  # Deadlocks (and times out) if the probes run sequentially
+            return True, f"{name} ok ({timeout}s)"
+
+        return check
+
+    with (
+        patch.object(backends, "check_ollama_health", fake_check("ollama")),
+        patch.object(backends, "check_lmstudio_health", fake_check("lmstudio")),
+    ):
+        results = backends.check_all_backends(default_config, timeout=3)
+
+    assert results == {"ollama": (True, "ollama ok (3s)"), "lmstudio": (True, "lmstudio ok (3s)")}
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_iter_backend_chunks_parses_sse_and_ndjson(monkeypatch, use_orjson):
+    """Streaming lines are decoded once into dicts, stopping at [DONE]."""
+    from llm_tools_server import backends
+
+    if use_orjson and not backends.HAS_ORJSON:
+        pytest.skip("orjson not installed")
+    monkeypatch.setattr(backends, "HAS_ORJSON", use_orjson)
+
+    response = Mock()
+    response.iter_lines.return_value = iter(
+        [
+            b": keep-alive",
+            b'data: {"choices":[{"delta":{"content":"Hi"}}]}',
+            b"",
+            '{"message":{"content":"café"},"done":false}',
+            b"event: ping",
+            b"data: [DONE]",
+            b'data: {"never": "parsed"}',
+        ]
+    )
+
+    assert list(backends.iter_backend_chunks(response)) == [
+        {"choices": [{"delta": {"content": "Hi"}}]},
+        {"message": {"content": "café"}, "done": False},
+    ]
+
+
+@pytest.mark.unit
+def test_health_poller_backs_off_on_failures_and_resets_on_success(default_config):
+    """Repeated failures double the interval up to the cap; a success resets it."""
+    from llm_tools_server.backends import HealthPoller
+
+    results = iter([(True, "ok"), (False, "down"), (False, "down"), (False, "down"), (False, "down"), (True, "ok")])
+    poller = HealthPoller(default_config, check=lambda config, timeout: next(results), min_interval=1, max_interval=3)
+
+    with patch("llm_tools_server.backends.random.uniform", return_value=0):
+        assert poller.poll_once() is True
+        assert poller.interval == 1
+        assert poller.poll_once() is False  # First failure after healthy: probe again soon
+        assert poller.interval == 1
+        poller.poll_once()
+        assert poller.interval == 2
+        poller.poll_once()
+        assert poller.interval == 3  # Capped at max_interval
+        poller.poll_once()
+        assert poller.interval == 3
+        assert poller.consecutive_failures == 4
+        assert poller.poll_once() is True
+
+    assert poller.interval == 1
+    assert poller.consecutive_failures == 0
+    assert poller.message == "ok"
+
+
+@pytest.mark.unit
+def test_health_poller_stops_without_waiting_out_interval(default_config):
+    """stop() interrupts the wait between probes."""
+    import threading
+    import time
+
+    from llm_tools_server.backends import HealthPoller
+
+    probed = threading.Event()
+
+    def check(config, timeout):
+        probed.set()
+        raise RuntimeError("boom")
+
+    poller = HealthPoller(default_config, check=check, min_interval=60, max_interval=60)
+    poller.start()
+    assert probed.wait(2)
+
+    start = time.monotonic()
+    poller.stop(timeout=2)
+    assert time.monotonic() - start < 1
+    assert poller.is_healthy is False
+    assert "boom" in poller.message
+
+
+@pytest.mark.unit
+def test_http2_backend_calls_use_httpx_client(default_config, monkeypatch):
+    """With BACKEND_HTTP2 the request goes through httpx and errors map to requests exceptions."""
+    httpx = pytest.importorskip("httpx")
+
+    from llm_tools_server import backends
+
+    seen = []
+
+    def handler(request):
+        seen.append(request)
+        if request.url.path.endswith("/fail"):
+            return httpx.Response(503)
+        if request.url.path.endswith("/down"):
+            raise httpx.ConnectError("refused", request=request)
+        return httpx.Response(200, content=b'data: {"n": 1}\n\ndata: [DONE]\n')
+
+    client = httpx.Client(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(backends, "_http2_client", client)
+    default_config.BACKEND_HTTP2 = True
+    default_config.BACKEND_RETRY_ATTEMPTS = 1
+
+    with patch("llm_tools_server.backends._get_session") as get_session:
+        response = backends.call_lmstudio([{"role": "user", "content": "hi"}], [], default_config, stream=True)
+        assert list(backends.iter_backend_chunks(response)) == [{"n": 1}]
+        get_session.assert_not_called()
+
+    assert seen[0].headers["Content-Type"] == "application/json"
+    assert seen[0].extensions["timeout"]["read"] == default_config.BACKEND_READ_TIMEOUT
+
+    timeout = (1, 2)
+    with pytest.raises(requests.HTTPError) as excinfo:
+        backends._post_json("http://backend/fail", {}, False, timeout, http2=True)
+    assert excinfo.value.response.status_code == 503
+    with pytest.raises(requests.ConnectionError):
+        backends._post_json("http://backend/down", {}, False, timeout, http2=True)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "error_name,expected", [("ReadTimeout", requests.Timeout), ("RemoteProtocolError", requests.ConnectionError)]
+)
+def test_http2_stream_errors_map_to_requests_exceptions(monkeypatch, error_name, expected):
+    """httpx errors raised while a streamed body is read surface as requests exceptions."""
+    httpx = pytest.importorskip("httpx")
+
+    from llm_tools_server import backends
+
+    class FailingStream(httpx.SyncByteStream):
+        def __iter__(self):
+            yield b'data: {"n": 1}\n\n'
+            raise getattr(httpx, error_name)("stream broke")
+
+    client = httpx.Client(transport=httpx.MockTransport(lambda request: httpx.Response(200, stream=FailingStream())))
+    monkeypatch.setattr(backends, "_http2_client", client)
+
+    response = backends._post_json("http://backend", {}, True, (1, 2), http2=True)
+    chunks = backends.iter_backend_chunks(response)
+    assert next(chunks) == {"n": 1}
+    with pytest.raises(expected):
+        next(chunks)
+
+
+@pytest.mark.unit
+def test_http2_falls_back_to_requests_without_httpx(default_config, monkeypatch):
+    """If httpx[http2] is missing, BACKEND_HTTP2 uses the pooled requests session."""
+    from llm_tools_server import backends
+
+    monkeypatch.setattr(backends, "_http2_client", False)
+    mock_session = Mock()
+    with patch("llm_tools_server.backends._get_session", return_value=mock_session):
+        backends._post_json("http://backend", {"a": 1}, False, (1, 2), http2=True)
+
+    mock_session.post.assert_called_once()
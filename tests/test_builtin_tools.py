@@ -1,5 +1,8 @@
 """Unit tests for built-in tools."""
 
+import re
+from unittest.mock import patch
+
 import pytest
 
 from llm_tools_server.builtin_tools import calculate
@@ -35,3 +38,101 @@ def test_calculate_handles_division_by_zero():
     result = calculate("1/0")
 
     assert "division by zero" in result.lower()
+
+
+@pytest.mark.unit
+def test_calculate_caches_compiled_expressions():
+    """Repeated expressions should reuse the validated, compiled code object."""
+    from llm_tools_server.builtin_tools import _compile_expression
+
+    _compile_expression.cache_clear()
+    assert calculate("2 ** 8") == "256"
+    assert calculate("2 ** 8") == "256"
+    assert calculate("10 / 4") == "2.5"
+    assert calculate("-(3 + 1) * 2") == "-8"
+
+    info = _compile_expression.cache_info()
+    assert info.hits == 1
+    assert info.misses == 3
+    # Rejected expressions are never compiled or cached
+    assert "unsupported" in calculate("__import__('os')").lower()
+    assert _compile_expression.cache_info().currsize == 3
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "expression",
+    [
+        *["42", "42 ", "-5", "-0", "0.1", "-0.0", "2.0", "3.14", "12345678901234567890", "007", "+5", " 42"],
+        *["1" * 5000, "-" + "9" * 5000, "1e400"],  # Past the int digit limit / float range
+    ],
+)
+def test_calculate_literal_fast_path_matches_parsing(expression):
+    """Plain literals skip the parser but format (or fail) exactly as the AST path does."""
+    from llm_tools_server import builtin_tools
+
+    fast = calculate(expression)
+    with patch.object(builtin_tools, "_NUMBER_LITERAL", re.compile(r"(?!)")):  # Never matches
+        assert calculate(expression) == fast
+
+
+@pytest.mark.unit
+def test_calculate_literal_fast_path_skips_parser():
+    """Bare numbers are answered without parsing or compiling."""
+    from llm_tools_server.builtin_tools import _compile_expression
+
+    _compile_expression.cache_clear()
+    assert calculate("12") == "12"
+    assert calculate("-2.50") == "-2.5"
+    assert _compile_expression.cache_info().misses == 0
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "expression,expected",
+    [
+        ("1 << 2", "unsupported operator: lshift"),
+        ("+5", "unsupported operator: uadd"),
+        ("abs(-2)", "unsupported expression type: call"),
+        ("[1, 2]", "unsupported expression type: list"),
+        ("2 * (3 - 'a')", "only numeric constants"),
+    ],
+)
+def test_calculate_rejects_disallowed_nodes(expression, expected):
+    """Every node in the tree must be an allowed constant or operator."""
+    assert expected in calculate(expression).lower()
+
+
+@pytest.mark.unit
+def test_validate_node_handles_deep_nesting_without_recursion():
+    """Validation walks the tree iteratively, so depth isn't bounded by the recursion limit."""
+    import ast
+    import sys
+
+    from llm_tools_server.builtin_tools import _validate_node
+
+    node = ast.Constant(1)
+    for _ in range(sys.getrecursionlimit() * 2):
+        node = ast.BinOp(left=node, op=ast.Add(), right=ast.UnaryOp(op=ast.USub(), operand=ast.Constant(2)))
+    _validate_node(node)
+
+    bad = ast.BinOp(left=node, op=ast.Add(), right=ast.Constant("x"))
+    with pytest.raises(ValueError, match="Only numeric constants"):
+        _validate_node(bad)
+
+
+@pytest.mark.unit
+def test_get_current_datetime_reuses_string_within_a_second(monkeypatch):
+    """The formatted datetime is cached per wall-clock second."""
+    from llm_tools_server import builtin_tools
+
+    clock = iter([1_700_000_000.1, 1_700_000_000.9, 1_700_003_600.0])
+    monkeypatch.setattr(builtin_tools.time, "time", lambda: next(clock))
+    monkeypatch.setattr(builtin_tools, "_datetime_cache", (-1, ""))
+
+    first = builtin_tools.get_current_datetime.invoke({})
+    assert builtin_tools.get_current_datetime.invoke({}) is first
+    later = builtin_tools.get_current_datetime.invoke({})
+
+    assert later != first
+    assert " at " in first
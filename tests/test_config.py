@@ -93,3 +93,40 @@ class TestServerConfig:
         assert config.BACKEND_READ_TIMEOUT == 600
         assert config.BACKEND_RETRY_ATTEMPTS == 5
         assert config.DEBUG_LOG_MAX_BYTES == 5242880
+
+    def test_from_env_loads_dotenv_once(self, monkeypatch):
+        """The .env file is read on the first from_env() call only; env changes are still seen."""
+        from unittest.mock import Mock
+
+        import dotenv
+
+        from llm_tools_server import config as config_module
+
+        load_dotenv = Mock()
+        monkeypatch.setattr(dotenv, "load_dotenv", load_dotenv)
+        monkeypatch.setattr(config_module, "_dotenv_loaded", False)
+
+        monkeypatch.setenv("PORT", "7001")
+        assert ServerConfig.from_env().DEFAULT_PORT == 7001
+        monkeypatch.setenv("PORT", "7002")
+        assert ServerConfig.from_env().DEFAULT_PORT == 7002
+
+        assert load_dotenv.call_count == 1
+
+    def test_subclass_defaults_and_custom_settings(self, monkeypatch):
+        """Subclasses override defaults as class attributes and can add their own settings."""
+        from llm_tools_server import config as config_module
+
+        monkeypatch.setattr(config_module, "_dotenv_loaded", True)
+        monkeypatch.delenv("BACKEND_MODEL", raising=False)
+
+        class MyConfig(ServerConfig):
+            BACKEND_MODEL = "my/model"
+            CUSTOM_SETTING: str = "default"
+
+        config = MyConfig.from_env("MYAPP_")
+        assert config.BACKEND_MODEL == "my/model"
+        assert config.CUSTOM_SETTING == "default"
+        config.CUSTOM_SETTING = "changed"
+        config.EXTRA = 1
+        assert MyConfig().CUSTOM_SETTING == "default"
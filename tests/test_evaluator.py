@@ -0,0 +1,152 @@
+"""Unit tests for the LLM evaluation runner."""
+
+import threading
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+
+from llm_tools_server.eval import Evaluator, TestCase
+
+
+def _fake_send_question(question: str, timeout: int = 120):
+    """Return a canned answer after a short delay to simulate network latency."""
+    time.sleep(0.05)
+    if question.startswith("fail"):
+        return None, 0.05, "HTTP 500: boom", []
+    return f"The answer to {question} is here.", 0.05, None, []
+
+
+@pytest.mark.unit
+def test_run_tests_concurrent_preserves_order():
+    """Concurrent runs should return results in the same order as the input."""
+    evaluator = Evaluator(api_url="http://localhost:8000")
+    cases = [TestCase(question=f"q{i}", description=f"test {i}") for i in range(6)]
+
+    with patch.object(evaluator, "send_question", side_effect=_fake_send_question):
+        results = evaluator.run_tests(cases, max_workers=6)
+
+    assert [r.test_case.question for r in results] == [c.question for c in cases]
+    assert all(r.passed for r in results)
+
+
+@pytest.mark.unit
+def test_run_tests_sizes_connection_pool_for_workers():
+    """The shared session's pool should hold one connection per concurrent worker."""
+    evaluator = Evaluator(api_url="http://localhost:8000")
+    cases = [TestCase(question=f"q{i}", description=f"test {i}") for i in range(3)]
+
+    with patch.object(evaluator, "send_question", side_effect=_fake_send_question):
+        evaluator.run_tests(cases, max_workers=4)
+        assert evaluator.session.get_adapter("http://localhost:8000")._pool_maxsize == 10
+        evaluator.run_tests(cases, max_workers=24)
+
+    assert evaluator.session.get_adapter("http://localhost:8000")._pool_maxsize == 24
+    assert evaluator.session.get_adapter("https://example.com")._pool_maxsize == 24
+
+
+@pytest.mark.unit
+def test_run_tests_concurrent_overlaps_requests():
+    """With max_workers > 1, requests should be in flight at the same time."""
+    evaluator = Evaluator(api_url="http://localhost:8000")
+    cases = [TestCase(question=f"q{i}", description=f"test {i}") for i in range(4)]
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def tracking_send(question, timeout=120):
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        try:
+            return _fake_send_question(question, timeout)
+        finally:
+            with lock:
+                active -= 1
+
+    with patch.object(evaluator, "send_question", side_effect=tracking_send):
+        evaluator.run_tests(cases, max_workers=4)
+
+    assert peak > 1
+
+
+@pytest.mark.unit
+def test_run_tests_concurrent_stop_on_failure_truncates():
+    """stop_on_failure should truncate results at the first failure in input order."""
+    evaluator = Evaluator(api_url="http://localhost:8000")
+    cases = [
+        TestCase(question="q0", description="ok"),
+        TestCase(question="fail1", description="fails"),
+        TestCase(question="q2", description="ok"),
+    ]
+
+    with patch.object(evaluator, "send_question", side_effect=_fake_send_question):
+        results = evaluator.run_tests(cases, stop_on_failure=True, max_workers=2)
+
+    assert len(results) == 2
+    assert results[1].passed is False
+    assert results[1].error == "HTTP 500: boom"
+
+
+@pytest.mark.unit
+def test_run_tests_pipelined_validation_overlaps_requests():
+    """validator_workers should let slow custom validators run while later questions are sent."""
+    evaluator = Evaluator(api_url="http://localhost:8000")
+    sent = []
+    seen_during_validation = []
+
+    def slow_validator(response):
+        time.sleep(0.05)
+        seen_during_validation.append(len(sent))
+        return True, []
+
+    def instant_send(question, timeout=120):
+        sent.append(question)
+        return f"The answer to {question} is here.", 0.0, None, []
+
+    cases = [TestCase(question=f"q{i}", description=f"test {i}", custom_validator=slow_validator) for i in range(3)]
+
+    with patch.object(evaluator, "send_question", side_effect=instant_send):
+        results = evaluator.run_tests(cases, validator_workers=2)
+
+    assert [r.test_case.question for r in results] == [c.question for c in cases]
+    assert all(r.passed for r in results)
+    # The first validation finished only after every question had already been sent
+    assert seen_during_validation[0] == len(cases)
+
+
+@pytest.mark.unit
+def test_validate_response_keyword_matching():
+    """Keyword checks should report overlapping hits, case-insensitively, in keyword order."""
+    from llm_tools_server.eval import validators
+
+    case = TestCase(
+        question="q",
+        description="keywords",
+        expected_keywords=["Four", "our", "vault", "vault secrets", "missing"],
+        unexpected_keywords=["error", "sec"],
+    )
+    passed, issues = validators.validate_response(case, "The answer is FOUR, per our Vault Secrets docs.")
+
+    assert passed is False
+    assert issues == ["Missing expected keywords: missing", "Found unexpected keywords: sec"]
+
+
+@pytest.mark.unit
+def test_evaluator_reuses_session_and_closes_it():
+    """Requests should go through one pooled session that the context manager closes."""
+    with Evaluator(api_url="http://localhost:8000/") as evaluator:
+        response = Mock(status_code=200)
+        response.json.return_value = {"choices": [{"message": {"content": "Four."}}], "tools_used": ["calc"]}
+
+        with patch.object(evaluator.session, "post", return_value=response) as post:
+            assert evaluator.send_question("2+2?") == ("Four.", pytest.approx(0, abs=1), None, ["calc"])
+            evaluator.send_question("3+3?")
+
+        assert post.call_count == 2
+        assert post.call_args.args[0] == "http://localhost:8000/v1/chat/completions"
+
+    with patch.object(Evaluator, "close") as close, Evaluator(api_url="http://localhost:8000"):
+        pass
+    close.assert_called_once()
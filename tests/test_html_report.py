@@ -4,7 +4,7 @@ from pathlib import Path
 
 import pytest
 
-from llm_tools_server.eval import HTMLReporter, TestCase, TestResult, reporters
+from llm_tools_server.eval import HTMLReporter, JSONReporter, TestCase, TestResult, reporters
 
 
 @pytest.fixture
@@ -78,3 +78,70 @@ def test_html_report_renders_markdown_when_available(tmp_path: Path):
         # Fallback preserves raw markdown text
         assert "## Heading" in html
         assert "`code` block" in html
+
+
+@pytest.mark.unit
+def test_html_report_reused_markdown_converter_matches_fresh(tmp_path: Path):
+    """Rows rendered with the shared converter must match rows rendered with a fresh one."""
+    if not reporters.HAS_MARKDOWN:
+        pytest.skip("markdown not installed")
+
+    results = [
+        TestResult(
+            test_case=TestCase(question=f"Q{i}?", description=f"Row {i}"),
+            passed=True,
+            response=text,
+            response_time=0.1,
+        )
+        for i, text in enumerate(
+            [
+                "See [the docs][ref].\n\n[ref]: https://example.com/docs",
+                "No definition for [the docs][ref] here",
+                "| a | b |\n|---|---|\n| 1 | 2 |\n\n```python\nprint('x')\n```",
+            ]
+        )
+    ]
+    output_path = tmp_path / "report.html"
+    reporter = HTMLReporter()
+    reporter.generate(results=results, output_path=output_path)
+
+    html = output_path.read_text(encoding="utf-8")
+    for i, result in enumerate(results, 1):
+        assert reporter._render_row(i, result) in html
+
+
+@pytest.mark.unit
+def test_json_report_failure_keeps_existing_report(tmp_path: Path, sample_results):
+    """A result that can't be serialized must not truncate or replace an existing report."""
+    import json
+
+    output = tmp_path / "report.json"
+    JSONReporter().generate(sample_results, output)
+    report = json.loads(output.read_text())
+    assert [r["description"] for r in report["results"]] == [r.test_case.description for r in sample_results]
+    previous = output.read_bytes()
+
+    bad = TestResult(test_case=TestCase(question="Q?", description="Bad", metadata={"obj": object()}), passed=True)
+    with pytest.raises(TypeError):
+        JSONReporter().generate([*sample_results, bad], output)
+
+    assert output.read_bytes() == previous
+    assert list(tmp_path.iterdir()) == [output]
+
+
+@pytest.mark.unit
+def test_html_report_failure_keeps_existing_report(tmp_path: Path, sample_results, monkeypatch):
+    """A row that fails to render must not truncate or replace an existing report."""
+    output = tmp_path / "report.html"
+    HTMLReporter().generate(sample_results, output)
+    previous = output.read_bytes()
+
+    def failing_row(self, i, result, converter):
+        raise RuntimeError("render failed")
+
+    monkeypatch.setattr(HTMLReporter, "_render_row", failing_row)
+    with pytest.raises(RuntimeError):
+        HTMLReporter().generate(sample_results, output)
+
+    assert output.read_bytes() == previous
+    assert list(tmp_path.iterdir()) == [output]
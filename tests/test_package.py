@@ -0,0 +1,38 @@
+"""Tests for the llm_tools_server package namespace."""
+
+import subprocess
+import sys
+
+import pytest
+
+import llm_tools_server
+
+
+@pytest.mark.unit
+class TestLazyImports:
+    """Test that public names are imported on first access."""
+
+    def test_import_does_not_load_heavy_dependencies(self):
+        """Test that importing the package doesn't import Flask or langchain_core."""
+        code = (
+            "import sys, llm_tools_server; "
+            "print(any(m in sys.modules for m in ('flask', 'langchain_core', 'dotenv', 'requests')))"
+        )
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+        assert result.stdout.strip() == "False"
+
+    def test_public_names_resolve(self):
+        """Test that every name in __all__ resolves to the object in its defining module."""
+        from llm_tools_server.builtin_tools import calculate
+        from llm_tools_server.server import LLMServer
+
+        for name in llm_tools_server.__all__:
+            assert getattr(llm_tools_server, name) is not None
+        assert llm_tools_server.LLMServer is LLMServer
+        assert llm_tools_server.calculate is calculate
+        assert isinstance(llm_tools_server.__version__, str)
+
+    def test_unknown_attribute_raises(self):
+        """Test that unknown attributes still raise AttributeError."""
+        with pytest.raises(AttributeError):
+            llm_tools_server.does_not_exist  # noqa: B018
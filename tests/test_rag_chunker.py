@@ -29,3 +29,30 @@ def test_semantic_chunk_html_creates_parent_and_children():
 
     parent_ids = {parent["chunk_id"] for parent in chunks["parents"]}
     assert all(child["parent_id"] in parent_ids for child in chunks["children"])
+
+
+@pytest.mark.unit
+def test_semantic_chunk_html_strips_nested_boilerplate():
+    """Boilerplate matched by any selector is removed, including matches nested in other matches."""
+    html = (
+        '<html><body><header><nav class="navbar"><a class="edit-link">Edit this page</a></nav></header>'
+        '<div class="sidebar"><div role="navigation"><span class="toc">Sidebar table</span></div></div>'
+        "<main><h1>Intro</h1><p>" + ("keep " * 30) + '<button class="btn copy-btn">Copy</button></p>'
+        '<aside><footer>Aside footer</footer></aside><div aria-label="site breadcrumb">Home / Docs</div></main>'
+        '<footer class="footer" role="contentinfo">Page footer</footer></body></html>'
+    )
+
+    chunks = semantic_chunk_html(
+        html=html,
+        url="https://example.com/docs",
+        child_min_tokens=5,
+        child_max_tokens=50,
+        parent_min_tokens=5,
+        parent_max_tokens=80,
+        absolute_max_tokens=100,
+    )
+
+    text = " ".join(chunk["content"] for chunk in chunks["parents"] + chunks["children"])
+    assert "keep" in text
+    for boilerplate in ("Edit this page", "Sidebar table", "Copy", "Aside footer", "Home / Docs", "Page footer"):
+        assert boilerplate not in text
@@ -1,6 +1,6 @@
 """Unit tests for crawler URL handling (no network)."""
 
-from unittest.mock import Mock
+from unittest.mock import Mock, PropertyMock
 
 import pytest
 import requests
@@ -12,7 +12,7 @@ from llm_tools_server.rag.crawler import DocumentCrawler
 def test_fetch_page_blocks_redirects_to_external_domains(tmp_path, monkeypatch):
     """fetch_page should return empty content when redirected off the base domain."""
 
-    def fake_get(url, headers=None, timeout=None):
+    def fake_get(self, url, headers=None, timeout=None, stream=False):
         # Simulate robots.txt 404 during init
         if url.endswith("/robots.txt"):
             resp = Mock()
@@ -31,7 +31,7 @@ def test_fetch_page_blocks_redirects_to_external_domains(tmp_path, monkeypatch):
         resp.raise_for_status = Mock()
         return resp
 
-    monkeypatch.setattr("llm_tools_server.rag.crawler.requests.get", fake_get)
+    monkeypatch.setattr("llm_tools_server.rag.crawler.requests.Session.get", fake_get)
 
     crawler = DocumentCrawler(base_url="https://docs.example.com", cache_dir=tmp_path)
     result = crawler.fetch_page("https://docs.example.com/start")
@@ -45,9 +45,10 @@ def test_fetch_page_blocks_redirects_to_external_domains(tmp_path, monkeypatch):
 
 @pytest.mark.unit
 def test_fetch_page_skips_non_html_content(tmp_path, monkeypatch):
-    """Non-HTML content types should return empty content with status code."""
+    """Non-HTML content types should return empty content with status code, without downloading the body."""
+    pdf_responses = []
 
-    def fake_get(url, headers=None, timeout=None):
+    def fake_get(self, url, headers=None, timeout=None, stream=False):
         if url.endswith("/robots.txt"):
             resp = Mock()
             resp.text = ""
@@ -55,16 +56,18 @@ def test_fetch_page_skips_non_html_content(tmp_path, monkeypatch):
             resp.raise_for_status.side_effect = requests.exceptions.HTTPError(response=resp)
             return resp
 
+        assert stream
         resp = Mock()
         resp.url = url
         resp.headers = {"content-type": "application/pdf"}
-        resp.text = "%PDF-1.4"
+        type(resp).text = PropertyMock(side_effect=AssertionError("non-HTML body was downloaded"))
         resp.status_code = 200
+        pdf_responses.append(resp)
         resp.ok = True
         resp.raise_for_status = Mock()
         return resp
 
-    monkeypatch.setattr("llm_tools_server.rag.crawler.requests.get", fake_get)
+    monkeypatch.setattr("llm_tools_server.rag.crawler.requests.Session.get", fake_get)
 
     crawler = DocumentCrawler(base_url="https://docs.example.com", cache_dir=tmp_path)
     result = crawler.fetch_page("https://docs.example.com/guide.pdf")
@@ -74,3 +77,720 @@ def test_fetch_page_skips_non_html_content(tmp_path, monkeypatch):
     assert result[0] == "https://docs.example.com/guide.pdf"
     assert result[1] == ""  # No content for non-HTML
     assert result[2] == 200  # Status code still returned for tracking
+    pdf_responses[0].close.assert_called_once()
+
+
+@pytest.mark.unit
+def test_crawler_reuses_pooled_session(tmp_path, monkeypatch):
+    """All crawler requests should go through one session sized for max_workers with default headers."""
+    seen_sessions = []
+
+    def fake_get(self, url, headers=None, timeout=None):
+        seen_sessions.append(self)
+        resp = Mock()
+        resp.url = url
+        resp.headers = {"content-type": "text/html"}
+        resp.text = "<html><body>ok</body></html>" if not url.endswith("/robots.txt") else ""
+        resp.status_code = 200
+        resp.raise_for_status = Mock()
+        return resp
+
+    monkeypatch.setattr("llm_tools_server.rag.crawler.requests.Session.get", fake_get)
+
+    crawler = DocumentCrawler(base_url="https://docs.example.com", cache_dir=tmp_path, max_workers=32)
+    crawler.fetch_page("https://docs.example.com/a")
+    crawler.fetch_page("https://docs.example.com/b")
+
+    assert all(session is crawler.session for session in seen_sessions)
+    assert crawler.session.get_adapter("https://docs.example.com")._pool_maxsize == 32
+    assert crawler.session.headers["User-Agent"] == crawler.user_agent
+    assert crawler.session.headers["Accept-Encoding"].startswith("gzip,deflate")
+
+
+def _robots_404(url):
+    resp = Mock()
+    resp.text = ""
+    resp.status_code = 404
+    resp.raise_for_status.side_effect = requests.exceptions.HTTPError(response=resp)
+    return resp
+
+
+@pytest.mark.unit
+def test_sitemap_index_is_streamed_and_parsed(tmp_path, monkeypatch):
+    """Sitemap indexes and url sets parse with or without the sitemaps.org namespace."""
+    import io
+
+    index = b"""<?xml version="1.0" encoding="UTF-8"?>
+<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+  <sitemap><loc>https://docs.example.com/a.xml</loc><lastmod>2025-01-01</lastmod></sitemap>
+  <sitemap><loc>https://docs.example.com/b.xml</loc></sitemap>
+</sitemapindex>"""
+    sitemaps = {
+        "https://docs.example.com/sitemap.xml": index,
+        "https://docs.example.com/a.xml": b"""<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+  <url><loc>https://docs.example.com/new/</loc><lastmod>2025-02-01</lastmod></url>
+  <url><loc>https://docs.example.com/old?x=1</loc><lastmod></lastmod></url>
+  <url><loc>https://docs.example.com/private/page</loc></url>
+  <url><lastmod>2025-03-01</lastmod></url>
+</urlset>""",
+        "https://docs.example.com/b.xml": b"""<urlset>
+  <url><loc>https://docs.example.com/plain</loc><lastmod>2024-12-01</lastmod></url>
+</urlset>""",
+    }
+    streamed = []
+
+    def fake_get(self, url, headers=None, timeout=None, stream=False):
+        if url.endswith("/robots.txt"):
+            return _robots_404(url)
+        if url not in sitemaps:
+            raise requests.exceptions.ConnectionError(url)
+        streamed.append(stream)
+        resp = Mock()
+        resp.status_code = 200
+        resp.headers = {}
+        resp.raw = io.BytesIO(sitemaps[url])
+        resp.__enter__ = Mock(return_value=resp)
+        resp.__exit__ = Mock(return_value=False)
+        return resp
+
+    monkeypatch.setattr("llm_tools_server.rag.crawler.requests.Session.get", fake_get)
+
+    crawler = DocumentCrawler(
+        base_url="https://docs.example.com",
+        cache_dir=tmp_path,
+        url_exclude_patterns=[r"/private/"],
+        rate_limit_delay=0,
+        show_progress=False,
+    )
+    urls = crawler._discover_sitemap()
+
+    assert urls == [
+        {"url": "https://docs.example.com/new", "lastmod": "2025-02-01"},
+        {"url": "https://docs.example.com/old", "lastmod": None},
+        {"url": "https://docs.example.com/plain", "lastmod": "2024-12-01"},
+    ]
+    assert streamed and all(streamed)
+    assert crawler._parse_sitemap_xml(b"<urlset><url><loc>broken") == []
+
+
+@pytest.mark.unit
+def test_sitemap_entries_are_filtered_before_lastmod_is_read():
+    """Rejected page URLs are dropped inside the parser; sitemap index entries are never filtered."""
+    import io
+
+    from llm_tools_server.rag.crawler import _iter_sitemap_entries
+
+    xml = b"""<root>
+  <url><loc>https://a/keep/</loc><lastmod>2025-01-01</lastmod></url>
+  <url><loc>https://a/skip</loc><lastmod>2025-01-02</lastmod></url>
+  <sitemap><loc>https://a/skip.xml</loc></sitemap>
+</root>"""
+    seen = []
+
+    def url_filter(loc):
+        seen.append(loc)
+        return None if "skip" in loc else loc.rstrip("/")
+
+    entries = list(_iter_sitemap_entries(io.BytesIO(xml), url_filter))
+
+    assert entries == [("url", "https://a/keep", "2025-01-01"), ("sitemap", "https://a/skip.xml", None)]
+    assert seen == ["https://a/keep/", "https://a/skip"]
+
+
+@pytest.mark.unit
+def test_url_patterns_are_merged_into_single_regex(tmp_path, monkeypatch):
+    """Include/exclude lists compile to one alternation and keep per-pattern semantics."""
+    import re
+
+    from llm_tools_server.rag.crawler import _combine_patterns, _PatternList
+
+    monkeypatch.setattr("llm_tools_server.rag.crawler.requests.Session.get", lambda self, url, **kw: _robots_404(url))
+    crawler = DocumentCrawler(
+        base_url="https://docs.example.com",
+        cache_dir=tmp_path,
+        url_include_patterns=[r"/docs/", r"/(api|sdk)/v\d+", r"/guides/.*"],
+        url_exclude_patterns=[r"/private/", r"\.pdf$", r"/old-"],
+        show_progress=False,
+    )
+
+    assert isinstance(crawler._include_matcher.regex, re.Pattern)
+    assert isinstance(crawler._exclude_matcher.regex, re.Pattern)
+    assert crawler._should_crawl_url("https://docs.example.com/docs/intro")
+    assert crawler._should_crawl_url("https://docs.example.com/sdk/v2/ref")
+    assert not crawler._should_crawl_url("https://docs.example.com/blog/post")
+    assert not crawler._should_crawl_url("https://docs.example.com/docs/private/x")
+    assert not crawler._should_crawl_url("https://docs.example.com/docs/guide.pdf")
+    assert crawler._should_crawl_url("https://docs.example.com/guides/x")
+    assert not crawler._should_crawl_url("https://docs.example.com/docs/old-page")
+
+    assert _combine_patterns([]) is None
+    single = re.compile(r"/docs/")
+    assert _combine_patterns([single]) is single
+
+    # Backreferences and inline global flags can't be embedded, so the list is searched in turn
+    for patterns in ([r"(a)\1", r"/b"], [r"(?i)/A", r"/b"]):
+        combined = _combine_patterns([re.compile(p) for p in patterns])
+        assert isinstance(combined, _PatternList)
+        assert combined.search("/b")
+    assert _combine_patterns([re.compile(r"(a)\1"), re.compile("/b")]).search("xaa")
+    assert _combine_patterns([re.compile(r"(?i)/A"), re.compile("/b")]).search("/a")
+
+
+@pytest.mark.unit
+def test_recursive_crawl_visits_pages_breadth_first(tmp_path, monkeypatch):
+    """Recursive crawl discovers same-site links level by level and skips external ones."""
+    pages = {
+        "https://docs.example.com": '<a href="/a">a</a><a href="/b">b</a><a href="https://other.com/x">x</a>',
+        "https://docs.example.com/a": '<a href="/a/deep">deep</a><a href="mailto:me@example.com">m</a>',
+        "https://docs.example.com/b": '<link href="/style.css"><a name="top"></a><A HREF="/a">a</A>',
+        "https://docs.example.com/a/deep": "",
+    }
+
+    def fake_get(self, url, headers=None, timeout=None, **kwargs):
+        resp = Mock()
+        resp.status_code = 200
+        resp.content = pages[url].encode()
+        resp.encoding = "utf-8"
+        resp.headers = {"content-type": "text/html; charset=utf-8"}
+        resp.raise_for_status = Mock()
+        return resp
+
+    monkeypatch.setattr("llm_tools_server.rag.crawler.requests.Session.get", fake_get)
+
+    crawler = DocumentCrawler(
+        base_url="https://docs.example.com",
+        cache_dir=tmp_path,
+        rate_limit_delay=0,
+        show_progress=False,
+    )
+
+    assert [u["url"] for u in crawler._recursive_crawl()] == [
+        "https://docs.example.com",
+        "https://docs.example.com/a",
+        "https://docs.example.com/b",
+        "https://docs.example.com/a/deep",
+    ]
+
+
+@pytest.mark.unit
+def test_recursive_crawl_batches_respect_max_pages(tmp_path, monkeypatch):
+    """Parallel batches never fetch more pages than max_pages."""
+    fetched = []
+
+    def fake_get(self, url, headers=None, timeout=None, **kwargs):
+        fetched.append(url)
+        resp = Mock()
+        resp.status_code = 200
+        resp.content = "".join(f'<a href="/p{i}">p</a>' for i in range(10)).encode()
+        resp.headers = {"content-type": "text/html"}
+        resp.raise_for_status = Mock()
+        return resp
+
+    monkeypatch.setattr("llm_tools_server.rag.crawler.requests.Session.get", fake_get)
+
+    crawler = DocumentCrawler(
+        base_url="https://docs.example.com",
+        cache_dir=tmp_path,
+        rate_limit_delay=0,
+        max_workers=4,
+        max_pages=3,
+        show_progress=False,
+    )
+    urls = [u["url"] for u in crawler._recursive_crawl()]
+
+    # robots.txt fetches go through the same mock during __init__
+    pages = [url for url in fetched if not url.endswith("robots.txt")]
+    assert urls == ["https://docs.example.com", "https://docs.example.com/p0", "https://docs.example.com/p1"]
+    assert sorted(pages) == sorted(urls)
+
+
+@pytest.mark.unit
+def test_rate_limiter_spaces_requests_across_threads(monkeypatch):
+    """Each wait() claims the next slot, so concurrent callers stay rate_limit_delay apart."""
+    from llm_tools_server.rag.crawler import _RateLimiter
+
+    clock = {"now": 100.0}
+    sleeps = []
+    monkeypatch.setattr("llm_tools_server.rag.crawler.time.monotonic", lambda: clock["now"])
+    monkeypatch.setattr("llm_tools_server.rag.crawler.time.sleep", sleeps.append)
+
+    limiter = _RateLimiter(0.5)
+    for _ in range(3):
+        limiter.wait()
+    clock["now"] = 110.0
+    limiter.wait()
+
+    assert sleeps == [0.5, 1.0]
+    _RateLimiter(0).wait()
+    assert sleeps == [0.5, 1.0]
+
+
+@pytest.mark.unit
+def test_normalize_url_is_cached(tmp_path, monkeypatch):
+    """Repeated links are normalized once and served from the module-level cache."""
+    from llm_tools_server.rag.crawler import _normalize_url
+
+    monkeypatch.setattr("llm_tools_server.rag.crawler.requests.Session.get", lambda self, url, **kw: _robots_404(url))
+    crawler = DocumentCrawler(base_url="https://docs.example.com", cache_dir=tmp_path, show_progress=False)
+    _normalize_url.cache_clear()
+
+    for _ in range(3):
+        assert crawler._normalize_url("https://docs.example.com/a/?q=1#top") == "https://docs.example.com/a"
+    assert crawler._normalize_url("https://docs.example.com/b#x?y") == "https://docs.example.com/b"
+
+    info = _normalize_url.cache_info()
+    assert (info.hits, info.misses) == (2, 2)
+
+
+@pytest.mark.unit
+def test_recursive_crawl_does_not_fetch_pages_at_max_depth(tmp_path, monkeypatch):
+    """Pages at max_crawl_depth are listed but not fetched, and each URL is queued once."""
+    fetched = []
+
+    def fake_get(self, url, headers=None, timeout=None, **kwargs):
+        fetched.append(url)
+        resp = Mock()
+        resp.status_code = 200
+        resp.content = b'<a href="/a">a</a><a href="/a/">again</a><a href="/">home</a>'
+        resp.headers = {"content-type": "text/html"}
+        resp.raise_for_status = Mock()
+        return resp
+
+    monkeypatch.setattr("llm_tools_server.rag.crawler.requests.Session.get", fake_get)
+
+    crawler = DocumentCrawler(
+        base_url="https://docs.example.com",
+        cache_dir=tmp_path,
+        max_crawl_depth=1,
+        rate_limit_delay=0,
+        show_progress=False,
+    )
+    fetched.clear()  # Drop the robots.txt requests made during __init__
+
+    assert [u["url"] for u in crawler._recursive_crawl()] == ["https://docs.example.com", "https://docs.example.com/a"]
+    assert fetched == ["https://docs.example.com"]
+
+
+@pytest.mark.unit
+def test_literal_url_patterns_use_string_checks():
+    """Escaped-literal patterns become startswith prefixes or substring checks; the rest stay regexes."""
+    import re
+
+    from llm_tools_server.rag.crawler import _UrlPatternSet
+
+    matcher = _UrlPatternSet(
+        [re.compile(p) for p in (r"^https://docs\.example\.com/api/", r"/private/", r"^/v\d+/", r"\.pdf$")]
+    )
+
+    assert matcher.prefixes == ("https://docs.example.com/api/",)
+    assert matcher.substrings == ("/private/",)
+    assert matcher.regex.pattern == r"(?:^/v\d+/)|(?:\.pdf$)"
+    assert matcher.search("https://docs.example.com/api/ref")
+    assert not matcher.search("https://docs.example.com/apix")
+    assert not matcher.search("https://docsXexample.com/api/ref")
+    assert matcher.search("https://a/private/b")
+    assert matcher.search("/v2/x")
+    assert matcher.search("https://a/file.pdf")
+    assert not matcher.search("https://a/file.pdfx")
+
+
+@pytest.mark.unit
+def test_robots_txt_sitemaps_and_rules_are_parsed(tmp_path, monkeypatch):
+    """Sitemap lines are found case-insensitively (CRLF, indentation, empty values) and rules still apply."""
+    robots = (
+        "User-agent: *\r\n"
+        "Disallow: /private/\r\n"
+        "Sitemap: https://docs.example.com/sitemap.xml\r\n"
+        "  sitemap:https://docs.example.com/other.xml  \r\n"
+        "SITEMAP:\r\n"
+        "Disallow: /sitemap: not-a-directive\r\n"
+    )
+
+    def fake_get(self, url, timeout=None, **kwargs):
+        resp = Mock()
+        resp.text = robots
+        resp.raise_for_status = Mock()
+        return resp
+
+    monkeypatch.setattr("llm_tools_server.rag.crawler.requests.Session.get", fake_get)
+
+    crawler = DocumentCrawler(base_url="https://docs.example.com", cache_dir=tmp_path, show_progress=False)
+
+    assert crawler.sitemap_urls_from_robots == [
+        "https://docs.example.com/sitemap.xml",
+        "https://docs.example.com/other.xml",
+    ]
+    assert crawler.robots_loaded
+    assert not crawler.robot_parser.can_fetch(crawler.user_agent, "https://docs.example.com/private/x")
+    assert crawler.robot_parser.can_fetch(crawler.user_agent, "https://docs.example.com/public")
+
+
+@pytest.mark.unit
+def test_fetch_page_conditional_sends_validators_and_handles_304(tmp_path, monkeypatch):
+    """Validators go out as If-None-Match/If-Modified-Since; a 304 returns no content and the new validators."""
+    sent = []
+
+    def fake_get(self, url, headers=None, timeout=None, **kwargs):
+        if url.endswith("/robots.txt"):
+            return _robots_404(url)
+        sent.append(headers)
+        resp = Mock()
+        resp.url = url
+        resp.status_code = 304 if headers else 200
+        resp.ok = True
+        resp.headers = {"content-type": "text/html", "ETag": '"v2"', "Last-Modified": "Wed, 01 Jan 2025 00:00:00 GMT"}
+        resp.text = "<html>page</html>"
+        return resp
+
+    monkeypatch.setattr("llm_tools_server.rag.crawler.requests.Session.get", fake_get)
+    crawler = DocumentCrawler(base_url="https://docs.example.com", cache_dir=tmp_path, show_progress=False)
+    url = "https://docs.example.com/a"
+    validators = {"etag": '"v2"', "last_modified": "Wed, 01 Jan 2025 00:00:00 GMT"}
+
+    assert crawler.fetch_page_conditional(url) == (url, "<html>page</html>", 200, validators)
+    assert crawler.fetch_page_conditional(url, etag='"v1"', last_modified="Tue") == (url, "", 304, validators)
+    assert crawler.fetch_page(url) == (url, "<html>page</html>", 200)
+    assert sent == [None, {"If-None-Match": '"v1"', "If-Modified-Since": "Tue"}, None]
+
+
+@pytest.mark.unit
+def test_rate_limiter_backs_off_on_429_and_recovers(monkeypatch):
+    """429/503 double the delay and honor Retry-After; successes shrink it back to the configured delay."""
+    from llm_tools_server.rag.crawler import _RateLimiter, _retry_after_seconds
+
+    clock = {"now": 100.0}
+    sleeps = []
+    monkeypatch.setattr("llm_tools_server.rag.crawler.time.monotonic", lambda: clock["now"])
+    monkeypatch.setattr("llm_tools_server.rag.crawler.time.sleep", sleeps.append)
+
+    def response(status, retry_after=None):
+        resp = Mock()
+        resp.status_code = status
+        resp.headers = {"Retry-After": retry_after} if retry_after else {}
+        return resp
+
+    limiter = _RateLimiter(0.1, max_delay=5.0)
+    limiter.wait(backoff_only=True)
+    assert sleeps == []  # Healthy: page fetches aren't throttled
+
+    limiter.record(response(429, "3"))
+    assert limiter.delay == 1.0
+    limiter.wait(backoff_only=True)
+    assert sleeps == [3.0]  # Retry-After wins over the delay
+
+    for _ in range(3):
+        limiter.record(response(503))
+    assert limiter.delay == 5.0  # Capped at max_delay
+
+    for _ in range(100):
+        limiter.record(response(200))
+    assert limiter.delay == 0.1
+    limiter.record(response(404))
+    assert limiter.delay == 0.1
+
+    assert _retry_after_seconds("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+    assert _retry_after_seconds("soon") is None
+
+
+@pytest.mark.unit
+def test_extract_links_keeps_only_same_site_http_links(tmp_path, monkeypatch):
+    """Links are resolved against the page and filtered by scheme and host after one urlsplit."""
+    html = (
+        '<a href="#top">t</a><a href="mailto:a@b.c">m</a><a href="tel:123">p</a><a href="javascript:void(0)">j</a>'
+        '<a href="ftp://docs.example.com/f">f</a><a href="//other.com/x">o</a><a href="https://other.com/y">o</a>'
+        '<a href="/abs/">a</a><a href="rel?x=1">r</a><a href="../up">u</a><a href="https://www.docs.example.com/w">w</a>'
+        '<a href="/a/./b/../c#s">d</a><a href="/p;v?q">p</a><a href="//docs.example.com/pr">p</a>'
+        '<a href="https://docs.example.com/x/../abs2/">x</a><a href="https:///nohost">n</a>'
+    )
+
+    def fake_get(self, url, timeout=None, **kwargs):
+        if url.endswith("/robots.txt"):
+            return _robots_404(url)
+        resp = Mock()
+        resp.status_code = 200
+        resp.content = html.encode()
+        resp.headers = {"content-type": "text/html"}
+        resp.raise_for_status = Mock()
+        return resp
+
+    monkeypatch.setattr("llm_tools_server.rag.crawler.requests.Session.get", fake_get)
+    crawler = DocumentCrawler(base_url="https://docs.example.com", cache_dir=tmp_path, show_progress=False)
+
+    assert crawler._extract_links("https://docs.example.com/guide/page") == [
+        "https://docs.example.com/abs",
+        "https://docs.example.com/guide/rel",
+        "https://docs.example.com/up",
+        "https://www.docs.example.com/w",
+        "https://docs.example.com/a/c",
+        "https://docs.example.com/p;v",
+        "https://docs.example.com/pr",
+        "https://docs.example.com/x/../abs2",  # urljoin() leaves absolute paths as written
+        "https://docs.example.com/nohost",
+    ]
+
+
+@pytest.mark.unit
+def test_discover_and_crawl_dedupes_and_keeps_newest_pages(tmp_path, monkeypatch):
+    """Sitemap entries override manual URLs, and max_pages keeps the newest URLs in stable order."""
+    monkeypatch.setattr("llm_tools_server.rag.crawler.requests.Session.get", lambda self, url, **kw: _robots_404(url))
+    crawler = DocumentCrawler(
+        base_url="https://docs.example.com",
+        cache_dir=tmp_path,
+        manual_urls=["https://docs.example.com/b/", "https://docs.example.com/manual"],
+        max_pages=3,
+        show_progress=False,
+    )
+    sitemap = [
+        {"url": "https://docs.example.com/a", "lastmod": None},
+        {"url": "https://docs.example.com/b", "lastmod": "2025-01-01"},
+        {"url": "https://docs.example.com/c", "lastmod": "2025-03-01"},
+        {"url": "https://docs.example.com/d", "lastmod": None},
+    ]
+    monkeypatch.setattr(crawler, "_discover_sitemap", lambda: sitemap)
+
+    assert crawler.discover_and_crawl() == [
+        {"url": "https://docs.example.com/c", "lastmod": "2025-03-01"},
+        {"url": "https://docs.example.com/b", "lastmod": "2025-01-01"},
+        {"url": "https://docs.example.com/manual"},
+    ]
+
+    crawler.max_pages = None
+    assert [u["url"] for u in crawler.discover_and_crawl()] == [
+        "https://docs.example.com/c",
+        "https://docs.example.com/b",
+        "https://docs.example.com/manual",
+        "https://docs.example.com/a",
+        "https://docs.example.com/d",
+    ]
+
+
+@pytest.mark.unit
+def test_robots_rules_match_stdlib_can_fetch():
+    """The resolved-once rules give the same answers as RobotFileParser.can_fetch()."""
+    from urllib.robotparser import RobotFileParser
+
+    from llm_tools_server.rag.crawler import DEFAULT_USER_AGENT, _RobotsRules
+
+    robots_files = [
+        "User-agent: *\nDisallow: /private/\nDisallow: /tmp\n",
+        "User-agent: *\nAllow: /private/public\nDisallow: /private/\n",
+        "User-agent: otherbot\nDisallow: /\n\nUser-agent: *\nDisallow: /search\nDisallow:\n",
+        "User-agent: *\nDisallow: *\n",
+        "User-agent: otherbot\nDisallow: /\n",
+        "",
+    ]
+    urls = [
+        "https://docs.example.com/",
+        "https://docs.example.com",
+        "https://docs.example.com/private/x",
+        "https://docs.example.com/private/public/page",
+        "https://docs.example.com/tmpfile",
+        "https://docs.example.com/search?q=a%20b",
+        "https://docs.example.com/caf%C3%A9/p%2Fq",
+    ]
+    for robots_txt in robots_files:
+        parser = RobotFileParser()
+        parser.parse(robots_txt.splitlines())
+        rules = _RobotsRules(parser, DEFAULT_USER_AGENT)
+        for url in urls:
+            assert rules.can_fetch(url) == parser.can_fetch(DEFAULT_USER_AGENT, url), (robots_txt, url)
+
+
+@pytest.mark.unit
+def test_sort_by_lastmod_matches_reverse_sort():
+    """Entries sort newest first with undated entries last, in the order a stable reverse sort gives."""
+    from llm_tools_server.rag.crawler import _sort_by_lastmod
+
+    entries = [
+        {"url": "a", "lastmod": None},
+        {"url": "b", "lastmod": "2024-01-01"},
+        {"url": "c"},
+        {"url": "d", "lastmod": "2025-06-01"},
+        {"url": "e", "lastmod": ""},
+        {"url": "f", "lastmod": "2024-01-01"},
+    ]
+    expected = sorted(entries, key=lambda x: x.get("lastmod") or "", reverse=True)
+
+    result = _sort_by_lastmod(entries)
+
+    assert [e["url"] for e in result] == [e["url"] for e in expected] == ["d", "b", "f", "a", "c", "e"]
+    assert result[3]["lastmod"] is None
+    assert _sort_by_lastmod(entries[1::2]) == sorted(entries[1::2], key=lambda x: x["lastmod"], reverse=True)
+
+
+@pytest.mark.unit
+def test_gzipped_sitemap_is_inflated_while_parsing(tmp_path, monkeypatch):
+    """sitemap.xml.gz bodies are decompressed; Content-Encoding: gzip is still undone by urllib3."""
+    import gzip
+    import io
+
+    from urllib3 import HTTPResponse
+
+    xml = b"""<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+  <url><loc>https://docs.example.com/gz</loc><lastmod>2025-01-01</lastmod></url>
+</urlset>"""
+    bodies = {
+        # .xml.gz file served as application/x-gzip, no Content-Encoding
+        "https://docs.example.com/sitemap.xml.gz": (gzip.compress(xml), {}),
+        # Plain XML compressed only for transfer
+        "https://docs.example.com/sitemap.xml": (gzip.compress(xml), {"Content-Encoding": "gzip"}),
+    }
+
+    def fake_get(self, url, timeout=None, stream=False, **kwargs):
+        if url.endswith("/robots.txt"):
+            return _robots_404(url)
+        body, headers = bodies[url]
+        resp = requests.Response()
+        resp.status_code = 200
+        resp.raw = HTTPResponse(body=io.BytesIO(body), headers=headers, status=200, preload_content=False)
+        return resp
+
+    monkeypatch.setattr("llm_tools_server.rag.crawler.requests.Session.get", fake_get)
+
+    crawler = DocumentCrawler(base_url="https://docs.example.com", cache_dir=tmp_path, rate_limit_delay=0)
+
+    for url in bodies:
+        assert crawler._fetch_and_parse_sitemap(url) == [
+            {"url": "https://docs.example.com/gz", "lastmod": "2025-01-01"}
+        ]
+
+
+@pytest.mark.unit
+def test_async_page_fetches_overlap(tmp_path, monkeypatch):
+    """afetch_page() runs fetches in worker threads so asyncio.gather() overlaps them."""
+    import asyncio
+    import threading
+    import time
+
+    monkeypatch.setattr("llm_tools_server.rag.crawler.requests.Session.get", lambda self, url, **kw: _robots_404(url))
+    crawler = DocumentCrawler(base_url="https://docs.example.com", cache_dir=tmp_path)
+
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def slow_fetch(url, etag=None, last_modified=None):
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        time.sleep(0.05)
+        with lock:
+            active -= 1
+        return url, "<html></html>", 200, {}
+
+    crawler.fetch_page_conditional = slow_fetch
+
+    async def fan_out():
+        return await asyncio.gather(*(crawler.afetch_page(f"https://docs.example.com/{i}") for i in range(3)))
+
+    results = asyncio.run(fan_out())
+
+    assert peak > 1
+    assert results[2] == ("https://docs.example.com/2", "<html></html>", 200)
+
+
+@pytest.mark.unit
+def test_same_site_netloc_matches_apex_and_www(tmp_path, monkeypatch):
+    """Exact apex/www netlocs hit the frozenset; other casings still match after lowercasing."""
+    monkeypatch.setattr("llm_tools_server.rag.crawler.requests.Session.get", lambda self, url, **kw: _robots_404(url))
+    crawler = DocumentCrawler(base_url="https://WWW.Docs.Example.com/", cache_dir=tmp_path)
+
+    assert crawler._site_netlocs == {"docs.example.com", "www.docs.example.com"}
+    for netloc in ("docs.example.com", "www.docs.example.com", "Docs.Example.COM", "WWW.docs.example.com"):
+        assert crawler._same_site_netloc(netloc)
+    for netloc in ("other.com", "docs.example.com.evil.net", "api.docs.example.com", "docs.example.com:8443"):
+        assert not crawler._same_site_netloc(netloc)
+
+
+@pytest.mark.unit
+def test_sub_sitemaps_without_lastmod_are_revalidated(tmp_path, monkeypatch):
+    """Sub-sitemaps without lastmod send their cached ETag and reuse cached URLs on 304."""
+    import io
+
+    sent_headers = []
+
+    def fake_get(self, url, headers=None, timeout=None, stream=False):
+        if url.endswith("/robots.txt"):
+            return _robots_404(url)
+        sent_headers.append(headers)
+        resp = Mock()
+        resp.headers = {"ETag": '"v1"'}
+        if headers and headers.get("If-None-Match") == '"v1"':
+            resp.status_code = 304
+        else:
+            resp.status_code = 200
+            resp.raw = io.BytesIO(b"<urlset><url><loc>https://docs.example.com/p</loc></url></urlset>")
+        resp.__enter__ = Mock(return_value=resp)
+        resp.__exit__ = Mock(return_value=False)
+        return resp
+
+    monkeypatch.setattr("llm_tools_server.rag.crawler.requests.Session.get", fake_get)
+    crawler = DocumentCrawler(base_url="https://docs.example.com", cache_dir=tmp_path, rate_limit_delay=0)
+    sub_sitemaps = [{"url": "https://docs.example.com/a.xml", "lastmod": None}]
+
+    first = crawler._parse_sub_sitemaps(list(sub_sitemaps))
+    second = crawler._parse_sub_sitemaps(list(sub_sitemaps))
+
+    assert first == second == [{"url": "https://docs.example.com/p", "lastmod": None}]
+    assert sent_headers == [None, {"If-None-Match": '"v1"'}]
+    cached = crawler._load_sitemap_cache()["sub_sitemaps"]["https://docs.example.com/a.xml"]
+    assert cached["etag"] == '"v1"'
+
+
+@pytest.mark.unit
+def test_discover_sitemap_falls_back_to_gzipped_sitemap(tmp_path, monkeypatch):
+    """sitemap.xml.gz is tried after the uncompressed locations."""
+    import gzip
+    import io
+
+    tried = []
+
+    def fake_get(self, url, headers=None, timeout=None, stream=False):
+        if url.endswith("/robots.txt"):
+            return _robots_404(url)
+        tried.append(url.rsplit("/", 1)[1])
+        resp = Mock()
+        resp.headers = {}
+        if url.endswith(".gz"):
+            resp.status_code = 200
+            resp.raw = io.BytesIO(gzip.compress(b"<urlset><url><loc>https://docs.example.com/z</loc></url></urlset>"))
+        else:
+            resp.status_code = 404
+            resp.raise_for_status.side_effect = requests.exceptions.HTTPError(response=resp)
+        resp.__enter__ = Mock(return_value=resp)
+        resp.__exit__ = Mock(return_value=False)
+        return resp
+
+    monkeypatch.setattr("llm_tools_server.rag.crawler.requests.Session.get", fake_get)
+    crawler = DocumentCrawler(base_url="https://docs.example.com", cache_dir=tmp_path, rate_limit_delay=0)
+
+    assert crawler._discover_sitemap() == [{"url": "https://docs.example.com/z", "lastmod": None}]
+    assert tried == ["sitemap.xml", "sitemap_index.xml", "server-sitemap.xml", "sitemap.xml.gz"]
+
+
+@pytest.mark.unit
+def test_fetch_page_skips_oversized_html(tmp_path, monkeypatch):
+    """HTML declaring a Content-Length over MAX_PAGE_BYTES is skipped without reading the body."""
+    from llm_tools_server.rag.crawler import MAX_PAGE_BYTES
+
+    def fake_get(self, url, headers=None, timeout=None, stream=False):
+        if url.endswith("/robots.txt"):
+            return _robots_404(url)
+        resp = Mock()
+        resp.url = url
+        resp.headers = {"content-type": "text/html", "content-length": str(MAX_PAGE_BYTES + 1)}
+        if url.endswith("/ok"):
+            resp.headers["content-length"] = "bogus"  # Unparseable lengths are ignored
+            resp.text = "<html>ok</html>"
+        else:
+            type(resp).text = PropertyMock(side_effect=AssertionError("oversized body was downloaded"))
+        resp.status_code = 200
+        resp.ok = True
+        return resp
+
+    monkeypatch.setattr("llm_tools_server.rag.crawler.requests.Session.get", fake_get)
+    crawler = DocumentCrawler(base_url="https://docs.example.com", cache_dir=tmp_path)
+
+    assert crawler.fetch_page("https://docs.example.com/huge") == ("https://docs.example.com/huge", "", 200)
+    assert crawler.fetch_page("https://docs.example.com/ok")[1] == "<html>ok</html>"
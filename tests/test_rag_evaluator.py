@@ -0,0 +1,175 @@
+"""Unit tests for RAG retrieval evaluation (no models or network)."""
+
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import numpy as np
+import pytest
+
+from llm_tools_server.eval import RAGEvaluator, RAGTestCase
+
+
+def _make_index():
+    """Build a stand-in index whose batched search returns one fixed result per query."""
+    index = Mock()
+    index.config = SimpleNamespace(
+        rerank_enabled=False,
+        rerank_model="cross-encoder/ms-marco-MiniLM-L-6-v2",
+        hybrid_bm25_weight=0.3,
+        hybrid_semantic_weight=0.7,
+    )
+    index.cross_encoder = None
+    index.embed_queries.side_effect = lambda queries: np.arange(len(queries), dtype=np.float32)[:, None]
+    index.search_batch.side_effect = lambda queries, top_k, query_vectors=None: [
+        [{"url": f"https://docs.example.com/{q}", "text": q}] for q in queries
+    ]
+    return index
+
+
+@pytest.mark.unit
+def test_ab_comparison_embeds_queries_once():
+    """Both A/B runs should reuse one set of query embeddings."""
+    index = _make_index()
+    evaluator = RAGEvaluator(index)
+    tests = [
+        RAGTestCase(query="auth", description="auth", relevant_urls=["https://docs.example.com/auth"]),
+        RAGTestCase(query="tls", description="tls", relevant_urls=["https://docs.example.com/tls"]),
+    ]
+
+    comparison = evaluator.run_ab_comparison(
+        tests, config_a={"hybrid_bm25_weight": 0.5}, config_b={"hybrid_bm25_weight": 0.1}
+    )
+
+    index.embed_queries.assert_called_once_with(["auth", "tls"])
+    # Each query is searched on its own with its row of the shared embeddings, once per config
+    assert [call.args[0] for call in index.search_batch.call_args_list] == [["auth"], ["tls"]] * 2
+    assert [call.kwargs["query_vectors"].tolist() for call in index.search_batch.call_args_list] == [[[0]], [[1]]] * 2
+    assert comparison["summary_a"]["mean_recall"] == 1.0
+    assert comparison["summary_b"]["mean_recall"] == 1.0
+    assert index.config.hybrid_bm25_weight == 0.3  # original config restored
+
+
+@pytest.mark.unit
+def test_ab_comparison_matches_run_tests_under_config_overrides(tmp_path):
+    """Each A/B arm retrieves exactly what run_tests() does under the same overrides."""
+    from langchain_community.retrievers import BM25Retriever
+    from langchain_community.vectorstores import FAISS
+    from langchain_core.documents import Document
+    from langchain_core.embeddings import DeterministicFakeEmbedding
+
+    from llm_tools_server.rag import DocSearchIndex, RAGConfig
+
+    index = DocSearchIndex(
+        RAGConfig(base_url="https://example.com", cache_dir=tmp_path, rerank_enabled=False, search_top_k=3)
+    )
+    index.chunks = [
+        Document(page_content=f"page {i} about {topic}", metadata={"chunk_id": f"chunk-{i}", "url": f"/{topic}/{i}"})
+        for i, topic in enumerate(["vault", "consul", "nomad", "terraform", "packer", "vault", "consul"])
+    ]
+    index.embeddings = DeterministicFakeEmbedding(size=16)
+    index.vectorstore = FAISS.from_documents(index.chunks, index.embeddings)
+    index.bm25_retriever = BM25Retriever.from_documents(index.chunks, k=9)
+    index._rebuild_ensemble()
+    evaluator = RAGEvaluator(index)
+    tests = [
+        RAGTestCase(query=q, description=q, relevant_urls=["/vault/0"], top_k=7)
+        for q in ["vault secrets", "consul service mesh", "nomad jobs"]
+    ]
+    config_a = {"search_top_k": 1}
+    config_b = {"retriever_candidate_multiplier": 1, "hybrid_bm25_weight": 0.9, "hybrid_semantic_weight": 0.1}
+
+    original = {key: getattr(index.config, key) for key in {**config_a, **config_b}}
+
+    comparison = evaluator.run_ab_comparison(tests, config_a, config_b)
+
+    for overrides, results in ((config_a, comparison["results_a"]), (config_b, comparison["results_b"])):
+        evaluator._apply_config(overrides)
+        expected = evaluator.run_tests(tests)
+        evaluator._apply_config(original)
+        assert [[r["url"] for r in res.retrieved_results] for res in results] == [
+            [r["url"] for r in res.retrieved_results] for res in expected
+        ]
+    assert comparison["embed_time"] >= 0
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_save_and_load_test_cases_round_trip(tmp_path, monkeypatch, use_orjson):
+    """Test cases should survive a save/load round trip with or without orjson."""
+    from llm_tools_server.eval import load_test_cases, rag_test_builder, save_test_cases
+
+    if use_orjson and not rag_test_builder.HAS_ORJSON:
+        pytest.skip("orjson not installed")
+    monkeypatch.setattr(rag_test_builder, "HAS_ORJSON", use_orjson)
+
+    tests = [
+        RAGTestCase(
+            query="configuración de autenticación",
+            description="Non-ASCII query",
+            relevant_urls=["https://docs.example.com/auth"],
+            top_k=3,
+            metadata={"category": "auth"},
+        ),
+        RAGTestCase(query="rate limits", description="Keywords only", relevant_keywords=["quota"]),
+    ]
+    path = tmp_path / "cases.json"
+
+    save_test_cases(tests, path)
+    loaded = load_test_cases(path)
+
+    assert loaded == tests
+
+
+@pytest.mark.unit
+def test_inspect_search_results_soa_matches_dict_api(capsys):
+    """The SoA results should line up with the per-result dicts from inspect_search_results()."""
+    import numpy as np
+
+    from llm_tools_server.eval import inspect_search_results, inspect_search_results_soa
+
+    index = Mock()
+    index.search.return_value = [
+        {"url": "https://example.com/a", "score": 0.9, "text": "x" * 250, "heading_path": ["Guide", "Setup"]},
+        {"url": "https://example.com/b", "score": 0.5, "text": "short", "heading_path": ["Guide", "Usage"]},
+    ]
+
+    soa = inspect_search_results_soa(index, "setup", top_k=2)
+    dicts = inspect_search_results(index, "setup", top_k=2)
+
+    assert len(soa) == 2
+    assert soa.scores.dtype == np.float64
+    assert list(soa.urls[np.isin(soa.urls, ["https://example.com/b"])]) == ["https://example.com/b"]
+    assert soa.headings[0] == ["Guide", "Setup"]
+    assert dicts == soa.to_dicts()
+    assert dicts[0] == {
+        "rank": 1,
+        "url": "https://example.com/a",
+        "score": 0.9,
+        "heading": ["Guide", "Setup"],
+        "text_preview": "x" * 200 + "...",
+    }
+    assert "Heading: ['Guide', 'Setup']" in capsys.readouterr().out
+
+
+@pytest.mark.unit
+def test_compute_metrics_exact_and_flexible_url_matches():
+    """Exact URL hits use the set fast path; substring matches still count as relevant."""
+    base = "https://developer.example.com/vault/docs/"
+    case = RAGTestCase(
+        query="q",
+        description="d",
+        relevant_urls=[base + "auth", base + "secrets/kv"],
+    )
+    other = RAGTestCase(query="q2", description="d2", relevant_urls=["".join([base, "auth"])])
+    assert other.relevant_urls[0] is case.relevant_urls[0]
+
+    evaluator = RAGEvaluator(Mock())
+    metrics = evaluator._compute_metrics(
+        case,
+        [base + "auth", "https://other.example.com/", base + "secrets/kv#versions"],
+        ["", "", ""],
+    )
+
+    assert metrics["num_relevant_found"] == 2
+    assert metrics["recall"] == 1.0
+    assert metrics["mrr"] == 1.0
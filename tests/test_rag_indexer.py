@@ -1,5 +1,6 @@
 """Unit tests for DocSearchIndex lightweight behaviors."""
 
+import json
 from datetime import datetime, timedelta
 from pathlib import Path
 
@@ -169,3 +170,529 @@ def test_refresh_with_all_cached_pages_does_not_duplicate_chunks(tmp_path: Path,
     # Should NOT have duplicated chunks - should still be 1
     assert len(index.chunks) == 1, f"Expected 1 chunk, got {len(index.chunks)} - chunks were duplicated!"
     assert index.chunks[0].metadata["chunk_id"] == "chunk-1"
+
+
+@pytest.mark.unit
+def test_search_batch_matches_per_query_search(tmp_path: Path):
+    """search_batch() should return the same results as calling search() per query."""
+    from langchain_community.retrievers import BM25Retriever
+    from langchain_community.vectorstores import FAISS
+    from langchain_core.embeddings import DeterministicFakeEmbedding
+
+    config = RAGConfig(base_url="https://example.com", cache_dir=tmp_path, rerank_enabled=False, search_top_k=3)
+    index = DocSearchIndex(config)
+    index.chunks = [
+        Document(
+            page_content=f"page {i} about {topic}",
+            metadata={"chunk_id": f"chunk-{i}", "url": f"https://example.com/{topic}/{i}"},
+        )
+        for i, topic in enumerate(["vault", "consul", "nomad", "terraform", "packer", "vault", "consul"])
+    ]
+    index.embeddings = DeterministicFakeEmbedding(size=16)
+    index.vectorstore = FAISS.from_documents(index.chunks, index.embeddings)
+    index.bm25_retriever = BM25Retriever.from_documents(
+        index.chunks, k=config.search_top_k * config.retriever_candidate_multiplier
+    )
+    index._rebuild_ensemble()
+
+    queries = ["vault secrets", "consul service mesh", "nomad jobs"]
+    batched = index.search_batch(queries, top_k=2)
+
+    assert len(batched) == len(queries)
+    for query, results in zip(queries, batched):
+        assert [r["url"] for r in results] == [r["url"] for r in index.search(query, top_k=2)]
+
+    # Candidate counts stay those the retrievers were built with, even after the config changes
+    config.search_top_k = 1
+    for query, results in zip(queries, index.search_batch(queries, top_k=len(index.chunks))):
+        assert [r["url"] for r in results] == [r["url"] for r in index.search(query, top_k=len(index.chunks))]
+
+    # A docstore miss raises like LangChain's FAISS search instead of fusing the "not found" string
+    index.vectorstore.docstore._dict.clear()
+    with pytest.raises(ValueError, match="Could not find document"):
+        index.search_batch(queries[:1])
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("write_orjson,read_orjson", [(True, True), (False, True), (True, False), (False, False)])
+def test_chunk_cache_round_trip(tmp_path: Path, monkeypatch, write_orjson, read_orjson):
+    """chunks.json written with either encoder must load with either decoder."""
+    from llm_tools_server.rag import indexer as indexer_module
+
+    if (write_orjson or read_orjson) and not indexer_module.HAS_ORJSON:
+        pytest.skip("orjson not installed")
+
+    config = RAGConfig(base_url="https://example.com", cache_dir=tmp_path)
+    index = DocSearchIndex(config)
+    index.chunks = [
+        Document(
+            page_content="Vault — secrets ✓",
+            metadata={"chunk_id": "c1", "url": "https://example.com/vault", "heading_path": ["A", "B"], "tokens": 7},
+        )
+    ]
+
+    monkeypatch.setattr(indexer_module, "HAS_ORJSON", write_orjson)
+    index._save_chunks()
+    monkeypatch.setattr(indexer_module, "HAS_ORJSON", read_orjson)
+    loaded = index._load_chunks()
+
+    assert [(c.page_content, c.metadata) for c in loaded] == [(c.page_content, c.metadata) for c in index.chunks]
+
+
+@pytest.mark.unit
+def test_int8_embedding_dtype_quantizes_faiss_index(tmp_path: Path):
+    """embedding_dtype='int8' should swap in a scalar-quantized index with matching search results."""
+    import faiss
+    from langchain_core.embeddings import DeterministicFakeEmbedding
+
+    docs = [Document(page_content=f"doc {i}", metadata={"chunk_id": f"c{i}"}) for i in range(20)]
+    embeddings = DeterministicFakeEmbedding(size=32)
+
+    index = DocSearchIndex(RAGConfig(base_url="https://example.com", cache_dir=tmp_path, embedding_dtype="int8"))
+    index.embeddings = embeddings
+    vectorstore = index._build_faiss_with_progress(docs, batch_size=8)
+
+    assert isinstance(vectorstore.index, faiss.IndexScalarQuantizer)
+    assert vectorstore.index.ntotal == len(docs)
+    for doc in docs[:5]:
+        assert vectorstore.similarity_search(doc.page_content, k=1)[0].page_content == doc.page_content
+
+    with pytest.raises(ValueError, match="embedding_dtype"):
+        RAGConfig(base_url="https://example.com", embedding_dtype="float16")
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("embedding_dtype", ["float32", "int8"])
+def test_hnsw_faiss_index_type(tmp_path: Path, embedding_dtype):
+    """faiss_index_type='hnsw' should build an HNSW index that survives save/load."""
+    import faiss
+    from langchain_community.vectorstores import FAISS
+    from langchain_core.embeddings import DeterministicFakeEmbedding
+
+    docs = [Document(page_content=f"doc {i}", metadata={"chunk_id": f"c{i}"}) for i in range(50)]
+    embeddings = DeterministicFakeEmbedding(size=32)
+    config = RAGConfig(
+        base_url="https://example.com", cache_dir=tmp_path, faiss_index_type="hnsw", embedding_dtype=embedding_dtype
+    )
+
+    index = DocSearchIndex(config)
+    index.embeddings = embeddings
+    vectorstore = index._build_faiss_with_progress(docs)
+
+    expected_type = faiss.IndexHNSWSQ if embedding_dtype == "int8" else faiss.IndexHNSWFlat
+    assert isinstance(vectorstore.index, expected_type)
+    assert vectorstore.index.ntotal == len(docs)
+    for doc in docs[:5]:
+        assert vectorstore.similarity_search(doc.page_content, k=1)[0].page_content == doc.page_content
+
+    vectorstore.save_local(str(tmp_path / "faiss_index"))
+    loaded = FAISS.load_local(str(tmp_path / "faiss_index"), embeddings, allow_dangerous_deserialization=True)
+    assert index._index_matches_config(loaded.index)
+    assert loaded.index.hnsw.efSearch == 64
+
+    flat = DocSearchIndex(
+        RAGConfig(base_url="https://example.com", cache_dir=tmp_path, embedding_dtype=embedding_dtype)
+    )
+    assert not flat._index_matches_config(loaded.index)
+    with pytest.raises(ValueError, match="faiss_index_type"):
+        RAGConfig(base_url="https://example.com", faiss_index_type="ivfpq")
+
+
+@pytest.mark.unit
+def test_build_faiss_embeds_in_batches(tmp_path: Path):
+    """The FAISS index is built from batched embed_documents() calls and matches from_documents()."""
+    import numpy as np
+    from langchain_community.vectorstores import FAISS
+    from langchain_core.embeddings import DeterministicFakeEmbedding
+
+    docs = [Document(page_content=f"doc {i}", metadata={"chunk_id": f"c{i}"}) for i in range(10)]
+    embeddings = DeterministicFakeEmbedding(size=16)
+    batch_sizes = []
+    embed_documents = embeddings.embed_documents
+
+    def counting_embed(texts):
+        batch_sizes.append(len(texts))
+        return embed_documents(texts)
+
+    object.__setattr__(embeddings, "embed_documents", counting_embed)
+
+    index = DocSearchIndex(RAGConfig(base_url="https://example.com", cache_dir=tmp_path, embedding_batch_size=4))
+    index.embeddings = embeddings
+    vectorstore = index._build_faiss_with_progress(docs)
+    expected = FAISS.from_documents(docs, DeterministicFakeEmbedding(size=16))
+
+    assert batch_sizes == [4, 4, 2]
+    assert np.array_equal(vectorstore.index.reconstruct_n(0, 10), expected.index.reconstruct_n(0, 10))
+    assert [vectorstore.docstore.search(i).metadata for i in vectorstore.index_to_docstore_id.values()] == [
+        doc.metadata for doc in docs
+    ]
+
+    with pytest.raises(ValueError, match="embedding_batch_size"):
+        RAGConfig(base_url="https://example.com", embedding_batch_size=0)
+
+
+@pytest.mark.unit
+def test_rerank_top_k_selection_matches_full_sort(tmp_path: Path):
+    """Partial top-k selection after re-ranking must match a full stable sort, ties included."""
+    from unittest.mock import Mock
+
+    index = DocSearchIndex(RAGConfig(base_url="https://example.com", cache_dir=tmp_path))
+    index.cross_encoder = Mock()
+    index.cross_encoder.predict.side_effect = lambda pairs: [float(len(text) % 4) for _, text in pairs]
+
+    def make_results():
+        return [{"text": "x" * n, "url": f"https://example.com/{n}", "score": 0.0} for n in range(12)]
+
+    full = index._rerank_results("query", make_results())
+    for k in (1, 3, 5, 12, 20):
+        assert [r["url"] for r in index._rerank_results("query", make_results(), top_k=k)] == [
+            r["url"] for r in full[:k]
+        ]
+
+
+@pytest.mark.unit
+def test_load_index_loads_models_in_background(tmp_path: Path, monkeypatch):
+    """load_index() should initialize models off the main thread while it reads the cache."""
+    import threading
+
+    from langchain_core.embeddings import DeterministicFakeEmbedding
+
+    config = RAGConfig(base_url="https://example.com", cache_dir=tmp_path, rerank_enabled=False)
+    writer = DocSearchIndex(config)
+    writer.chunks = [
+        Document(page_content=f"page {i}", metadata={"chunk_id": f"c{i}", "url": f"https://example.com/{i}"})
+        for i in range(3)
+    ]
+    writer._save_chunks()
+
+    index = DocSearchIndex(config)
+    init_threads = []
+
+    def fake_initialize_components():
+        init_threads.append(threading.current_thread().name)
+        if index.embeddings is None:
+            index.embeddings = DeterministicFakeEmbedding(size=8)
+
+    monkeypatch.setattr(index, "_initialize_components", fake_initialize_components)
+    index.load_index()
+
+    assert init_threads[0].startswith("rag-model-load")
+    assert len(init_threads) == 1
+    assert index.vectorstore.index.ntotal == 3
+    assert index.ensemble_retriever is not None
+
+
+@pytest.mark.unit
+def test_load_index_joins_background_model_load_without_chunks(tmp_path: Path, monkeypatch):
+    """An empty chunk cache still joins the background model load, surfacing its errors."""
+    config = RAGConfig(base_url="https://example.com", cache_dir=tmp_path, rerank_enabled=False)
+    index = DocSearchIndex(config)
+    index.chunks_file.write_text("[]")
+
+    def failing_initialize_components():
+        raise RuntimeError("model download failed")
+
+    monkeypatch.setattr(index, "_initialize_components", failing_initialize_components)
+    with pytest.raises(RuntimeError, match="model download failed"):
+        index.load_index()
+
+
+@pytest.mark.unit
+def test_expired_cached_page_is_revalidated_with_conditional_get(tmp_path: Path, monkeypatch):
+    """An expired cache entry sends its validators; a 304 reuses the cached content and restarts the TTL."""
+    config = RAGConfig(base_url="https://example.com", cache_dir=tmp_path, page_cache_ttl_hours=1)
+    index = DocSearchIndex(config)
+    url = "https://example.com/page"
+
+    calls = []
+    responses = [
+        (url, "<html><body><main><p>fresh</p></main></body></html>", 200, {"etag": '"v1"'}),
+        (url, "", 304, {"etag": '"v1"'}),
+    ]
+
+    def fake_fetch(page_url, etag=None, last_modified=None):
+        calls.append((etag, last_modified))
+        return responses[len(calls) - 1]
+
+    monkeypatch.setattr(index.crawler, "fetch_page_conditional", fake_fetch)
+    monkeypatch.setattr(index, "_extract_main_content", lambda html, page_url: html)
+
+    first = index._fetch_page_with_cache({"url": url})
+    assert first["from_cache"] is False
+    assert index._read_cached_page(url)["validators"] == {"etag": '"v1"'}
+
+    # Age the entry past its TTL so the next fetch goes to the network
+    cache_path = index._get_page_cache_path(url)
+    cached = index._read_cached_page(url)
+    cached["cached_at"] = (datetime.now() - timedelta(hours=2)).isoformat()
+    cache_path.write_text(json.dumps(cached))
+
+    second = index._fetch_page_with_cache({"url": url})
+    assert calls == [(None, None), ('"v1"', None)]
+    assert second["from_cache"] is True
+    assert second["status_code"] == 304
+    assert second["html"] == first["html"]
+    assert index._load_cached_page(url, None) is not None  # TTL restarted
+
+
+@pytest.mark.unit
+def test_faiss_mmap_load_and_update(tmp_path: Path):
+    """faiss_mmap=True maps the saved index, copies it into RAM before adding, and saves in place."""
+    from langchain_core.embeddings import DeterministicFakeEmbedding
+
+    docs = [Document(page_content=f"doc {i}", metadata={"chunk_id": f"c{i}"}) for i in range(20)]
+    embeddings = DeterministicFakeEmbedding(size=16)
+    config = RAGConfig(base_url="https://example.com", cache_dir=tmp_path, faiss_mmap=True)
+    faiss_path = str(tmp_path / "faiss_index")
+
+    index = DocSearchIndex(config)
+    index.embeddings = embeddings
+    index.vectorstore = index._build_faiss_with_progress(docs)
+    index._save_vectorstore(faiss_path)
+    assert not Path(f"{faiss_path}.tmp").exists()
+
+    index._verify_faiss_checksum(faiss_path)
+    index.vectorstore = index._load_faiss_vectorstore(faiss_path)
+    assert index._faiss_mmapped
+    assert index.vectorstore.similarity_search("doc 3", k=1)[0].page_content == "doc 3"
+
+    index._materialize_faiss_index()
+    assert not index._faiss_mmapped
+    index.vectorstore.add_documents([Document(page_content="doc new", metadata={"chunk_id": "new"})])
+    index._save_vectorstore(faiss_path)
+
+    index._verify_faiss_checksum(faiss_path)
+    reloaded = index._load_faiss_vectorstore(faiss_path)
+    assert reloaded.index.ntotal == len(docs) + 1
+    assert reloaded.similarity_search("doc new", k=1)[0].page_content == "doc new"
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "config_kwargs,rebuilds",
+    [({"faiss_mmap": True}, False), ({"faiss_index_type": "hnsw"}, True), ({"embedding_dtype": "int8"}, True)],
+)
+def test_update_index_incremental_respects_index_config(tmp_path: Path, monkeypatch, config_kwargs, rebuilds):
+    """Incremental updates load like load_index() and rebuild an index that no longer matches the config."""
+    from langchain_core.embeddings import DeterministicFakeEmbedding
+
+    docs = [Document(page_content=f"doc {i}", metadata={"chunk_id": f"c{i}"}) for i in range(20)]
+    embeddings = DeterministicFakeEmbedding(size=16)
+    built = DocSearchIndex(RAGConfig(base_url="https://example.com", cache_dir=tmp_path))
+    built.embeddings = embeddings
+    built.vectorstore = built._build_faiss_with_progress(docs)
+    built._save_vectorstore(str(built.index_dir / "faiss_index"))
+    built._save_metadata({"num_chunks": len(docs)})
+
+    index = DocSearchIndex(RAGConfig(base_url="https://example.com", cache_dir=tmp_path, **config_kwargs))
+    index.chunks = [*docs, Document(page_content="doc new", metadata={"chunk_id": "new"})]
+    full_builds = []
+    monkeypatch.setattr(index, "_initialize_components", lambda: setattr(index, "embeddings", embeddings))
+    monkeypatch.setattr(index, "_build_index", lambda: full_builds.append(True))
+
+    index._update_index_incremental()
+
+    assert bool(full_builds) == rebuilds
+    if not rebuilds:
+        assert not index._faiss_mmapped
+        assert index.vectorstore.index.ntotal == len(index.chunks)
+        assert index.vectorstore.similarity_search("doc new", k=1)[0].page_content == "doc new"
+
+
+@pytest.mark.unit
+def test_max_workers_defaults_to_cpu_scaled(monkeypatch):
+    """Unset max_workers resolves to 8 fetch threads per CPU, capped at 32."""
+    monkeypatch.setattr("llm_tools_server.rag.config.os.cpu_count", lambda: 2)
+    assert RAGConfig(base_url="https://example.com").max_workers == 16
+    monkeypatch.setattr("llm_tools_server.rag.config.os.cpu_count", lambda: 64)
+    assert RAGConfig(base_url="https://example.com").max_workers == 32
+    assert RAGConfig(base_url="https://example.com", max_workers=5).max_workers == 5
+    with pytest.raises(ValueError, match="max_workers"):
+        RAGConfig(base_url="https://example.com", max_workers=0)
+
+
+@pytest.mark.unit
+def test_bm25_statistics_are_persisted_and_extended(tmp_path: Path, monkeypatch):
+    """BM25 statistics are reused from disk and only appended chunks are tokenized."""
+    from langchain_community.retrievers import BM25Retriever
+
+    docs = [
+        Document(page_content=f"alpha doc {i} " + "beta " * (i % 3), metadata={"chunk_id": f"c{i}"}) for i in range(8)
+    ]
+    added = [Document(page_content="gamma alpha new", metadata={"chunk_id": "n0"})]
+    index = DocSearchIndex(RAGConfig(base_url="https://example.com", cache_dir=tmp_path))
+
+    index._build_bm25_retriever(docs)
+    assert (index.index_dir / "bm25.pkl").exists()
+
+    import llm_tools_server.rag.indexer as indexer_module
+
+    tokenized = []
+    real_preprocess = indexer_module.default_preprocessing_func
+    monkeypatch.setattr(
+        indexer_module, "default_preprocessing_func", lambda t: tokenized.append(t) or real_preprocess(t)
+    )
+
+    retriever = index._build_bm25_retriever(docs)
+    assert tokenized == []
+    assert retriever.k == index.config.search_top_k * index.config.retriever_candidate_multiplier
+
+    extended = index._build_bm25_retriever(docs + added)
+    assert tokenized == ["gamma alpha new"]
+    expected = BM25Retriever.from_documents(docs + added).vectorizer
+    for query in (["alpha"], ["beta", "gamma"], ["doc", "3"]):
+        assert extended.vectorizer.get_scores(query) == pytest.approx(expected.get_scores(query))
+    assert extended.invoke("gamma")[0].page_content == "gamma alpha new"
+    assert extended.vectorizer.avgdl == pytest.approx(expected.avgdl)
+    assert index._load_bm25_state()["nd"]["alpha"] == len(docs) + 1
+
+    # A tombstone-filtered subset is not persisted over the full-corpus statistics
+    index.chunks = docs + added
+    index._tombstoned_chunk_ids = {"c0"}
+    index._rebuild_bm25()
+    assert index.bm25_retriever.vectorizer.corpus_size == len(docs)
+    assert index._load_bm25_state()["vectorizer"].corpus_size == len(docs) + 1
+
+    # A corrupted state file is ignored and rebuilt
+    (index.index_dir / "bm25.pkl").write_bytes(b"garbage")
+    assert index._load_bm25_state() is None
+    index._build_bm25_retriever(docs)
+    assert index._load_bm25_state()["vectorizer"].corpus_size == len(docs)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("write_orjson,read_orjson", [(True, False), (False, True)])
+def test_parent_chunks_round_trip_across_serializers(tmp_path: Path, monkeypatch, write_orjson, read_orjson):
+    """parent_chunks.json written with orjson reads with stdlib json and vice versa."""
+    import llm_tools_server.rag.indexer as indexer_module
+
+    if not indexer_module.HAS_ORJSON:
+        pytest.skip("orjson not installed")
+    parents = {"p1": {"content": "héllo ✓", "metadata": {"url": "https://example.com/a", "heading_path": ["A"]}}}
+    index = DocSearchIndex(RAGConfig(base_url="https://example.com", cache_dir=tmp_path))
+    index.parent_chunks = parents
+
+    monkeypatch.setattr(indexer_module, "HAS_ORJSON", write_orjson)
+    index._save_parent_chunks()
+    monkeypatch.setattr(indexer_module, "HAS_ORJSON", read_orjson)
+    assert index._load_parent_chunks() == parents
+
+
+@pytest.mark.unit
+def test_create_chunks_reuses_chunk_cache_for_unchanged_pages(tmp_path: Path, monkeypatch):
+    """Unchanged pages reuse cached chunker output; changed HTML or chunk settings re-chunk."""
+    import llm_tools_server.rag.indexer as indexer_module
+
+    chunked_urls = []
+    real_chunker = indexer_module.semantic_chunk_html
+
+    def counting_chunker(**kwargs):
+        chunked_urls.append(kwargs["url"])
+        return real_chunker(**kwargs)
+
+    monkeypatch.setattr(indexer_module, "semantic_chunk_html", counting_chunker)
+
+    body = "".join(f"<h2>Section {i}</h2><p>{'Some documentation text here. ' * 40}</p>" for i in range(3))
+    pages = [
+        {"url": "https://example.com/a", "html": f"<html><body><h1>A</h1>{body}</body></html>"},
+        {"url": "https://example.com/b", "html": f"<html><body><h1>B</h1>{body}</body></html>"},
+    ]
+
+    def chunk(config_kwargs=None, page_list=pages):
+        index = DocSearchIndex(RAGConfig(base_url="https://example.com", cache_dir=tmp_path, **(config_kwargs or {})))
+        index._create_chunks(page_list, full_rebuild=True)
+        return index
+
+    first = chunk()
+    assert chunked_urls == ["https://example.com/a", "https://example.com/b"]
+    assert first.chunk_cache_file.exists()
+
+    chunked_urls.clear()
+    second = chunk()
+    assert chunked_urls == []
+    assert [(c.page_content, c.metadata) for c in second.chunks] == [(c.page_content, c.metadata) for c in first.chunks]
+    assert second.parent_chunks == first.parent_chunks
+
+    changed = [pages[0], {**pages[1], "html": pages[1]["html"].replace("<h1>B</h1>", "<h1>B2</h1>")}]
+    chunk(page_list=changed)
+    assert chunked_urls == ["https://example.com/b"]
+
+    chunked_urls.clear()
+    chunk({"child_chunk_size": 200})
+    assert chunked_urls == ["https://example.com/a", "https://example.com/b"]
+
+
+@pytest.mark.unit
+def test_create_chunks_prunes_chunk_cache_on_full_rebuild(tmp_path: Path):
+    """Full rebuilds drop cache entries for vanished URLs; small incremental batches bypass the cache."""
+    body = "".join(f"<h2>Section {i}</h2><p>{'Some documentation text here. ' * 40}</p>" for i in range(3))
+
+    def page(name):
+        return {"url": f"https://example.com/{name}", "html": f"<html><body><h1>{name}</h1>{body}</body></html>"}
+
+    def chunk(page_list, full_rebuild):
+        index = DocSearchIndex(RAGConfig(base_url="https://example.com", cache_dir=tmp_path))
+        index._create_chunks(page_list, full_rebuild=full_rebuild)
+        return index
+
+    index = chunk([page("a"), page("b")], full_rebuild=True)
+    assert index._load_chunk_cache().keys() == {"https://example.com/a", "https://example.com/b"}
+
+    cache_bytes = index.chunk_cache_file.read_bytes()
+    chunk([page("c")], full_rebuild=False)
+    assert index.chunk_cache_file.read_bytes() == cache_bytes
+
+    chunk([page("a")], full_rebuild=True)
+    assert index._load_chunk_cache().keys() == {"https://example.com/a"}
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "cuda,embedding_fp16,expect_fp16", [(True, True, True), (True, False, False), (False, True, False)]
+)
+def test_initialize_components_uses_fp16_on_cuda(tmp_path: Path, monkeypatch, cuda, embedding_fp16, expect_fp16):
+    """Models load in float16 only on CUDA with embedding_fp16 enabled."""
+    from unittest.mock import MagicMock
+
+    import torch
+
+    import llm_tools_server.rag.indexer as indexer_module
+
+    embeddings_cls = MagicMock()
+    cross_encoder_cls = MagicMock()
+    monkeypatch.setattr(indexer_module, "HuggingFaceEmbeddings", embeddings_cls)
+    monkeypatch.setattr(indexer_module, "CrossEncoder", cross_encoder_cls)
+    monkeypatch.setattr(torch.backends.mps, "is_available", lambda: False)
+    monkeypatch.setattr(torch.cuda, "is_available", lambda: cuda)
+
+    index = DocSearchIndex(RAGConfig(base_url="https://example.com", cache_dir=tmp_path, embedding_fp16=embedding_fp16))
+    index._initialize_components()
+
+    model_kwargs = embeddings_cls.call_args.kwargs["model_kwargs"]
+    device = "cuda" if cuda else "cpu"
+    assert model_kwargs["device"] == device
+    assert ("model_kwargs" in model_kwargs) is expect_fp16
+    assert cross_encoder_cls.call_args.kwargs["device"] == device
+    assert cross_encoder_cls.return_value.model.half.called is expect_fp16
+
+
+@pytest.mark.unit
+def test_faiss_mmap_falls_back_without_mmap_flag(tmp_path: Path, monkeypatch, caplog):
+    """faiss builds without IO_FLAG_MMAP_IFC load the index normally instead of failing the load."""
+    import faiss
+    from langchain_core.embeddings import DeterministicFakeEmbedding
+
+    docs = [Document(page_content=f"doc {i}", metadata={"chunk_id": f"c{i}"}) for i in range(5)]
+    index = DocSearchIndex(RAGConfig(base_url="https://example.com", cache_dir=tmp_path, faiss_mmap=True))
+    index.embeddings = DeterministicFakeEmbedding(size=16)
+    index.vectorstore = index._build_faiss_with_progress(docs)
+    faiss_path = str(tmp_path / "faiss_index")
+    index._save_vectorstore(faiss_path)
+
+    monkeypatch.delattr(faiss, "IO_FLAG_MMAP_IFC")
+    with caplog.at_level("WARNING"):
+        loaded = index._load_faiss_vectorstore(faiss_path)
+
+    assert not index._faiss_mmapped
+    assert loaded.index.ntotal == len(docs)
+    assert "IO_FLAG_MMAP_IFC" in caplog.text
@@ -142,6 +142,22 @@ class TestLLMServer:
         prompt3 = server.get_system_prompt()
         assert prompt3 == "Updated prompt"
 
+    def test_detects_malformed_tool_tokens(self, default_config, sample_tools):
+        """Test detection of raw function-calling tokens leaked into content."""
+        server = LLMServer(
+            name="TestServer",
+            model_name="test/model",
+            tools=sample_tools,
+            config=default_config,
+        )
+
+        leaked = "<|start|>assistant<|channel|>commentary to=functions.web_search <|constrain|>json<|message|>{}"
+        assert server._contains_malformed_tool_tokens(leaked) is True
+        assert server._contains_malformed_tool_tokens("<|start|>user\nhi<|message|>") is True
+        assert server._contains_malformed_tool_tokens("call to=functions.lookup now") is True
+        assert server._contains_malformed_tool_tokens("A normal answer about functions.") is False
+        assert server._contains_malformed_tool_tokens("") is False
+
     def test_chat_completion_tool_call_flow(self, default_config, sample_tools, monkeypatch):
         """Process tool calls then return final assistant message."""
         server = LLMServer(